@@ -0,0 +1,164 @@
+"""Ad analysis throughput at increasing concurrency against a fake Gemini.
+
+Needs no database, ffmpeg or Gemini key; sampling and Gemini latencies are
+injected so the overlap between them is what gets measured:
+
+    PYTHONPATH=src python scripts/bench_ad_analysis_concurrency.py \
+        --captures 40 --gemini-latency 0.5 --sample-latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.api.modules.emulation.models import AnalysisStatus, VideoStatus
+from app.services.emulation.ads.analysis.limiter import AnalysisConcurrencyLimiter
+from app.services.emulation.ads.analysis.service import AdAnalysisService
+from app.settings import AdAnalysisConfig
+
+_VERDICT = json.dumps({"result": "not_relevant", "reason": "bench"})
+
+
+class _FakeGemini:
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    async def generate_from_video(self, video_path: Path, prompt: str) -> str:
+        await asyncio.sleep(self._latency)
+        return _VERDICT
+
+    async def generate_from_text(self, prompt: str) -> str:
+        await asyncio.sleep(self._latency)
+        return _VERDICT
+
+
+@dataclass
+class _PreparedVideo:
+    path: Path
+    sampled: bool = False
+    duration_seconds: float | None = None
+
+    async def cleanup(self) -> None:
+        return None
+
+
+class _FakeSampler:
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    async def prepare(self, video_path: Path) -> _PreparedVideo:
+        # ffmpeg runs as a subprocess; a worker thread stands in for it.
+        await asyncio.to_thread(time.sleep, self._latency)
+        return _PreparedVideo(path=video_path)
+
+
+class _FakeStorage:
+    async def remove_capture_dir(self, rel_dir: str) -> None:
+        return None
+
+
+class _FakeCaptureGateway:
+    def __init__(self, captures: list[SimpleNamespace]) -> None:
+        self._captures = captures
+
+    async def get_pending_analysis(self, session_id: str) -> list[SimpleNamespace]:
+        return list(self._captures)
+
+    async def count_video_file_refs(self, video_files: list[str]) -> dict[str, int]:
+        return dict.fromkeys(video_files, 1)
+
+    async def update_analysis_many(self, results: list[tuple]) -> None:
+        return None
+
+    # The verdict cache stays empty so every capture reaches Gemini.
+    async def get_cached_verdicts(self, content_hashes: list[str], prompt_version: str) -> dict:
+        return {}
+
+    async def add_cached_verdicts(self, rows: list[dict[str, object]]) -> None:
+        return None
+
+    async def update_video_fingerprints(self, rows: list[tuple]) -> None:
+        return None
+
+
+class _FakeUnitOfWork:
+    def __init__(self, captures: list[SimpleNamespace]) -> None:
+        self.ad_captures = _FakeCaptureGateway(captures)
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+
+def _captures(base_path: Path, count: int) -> list[SimpleNamespace]:
+    captures = []
+    for position in range(1, count + 1):
+        video_file = f"capture_{position}/ad.mp4"
+        (base_path / video_file).parent.mkdir(parents=True, exist_ok=True)
+        (base_path / video_file).write_bytes(position.to_bytes(4, "big") * 256)
+        captures.append(
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                ad_position=position,
+                video_file=video_file,
+                video_status=VideoStatus.COMPLETED,
+                analysis_status=AnalysisStatus.PENDING,
+                headline_text="Bench headline",
+                advertiser_domain="bench.example",
+                display_url="bench.example",
+                landing_url=None,
+                cta_href=None,
+            )
+        )
+    return captures
+
+
+async def _run(args: argparse.Namespace, base_path: Path, concurrency: int) -> float:
+    captures = _captures(base_path, args.captures)
+    service = AdAnalysisService(
+        _FakeGemini(args.gemini_latency),
+        _FakeUnitOfWork(captures),
+        base_path,
+        _FakeStorage(),
+        _FakeSampler(args.sample_latency),
+        AdAnalysisConfig(max_concurrency=concurrency),
+        AnalysisConcurrencyLimiter(concurrency),
+    )
+    started = time.perf_counter()
+    await service.analyze_session_captures("bench")
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captures", type=int, default=40)
+    parser.add_argument("--gemini-latency", type=float, default=0.5)
+    parser.add_argument("--sample-latency", type=float, default=0.1)
+    parser.add_argument("--concurrency", default="1,2,4,8,16")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = Path(tmp)
+        baseline = None
+        print(f"{'limit':>5} {'seconds':>8} {'captures/s':>11} {'speedup':>8}")
+        for concurrency in (int(value) for value in args.concurrency.split(",")):
+            elapsed = await _run(args, base_path, concurrency)
+            baseline = baseline or elapsed
+            print(
+                f"{concurrency:>5} {elapsed:>8.2f} {args.captures / elapsed:>11.2f} "
+                f"{baseline / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
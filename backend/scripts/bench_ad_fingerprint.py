@@ -0,0 +1,154 @@
+"""Fingerprinting cost and near-duplicate precision/recall.
+
+With a fixture directory, every subdirectory is one creative and holds its
+captures (re-encodes, trims, other resolutions); videos are fingerprinted
+with ffmpeg and every pair is scored:
+
+    PYTHONPATH=src python scripts/bench_ad_fingerprint.py --fixtures ./fixtures
+
+Without one, synthetic frame sequences with brightness, noise and trim
+perturbations stand in for the captures, which needs no ffmpeg:
+
+    PYTHONPATH=src python scripts/bench_ad_fingerprint.py --creatives 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import random
+import resource
+import time
+from pathlib import Path
+
+from app.services.emulation.ads.analysis.fingerprint import (
+    VideoFingerprint,
+    VideoFingerprinter,
+)
+
+_VIDEO_SUFFIXES = {".mp4", ".webm", ".mkv", ".mov"}
+_FRAME_SIZE = 9 * 8
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+async def _fixture_fingerprints(root: Path) -> list[tuple[str, VideoFingerprint]]:
+    fingerprinter = VideoFingerprinter()
+    videos = [
+        (group.name, path)
+        for group in sorted(p for p in root.iterdir() if p.is_dir())
+        for path in sorted(group.rglob("*"))
+        if path.suffix.lower() in _VIDEO_SUFFIXES
+    ]
+    results = []
+    for group, path in videos:
+        fingerprint = await fingerprinter.fingerprint(path)
+        if fingerprint is None:
+            print(f"skipped {path}: no fingerprint")
+            continue
+        results.append((group, fingerprint))
+    return results
+
+
+def _synthetic_frames(rng: random.Random, length: int) -> list[bytes]:
+    # A slowly drifting base image with scene cuts, like a short ad.
+    frames = []
+    base = [rng.randrange(256) for _ in range(_FRAME_SIZE)]
+    for _ in range(length):
+        if rng.random() < 0.05:
+            base = [rng.randrange(256) for _ in range(_FRAME_SIZE)]
+        base = [min(255, max(0, value + rng.randint(-6, 6))) for value in base]
+        frames.append(bytes(base))
+    return frames
+
+
+def _perturb(rng: random.Random, frames: list[bytes]) -> list[bytes]:
+    shift = rng.randint(-30, 30)
+    noise = rng.randint(0, 12)
+    trim = rng.randint(0, len(frames) // 10)
+    kept = frames[trim : len(frames) - rng.randint(0, len(frames) // 10)]
+    return [
+        bytes(min(255, max(0, value + shift + rng.randint(-noise, noise))) for value in frame)
+        for frame in kept
+    ]
+
+
+def _synthetic_fingerprints(
+    creatives: int, variants: int, seed: int,
+) -> list[tuple[str, VideoFingerprint]]:
+    rng = random.Random(seed)
+    results = []
+    for creative in range(creatives):
+        frames = _synthetic_frames(rng, rng.randint(40, 160))
+        for _ in range(variants):
+            fingerprint = VideoFingerprint.from_frames(_perturb(rng, frames))
+            if fingerprint is not None:
+                results.append((f"creative_{creative}", fingerprint))
+    return results
+
+
+def _score(items: list[tuple[str, VideoFingerprint]], thresholds: list[float]) -> None:
+    pairs = [
+        (left[0] == right[0], left[1], right[1])
+        for left, right in itertools.combinations(
+            [item for item in items if item[1].informative], 2,
+        )
+    ]
+    positives = sum(1 for same, _, _ in pairs if same)
+    print(f"{len(items)} fingerprints, {len(pairs)} pairs, {positives} same-creative pairs")
+    print(f"{'max dist':>8} {'precision':>10} {'recall':>7} {'banded recall':>14}")
+    for threshold in thresholds:
+        tp = fp = banded = 0
+        for same, left, right in pairs:
+            if left.distance(right) > threshold:
+                continue
+            # Lookups only see candidates that share an indexed band.
+            shares_band = any(a == b for a, b in zip(left.bands, right.bands, strict=True))
+            if same:
+                tp += 1
+                banded += shares_band
+            else:
+                fp += 1
+        precision = tp / (tp + fp) if tp + fp else 1.0
+        recall = tp / positives if positives else 0.0
+        banded_recall = banded / positives if positives else 0.0
+        print(f"{threshold:>8.1f} {precision:>10.3f} {recall:>7.3f} {banded_recall:>14.3f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path)
+    parser.add_argument("--creatives", type=int, default=50)
+    parser.add_argument("--variants", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--thresholds", default="4,6,8,10,12,16")
+    args = parser.parse_args()
+
+    wall_started = time.perf_counter()
+    cpu_started = _cpu_seconds()
+    if args.fixtures:
+        items = await _fixture_fingerprints(args.fixtures)
+    else:
+        items = _synthetic_fingerprints(args.creatives, args.variants, args.seed)
+    wall = time.perf_counter() - wall_started
+    cpu = _cpu_seconds() - cpu_started
+    if not items:
+        print("no fingerprints")
+        return
+
+    # Synthetic timings include generating the frames, not an ffmpeg decode.
+    label = "fingerprinting" if args.fixtures else "synthetic generation + hashing"
+    print(
+        f"{label}: {wall / len(items) * 1000:.1f} ms wall, "
+        f"{cpu / len(items) * 1000:.1f} ms cpu per capture"
+    )
+    _score(items, [float(value) for value in args.thresholds.split(",")])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
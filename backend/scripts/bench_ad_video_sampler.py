@@ -0,0 +1,93 @@
+"""Wall time and CPU seconds per capture for the ad analysis video sampler.
+
+Runs every fixture video (webm/mp4 files, or directories of them) through
+AdAnalysisVideoSampler with re-encoding forced and with stream copy, each
+with a cold probe cache. Needs ffmpeg and ffprobe on PATH:
+
+    PYTHONPATH=src python scripts/bench_ad_video_sampler.py ./fixtures --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import resource
+import time
+from pathlib import Path
+
+from app.services.emulation.ads.analysis.sampler import AdAnalysisVideoSampler
+
+_VIDEO_SUFFIXES = {".mp4", ".webm", ".mkv", ".mov", ".avi"}
+
+
+def _cpu_seconds() -> float:
+    # ffmpeg and ffprobe run as children, which is where the work happens.
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _videos(paths: list[Path]) -> list[Path]:
+    videos = []
+    for path in paths:
+        candidates = sorted(path.rglob("*")) if path.is_dir() else [path]
+        videos.extend(p for p in candidates if p.suffix.lower() in _VIDEO_SUFFIXES)
+    return videos
+
+
+class _SubprocessCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        self._original = asyncio.create_subprocess_exec
+
+    async def __call__(self, *args, **kwargs):
+        self.count += 1
+        return await self._original(*args, **kwargs)
+
+
+async def _run(videos: list[Path], repeat: int, stream_copy: bool) -> None:
+    counter = _SubprocessCounter()
+    asyncio.create_subprocess_exec = counter
+    wall = cpu = 0.0
+    sampled = 0
+    try:
+        for _ in range(repeat):
+            sampler = AdAnalysisVideoSampler(stream_copy=stream_copy)
+            for video in videos:
+                wall_started = time.perf_counter()
+                cpu_started = _cpu_seconds()
+                prepared = await sampler.prepare(video)
+                wall += time.perf_counter() - wall_started
+                cpu += _cpu_seconds() - cpu_started
+                sampled += prepared.sampled
+                await prepared.cleanup()
+    finally:
+        asyncio.create_subprocess_exec = counter._original
+
+    runs = len(videos) * repeat
+    label = "stream copy" if stream_copy else "re-encode"
+    print(
+        f"{label:>12} {wall / runs:>9.3f} {cpu / runs:>9.3f} "
+        f"{counter.count / runs:>12.1f} {sampled:>4}/{runs}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", type=Path, nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    videos = _videos(args.fixtures)
+    if not videos:
+        print("no fixture videos")
+        return
+
+    print(f"{len(videos)} videos x {args.repeat}")
+    print(f"{'mode':>12} {'wall s':>9} {'cpu s':>9} {'subprocesses':>12} {'sampled':>9}")
+    await _run(videos, args.repeat, stream_copy=False)
+    await _run(videos, args.repeat, stream_copy=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
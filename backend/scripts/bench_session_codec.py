@@ -0,0 +1,151 @@
+"""Size and speed comparison of the session payload codec against plain JSON.
+
+Needs no Redis; payloads are synthetic but shaped like live session lists:
+
+    PYTHONPATH=src python scripts/bench_session_codec.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import time
+
+from app.services.emulation.session import codec
+
+# Rough live rates: a watch every ~3 minutes, an ad break every ~5 minutes.
+_VIDEOS_PER_HOUR = 20
+_ADS_PER_HOUR = 12
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(count)
+    )
+
+
+def _video(rng: random.Random, position: int) -> dict[str, object]:
+    return {
+        "position": position,
+        "action": rng.choice(["search_video", "watch_recommended", "watch_feed"]),
+        "title": _words(rng, 8).title(),
+        "url": f"https://www.youtube.com/watch?v={rng.randbytes(8).hex()[:11]}",
+        "watched_seconds": round(rng.uniform(30, 600), 2),
+        "target_seconds": round(rng.uniform(60, 600), 2),
+        "watch_ratio": round(rng.random(), 3),
+        "completed": rng.random() > 0.3,
+        "search_keyword": _words(rng, 2),
+        "matched_topics": [_words(rng, 2)],
+        "keywords": _words(rng, 6).split(),
+        "recorded_at": time.time(),
+    }
+
+
+def _ad(rng: random.Random, position: int) -> dict[str, object]:
+    visible_lines = [_words(rng, rng.randint(2, 8)) for _ in range(rng.randint(4, 12))]
+    text_samples = [
+        {
+            "t": round(rng.uniform(0, 30), 2),
+            "visible_lines": rng.sample(visible_lines, k=min(len(visible_lines), 4)),
+            "caption_lines": [_words(rng, 6)],
+        }
+        for _ in range(rng.randint(5, 20))
+    ]
+    domain = f"{_words(rng, 1)}.com"
+    return {
+        "position": position,
+        "started_at": time.time(),
+        "ended_at": time.time() + 30,
+        "watched_seconds": round(rng.uniform(5, 30), 2),
+        "completed": rng.random() > 0.5,
+        "cta_text": _words(rng, 2),
+        "cta_candidates": [_words(rng, 2) for _ in range(3)],
+        "cta_href": f"https://{domain}/{_words(rng, 1)}",
+        "advertiser_domain": domain,
+        "display_url": domain,
+        "landing_urls": [f"https://{domain}/landing?utm={rng.randbytes(6).hex()}"],
+        "headline_text": _words(rng, 6),
+        "description_text": _words(rng, 20),
+        "description_lines": [_words(rng, 8) for _ in range(3)],
+        "full_text": "\n".join(visible_lines),
+        "full_text_source": "visible_lines",
+        "full_visible_text": "\n".join(visible_lines),
+        "full_caption_text": _words(rng, 30),
+        "visible_lines": visible_lines,
+        "caption_lines": [_words(rng, 6) for _ in range(5)],
+        "text_samples": text_samples,
+        "end_reason": "ended",
+        "capture_id": rng.randbytes(8).hex(),
+        "capture": {
+            "video_status": "completed",
+            "video_file": f"ad_captures/{rng.randbytes(8).hex()}/ad.mp4",
+            "landing_status": "completed",
+            "landing_dir": f"ad_captures/{rng.randbytes(8).hex()}/landing",
+            "screenshot_paths": [
+                {"offset_ms": offset, "file_path": f"shot_{offset}.png"}
+                for offset in range(0, 30000, 2500)
+            ],
+            "analysis_status": "completed",
+            "analysis_summary": json.dumps({"category": _words(rng, 1), "notes": _words(rng, 40)}),
+        },
+        "recorded_at": time.time(),
+    }
+
+
+def _entries(hours: int, seed: int) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    videos = [_video(rng, index + 1) for index in range(_VIDEOS_PER_HOUR * hours)]
+    ads = [_ad(rng, index + 1) for index in range(_ADS_PER_HOUR * hours)]
+    return videos + ads
+
+
+def _measure(
+    entries: list[dict[str, object]],
+    encode,
+    decode,
+    repeats: int,
+) -> tuple[int, float, float]:
+    encoded = [encode(entry) for entry in entries]
+    size = sum(len(item) for item in encoded)
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        encoded = [encode(entry) for entry in entries]
+    encode_ms = (time.perf_counter() - started) * 1000 / repeats
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for item in encoded:
+            decode(item)
+    decode_ms = (time.perf_counter() - started) * 1000 / repeats
+    return size, encode_ms, decode_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"orjson={'yes' if codec.orjson is not None else 'no'}  zlib threshold={codec.COMPRESS_MIN_BYTES}B")
+    for hours in (1, 8):
+        entries = _entries(hours, args.seed)
+        baseline = _measure(
+            entries,
+            lambda entry: json.dumps(entry).encode(),
+            json.loads,
+            args.repeats,
+        )
+        packed = _measure(entries, codec.encode, codec.decode, args.repeats)
+        print(f"{hours}h payload ({len(entries)} list entries)")
+        for label, (size, encode_ms, decode_ms) in (("json", baseline), ("codec", packed)):
+            print(
+                f"  {label:<6} bytes={size:>10,}  encode={encode_ms:8.2f}ms  decode={decode_ms:8.2f}ms"
+            )
+        print(f"  size ratio {packed[0] / baseline[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Contention benchmark for the emulation session locks.
+
+Run against a disposable local Redis:
+
+    PYTHONPATH=src python scripts/bench_session_locks.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from contextvars import ContextVar
+
+from redis.asyncio import Redis
+
+from app.api.modules.emulation.models import SessionStatus
+from app.services.emulation.session.store import EmulationSessionStore
+
+# Counted per worker task so concurrent workers do not inflate each other.
+_round_trips: ContextVar[int] = ContextVar("round_trips", default=0)
+
+
+class CountingRedis(Redis):
+    async def execute_command(self, *args, **options):
+        _round_trips.set(_round_trips.get() + 1)
+        return await super().execute_command(*args, **options)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _report(label: str, latencies: list[float], round_trips: list[int]) -> None:
+    if not latencies:
+        print(f"{label:<24} no samples")
+        return
+    print(
+        f"{label:<24} n={len(latencies):<5} "
+        f"rtt/op={statistics.mean(round_trips):.2f} (max {max(round_trips)})  "
+        f"p50={_percentile(latencies, 0.50) * 1000:.2f}ms "
+        f"p95={_percentile(latencies, 0.95) * 1000:.2f}ms "
+        f"max={max(latencies) * 1000:.2f}ms"
+    )
+
+
+async def _worker(
+    store: EmulationSessionStore,
+    profile_ids: list[str],
+    iterations: int,
+    hold_seconds: float,
+    results: dict[str, tuple[list[float], list[int]]],
+) -> None:
+    for iteration in range(iterations):
+        session_id = uuid.uuid4().hex
+        profile_id = profile_ids[iteration % len(profile_ids)]
+        run_holder = f"{session_id}:{uuid.uuid4().hex}"
+        profile_holder = f"{run_holder}:profile"
+
+        await store.create(session_id, [], 1, profile_id=profile_id)
+        await store.update(session_id, status=SessionStatus.RUNNING)
+
+        before = _round_trips.get()
+        started = time.perf_counter()
+        await store.try_acquire_run_lock(session_id, run_holder, 60)
+        results["run acquire"][0].append(time.perf_counter() - started)
+        results["run acquire"][1].append(_round_trips.get() - before)
+
+        before = _round_trips.get()
+        started = time.perf_counter()
+        acquired = await store.try_acquire_profile_lock(profile_id, profile_holder, 60)
+        label = "profile acquire" if acquired else "profile busy"
+        results[label][0].append(time.perf_counter() - started)
+        results[label][1].append(_round_trips.get() - before)
+
+        if acquired:
+            await asyncio.sleep(hold_seconds)
+            before = _round_trips.get()
+            started = time.perf_counter()
+            await store.refresh_profile_lock(profile_id, profile_holder, 60)
+            results["profile refresh"][0].append(time.perf_counter() - started)
+            results["profile refresh"][1].append(_round_trips.get() - before)
+
+            before = _round_trips.get()
+            started = time.perf_counter()
+            await store.release_profile_lock(profile_id, profile_holder)
+            results["profile release"][0].append(time.perf_counter() - started)
+            results["profile release"][1].append(_round_trips.get() - before)
+
+        await store.release_run_lock(session_id, run_holder)
+        await store.delete(session_id)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--profiles", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--hold-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    redis = CountingRedis.from_url(args.redis_url)
+    store = EmulationSessionStore(redis)
+    profile_ids = [f"bench-{uuid.uuid4().hex[:8]}" for _ in range(args.profiles)]
+    results: dict[str, tuple[list[float], list[int]]] = {
+        label: ([], [])
+        for label in (
+            "run acquire",
+            "profile acquire",
+            "profile busy",
+            "profile refresh",
+            "profile release",
+        )
+    }
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                _worker(store, profile_ids, args.iterations, args.hold_ms / 1000, results)
+                for _ in range(args.workers)
+            )
+        )
+    finally:
+        await redis.aclose()
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{args.workers} workers x {args.iterations} iterations over "
+        f"{args.profiles} profiles in {elapsed:.2f}s"
+    )
+    for label, (latencies, round_trips) in results.items():
+        _report(label, latencies, round_trips)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
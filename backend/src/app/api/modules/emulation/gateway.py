@@ -2,18 +2,56 @@ from __future__ import annotations
 
 import datetime
 import uuid
-from collections import Counter
 from dataclasses import dataclass
 
-from sqlalchemy import Text, and_, cast, delete, exists, func, or_, select
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Date,
+    Integer,
+    Row,
+    String,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    select,
+    table,
+    text,
+    tuple_,
+    union,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .models import (
+    ANALYSIS_TERMINAL_STATUSES,
+    CAPTURE_SEARCH_CONFIG,
+    AdAnalysisVerdict,
     AdCapture,
     AdCaptureScreenshot,
+    AdCreative,
+    AdCreativeSighting,
     AnalysisStatus,
+    DashboardCaptureRollup,
+    DashboardRollupOpenDay,
+    DashboardSessionRollup,
+    DashboardTopicRollup,
+    EmulationSessionAd,
     EmulationSessionHistory,
+    EmulationSessionVideo,
+    LandingStatus,
     SessionStatus,
     VideoStatus,
 )
@@ -44,7 +82,23 @@ class EmulationHistoryQuery:
     finished_to: datetime.datetime | None = None
 
 
+def _contains_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+_PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+
+_WATCHED_ITEM_MODELS = (
+    (EmulationSessionVideo, "watched_videos"),
+    (EmulationSessionAd, "watched_ads"),
+)
+
+
 class EmulationHistoryGateway:
+    # Keeps each multi-row INSERT well below Postgres' bind parameter limit.
+    _INSERT_BATCH_ROWS = 1000
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -77,6 +131,21 @@ class EmulationHistoryGateway:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_session_ids(
+        self,
+        session_ids: list[str],
+    ) -> list[EmulationSessionHistory]:
+        if not session_ids:
+            return []
+
+        # One array parameter instead of an IN list keeps the statement shape stable.
+        stmt = select(EmulationSessionHistory).where(
+            EmulationSessionHistory.session_id
+            == any_(bindparam("session_ids", session_ids, type_=ARRAY(String)))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_statuses(
         self,
         statuses: list[str],
@@ -110,45 +179,143 @@ class EmulationHistoryGateway:
         await self.session.flush()
         return payload
 
+    async def update_sessions(self, fields_by_session: dict[str, dict[str, object]]) -> None:
+        for payload in await self.get_by_session_ids(list(fields_by_session)):
+            for field, value in fields_by_session[payload.session_id].items():
+                if hasattr(payload, field):
+                    setattr(payload, field, value)
+        await self.session.flush()
+
+    async def save_watched_items(
+        self,
+        items_by_session: dict[str, tuple[list[dict], list[dict]]],
+    ) -> None:
+        for slot, (model, _) in enumerate(_WATCHED_ITEM_MODELS):
+            rows = [
+                {"session_id": session_id, "item_index": index, "payload": item}
+                for session_id, items in items_by_session.items()
+                for index, item in enumerate(items[slot])
+                if isinstance(item, dict)
+            ]
+            for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+                stmt = insert(model).values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+                # Lists only grow, so most rows already exist unchanged and
+                # are skipped; an ad whose capture state moved on is rewritten.
+                stmt = stmt.on_conflict_do_update(
+                    constraint=f"{model.__tablename__}_session_id_item_index_ukey",
+                    set_={
+                        "payload": stmt.excluded.payload,
+                        "updated_at": func.current_timestamp(),
+                    },
+                    where=model.payload.is_distinct_from(stmt.excluded.payload),
+                )
+                await self.session.execute(stmt)
+
+    async def get_watched_videos(
+        self,
+        session_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict]:
+        return await self._get_watched_items(EmulationSessionVideo, session_id, offset, limit)
+
+    async def get_watched_ads(
+        self,
+        session_id: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict]:
+        return await self._get_watched_items(EmulationSessionAd, session_id, offset, limit)
+
+    async def count_watched_items(self, session_id: str) -> tuple[int, int]:
+        stmt = select(
+            *(
+                select(func.count())
+                .where(model.session_id == session_id)
+                .scalar_subquery()
+                for model, _ in _WATCHED_ITEM_MODELS
+            )
+        )
+        videos, ads = (await self.session.execute(stmt)).one()
+        return int(videos), int(ads)
+
+    async def load_watched_items(self, records: list[EmulationSessionHistory]) -> None:
+        # Sessions written before the child tables keep their JSONB lists. Rows
+        # are set as committed state so a later flush never writes them back.
+        if not records:
+            return
+
+        session_ids = [record.session_id for record in records]
+        for model, attribute in _WATCHED_ITEM_MODELS:
+            stmt = (
+                select(model.session_id, model.payload)
+                .where(
+                    model.session_id
+                    == any_(bindparam("session_ids", session_ids, type_=ARRAY(String)))
+                )
+                .order_by(model.session_id, model.item_index)
+            )
+            items_by_session: dict[str, list[dict]] = {}
+            for session_id, payload in (await self.session.execute(stmt)).tuples():
+                items_by_session.setdefault(session_id, []).append(payload)
+            for record in records:
+                items = items_by_session.get(record.session_id)
+                if items is not None:
+                    set_committed_value(record, attribute, items)
+
+    async def _get_watched_items(
+        self,
+        model: type[EmulationSessionVideo] | type[EmulationSessionAd],
+        session_id: str,
+        offset: int,
+        limit: int | None,
+    ) -> list[dict]:
+        stmt = (
+            select(model.payload)
+            .where(model.session_id == session_id)
+            .order_by(model.item_index)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_total_count(self, query: EmulationHistoryQuery) -> int:
         filters = self._build_filters(query)
         stmt = select(func.count()).select_from(EmulationSessionHistory).where(*filters)
         result = await self.session.execute(stmt)
         return int(result.scalar() or 0)
 
+    async def get_estimated_total_count(self, query: EmulationHistoryQuery) -> int | None:
+        # Planner statistics only describe the whole table.
+        if self._build_filters(query):
+            return None
+        stmt = select(_PG_CLASS.c.reltuples).where(
+            _PG_CLASS.c.oid == func.to_regclass(EmulationSessionHistory.__tablename__)
+        )
+        estimate = (await self.session.execute(stmt)).scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        return int(estimate) if estimate is not None and estimate >= 0 else None
+
     async def get_history(
         self,
         query: EmulationHistoryQuery,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        after: tuple[datetime.datetime, str] | None = None,
     ) -> list[EmulationHistoryListRow]:
         filters = self._build_filters(query)
-        captures_agg = (
-            select(
-                AdCapture.session_id.label("session_id"),
-                func.count(AdCapture.id).label("ads_total"),
-                func.count()
-                .filter(AdCapture.video_status == VideoStatus.COMPLETED)
-                .label("video_captures"),
-                func.count()
-                .filter(AdCapture.video_status == VideoStatus.FALLBACK_SCREENSHOTS)
-                .label("screenshot_fallbacks"),
+        if after is not None:
+            # Keyset page: seeks the (queued_at, session_id) index instead of
+            # walking past every earlier row.
+            filters.append(
+                tuple_(EmulationSessionHistory.queued_at, EmulationSessionHistory.session_id)
+                < tuple_(*after)
             )
-            .group_by(AdCapture.session_id)
-            .subquery()
-        )
+            offset = 0
 
         stmt = (
-            select(
-                EmulationSessionHistory,
-                func.coalesce(captures_agg.c.ads_total, 0),
-                func.coalesce(captures_agg.c.video_captures, 0),
-                func.coalesce(captures_agg.c.screenshot_fallbacks, 0),
-            )
-            .outerjoin(
-                captures_agg,
-                captures_agg.c.session_id == EmulationSessionHistory.session_id,
-            )
+            select(EmulationSessionHistory)
             .where(*filters)
             .order_by(
                 EmulationSessionHistory.queued_at.desc(),
@@ -157,20 +324,55 @@ class EmulationHistoryGateway:
             .offset(offset=offset)
             .limit(limit)
         )
+        sessions = list((await self.session.execute(stmt)).scalars().all())
+        capture_counts = await self._get_capture_counts(
+            [payload.session_id for payload in sessions]
+        )
 
-        result = await self.session.execute(stmt)
         rows: list[EmulationHistoryListRow] = []
-        for payload, ads_total, video_captures, screenshot_fallbacks in result.all():
+        for payload in sessions:
+            ads_total, video_captures, screenshot_fallbacks = capture_counts.get(
+                payload.session_id,
+                (0, 0, 0),
+            )
             rows.append(
                 EmulationHistoryListRow(
                     session=payload,
-                    ads_total=int(ads_total),
-                    video_captures=int(video_captures),
-                    screenshot_fallbacks=int(screenshot_fallbacks),
+                    ads_total=ads_total,
+                    video_captures=video_captures,
+                    screenshot_fallbacks=screenshot_fallbacks,
                 )
             )
         return rows
 
+    async def _get_capture_counts(
+        self,
+        session_ids: list[str],
+    ) -> dict[str, tuple[int, int, int]]:
+        if not session_ids:
+            return {}
+
+        stmt = (
+            select(
+                AdCapture.session_id,
+                func.count(AdCapture.id),
+                func.count().filter(AdCapture.video_status == VideoStatus.COMPLETED),
+                func.count().filter(
+                    AdCapture.video_status == VideoStatus.FALLBACK_SCREENSHOTS
+                ),
+            )
+            .where(
+                AdCapture.session_id
+                == any_(bindparam("session_ids", session_ids, type_=ARRAY(String)))
+            )
+            .group_by(AdCapture.session_id)
+        )
+        result = await self.session.execute(stmt)
+        return {
+            session_id: (int(ads_total), int(video_captures), int(screenshot_fallbacks))
+            for session_id, ads_total, video_captures, screenshot_fallbacks in result.all()
+        }
+
     async def get_ad_captures_by_session(self, session_id: str) -> list[AdCapture]:
         stmt = (
             select(AdCapture)
@@ -210,112 +412,12 @@ class EmulationHistoryGateway:
         await self.session.execute(
             delete(AdCapture).where(AdCapture.session_id == session_id)
         )
+        for model, _ in _WATCHED_ITEM_MODELS:
+            await self.session.execute(delete(model).where(model.session_id == session_id))
         await self.session.delete(payload)
         await self.session.flush()
         return True
 
-    async def get_dashboard_base_summary(self) -> dict[str, int]:
-        stmt = select(
-            func.count(EmulationSessionHistory.session_id),
-            func.coalesce(
-                func.count().filter(EmulationSessionHistory.status == SessionStatus.COMPLETED),
-                0,
-            ),
-            func.coalesce(
-                func.count().filter(EmulationSessionHistory.status == SessionStatus.RUNNING),
-                0,
-            ),
-            func.coalesce(
-                func.count().filter(EmulationSessionHistory.status == SessionStatus.FAILED),
-                0,
-            ),
-            func.coalesce(
-                func.count().filter(EmulationSessionHistory.status == SessionStatus.STOPPED),
-                0,
-            ),
-            func.coalesce(func.sum(EmulationSessionHistory.videos_watched), 0),
-            func.coalesce(func.sum(EmulationSessionHistory.watched_ads_count), 0),
-        )
-        result = await self.session.execute(stmt)
-        total_sessions, completed, running, failed, stopped, total_videos_watched, total_ads_watched = result.one()
-        return {
-            "total_sessions": int(total_sessions or 0),
-            "completed": int(completed or 0),
-            "running": int(running or 0),
-            "failed": int(failed or 0),
-            "stopped": int(stopped or 0),
-            "total_videos_watched": int(total_videos_watched or 0),
-            "total_ads_watched": int(total_ads_watched or 0),
-        }
-
-    async def get_dashboard_capture_summary(self) -> dict[str, int]:
-        advertiser_domain = func.coalesce(func.nullif(func.trim(AdCapture.advertiser_domain), ""), "unknown")
-        stmt = select(
-            func.count(AdCapture.id),
-            func.coalesce(func.count().filter(AdCapture.video_status == VideoStatus.COMPLETED), 0),
-            func.coalesce(func.count().filter(AdCapture.video_status == VideoStatus.FALLBACK_SCREENSHOTS), 0),
-            func.coalesce(func.count().filter(AdCapture.landing_status == "completed"), 0),
-            func.coalesce(func.count().filter(AdCapture.analysis_status == AnalysisStatus.COMPLETED), 0),
-            func.coalesce(func.count().filter(AdCapture.analysis_status == AnalysisStatus.NOT_RELEVANT), 0),
-            advertiser_domain,
-        ).group_by(advertiser_domain)
-        result = await self.session.execute(stmt)
-
-        total_ad_captures = 0
-        video_captures = 0
-        screenshot_fallbacks = 0
-        landing_completed = 0
-        relevant_ads = 0
-        not_relevant_ads = 0
-        advertiser_counts: list[tuple[str, int]] = []
-
-        for (
-            group_total,
-            group_videos,
-            group_screenshots,
-            group_landings,
-            group_relevant,
-            group_not_relevant,
-            domain,
-        ) in result.all():
-            total_ad_captures += int(group_total or 0)
-            video_captures += int(group_videos or 0)
-            screenshot_fallbacks += int(group_screenshots or 0)
-            landing_completed += int(group_landings or 0)
-            relevant_ads += int(group_relevant or 0)
-            not_relevant_ads += int(group_not_relevant or 0)
-            advertiser_counts.append((str(domain or "unknown"), int(group_total or 0)))
-
-        advertiser_counts.sort(key=lambda item: (-item[1], item[0]))
-        top_advertisers = advertiser_counts[:6]
-
-        return {
-            "total_ad_captures": total_ad_captures,
-            "video_captures": video_captures,
-            "screenshot_fallbacks": screenshot_fallbacks,
-            "landing_completed": landing_completed,
-            "relevant_ads": relevant_ads,
-            "not_relevant_ads": not_relevant_ads,
-            "analyzed_ads": relevant_ads + not_relevant_ads,
-            "top_advertisers": top_advertisers,
-        }
-
-    async def get_top_requested_topics(self, limit: int = 8) -> list[tuple[str, int]]:
-        stmt = select(EmulationSessionHistory.requested_topics)
-        result = await self.session.execute(stmt)
-        counts: Counter[str] = Counter()
-
-        for topics in result.scalars().all():
-            if not isinstance(topics, list):
-                continue
-            for topic in topics:
-                if isinstance(topic, str):
-                    normalized = topic.strip()
-                    if normalized:
-                        counts[normalized] += 1
-
-        return counts.most_common(limit)
-
     def _build_filters(self, query: EmulationHistoryQuery) -> list:
         filters: list = []
 
@@ -326,11 +428,12 @@ class EmulationHistoryGateway:
         if query.mode:
             filters.append(EmulationSessionHistory.mode == query.mode)
         if query.topic_search:
-            like_value = f"%{query.topic_search}%"
+            # The column is already lower-cased, so a plain LIKE can use its
+            # trigram index for case-insensitive substring matches.
             filters.append(
-                or_(
-                    cast(EmulationSessionHistory.requested_topics, Text).ilike(like_value),
-                    cast(EmulationSessionHistory.topics_searched, Text).ilike(like_value),
+                EmulationSessionHistory.topics_search_text.like(
+                    _contains_pattern(query.topic_search.lower()),
+                    escape="\\",
                 )
             )
         if query.queued_from:
@@ -381,18 +484,236 @@ class EmulationHistoryGateway:
         return filters
 
 
+# Rollups are keyed by UTC day: sessions by queued_at, captures by created_at.
+_SESSION_DAY = "(timezone('UTC', s.queued_at))::date"
+_CAPTURE_DAY = "(timezone('UTC', c.created_at))::date"
+_DAYS_FILTER = "(:all_days OR {day} = ANY(:days))"
+
+_ROLLUP_STATEMENTS = (
+    f"""
+    INSERT INTO dashboard_session_rollups (day, status, sessions, videos_watched, ads_watched)
+    SELECT {_SESSION_DAY}, s.status, count(*),
+           coalesce(sum(s.videos_watched), 0), coalesce(sum(s.watched_ads_count), 0)
+    FROM emulation_sessions AS s
+    WHERE {_DAYS_FILTER.format(day=_SESSION_DAY)}
+    GROUP BY 1, 2
+    """,
+    f"""
+    INSERT INTO dashboard_topic_rollups (day, topic, sessions)
+    SELECT day, topic, count(*)
+    FROM (
+        SELECT {_SESSION_DAY} AS day, btrim(item.value #>> '{{}}', E' \\t\\n\\r\\f\\v') AS topic
+        FROM emulation_sessions AS s
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(s.requested_topics) = 'array'
+                 THEN s.requested_topics ELSE '[]'::jsonb END
+        ) AS item(value)
+        WHERE jsonb_typeof(item.value) = 'string'
+          AND {_DAYS_FILTER.format(day=_SESSION_DAY)}
+    ) AS topics
+    WHERE topic <> ''
+    GROUP BY day, topic
+    """,
+    f"""
+    INSERT INTO dashboard_capture_rollups (
+        day, advertiser_domain, captures, video_captures, screenshot_fallbacks,
+        landing_completed, relevant, not_relevant
+    )
+    SELECT {_CAPTURE_DAY},
+           coalesce(nullif(btrim(c.advertiser_domain), ''), 'unknown'),
+           count(*),
+           count(*) FILTER (WHERE c.video_status = '{VideoStatus.COMPLETED}'),
+           count(*) FILTER (WHERE c.video_status = '{VideoStatus.FALLBACK_SCREENSHOTS}'),
+           count(*) FILTER (WHERE c.landing_status = '{LandingStatus.COMPLETED}'),
+           count(*) FILTER (WHERE c.analysis_status = '{AnalysisStatus.COMPLETED}'),
+           count(*) FILTER (WHERE c.analysis_status = '{AnalysisStatus.NOT_RELEVANT}')
+    FROM ad_captures AS c
+    WHERE {_DAYS_FILTER.format(day=_CAPTURE_DAY)}
+    GROUP BY 1, 2
+    """,
+)
+
+_ROLLUP_MODELS = (DashboardSessionRollup, DashboardTopicRollup, DashboardCaptureRollup)
+# Rendered inline so that generic prepared-statement plans still match the
+# partial pending-analysis index predicate.
+_PENDING_ANALYSIS = literal(AnalysisStatus.PENDING.value, String, literal_execute=True)
+_DASHBOARD_ACTIVE_STATUSES = (SessionStatus.QUEUED, SessionStatus.RUNNING, SessionStatus.STOPPING)
+
+
+def _utc_day(value):
+    return cast(func.timezone("UTC", value), Date)
+
+
+class DashboardRollupGateway:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def rebuild(self, days: list[datetime.date] | None = None) -> None:
+        # None rebuilds every day. The advisory lock serialises the periodic
+        # refresh, deletes and the CLI rebuild.
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext("dashboard_rollups")))
+        )
+        params = {"all_days": days is None, "days": days or []}
+        for model in _ROLLUP_MODELS:
+            stmt = delete(model)
+            if days is not None:
+                stmt = stmt.where(
+                    model.day == any_(bindparam("days", days, type_=ARRAY(Date)))
+                )
+            await self.session.execute(stmt)
+        for statement in _ROLLUP_STATEMENTS:
+            await self.session.execute(
+                text(statement).bindparams(
+                    bindparam("all_days", type_=Boolean),
+                    bindparam("days", type_=ARRAY(Date)),
+                ),
+                params,
+            )
+
+    async def get_open_days(self, finished_since: datetime.datetime) -> set[datetime.date]:
+        # Days whose source rows can still change: sessions not finished (or
+        # only just finished) and captures still waiting for a verdict. Each
+        # branch is a separate index-backed scan (status, finished_at, the
+        # pending-analysis partial index, created_at) rather than one OR
+        # that would scan both tables.
+        session_day = _utc_day(EmulationSessionHistory.queued_at)
+        capture_day = _utc_day(AdCapture.created_at)
+        result = await self.session.execute(
+            union(
+                select(session_day).where(
+                    EmulationSessionHistory.status.in_(_DASHBOARD_ACTIVE_STATUSES)
+                ),
+                select(session_day).where(EmulationSessionHistory.finished_at.is_(None)),
+                select(session_day).where(EmulationSessionHistory.finished_at >= finished_since),
+                select(capture_day).where(AdCapture.analysis_status == _PENDING_ANALYSIS),
+                select(capture_day).where(AdCapture.created_at >= finished_since),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_session_days(self, session_id: str) -> set[datetime.date]:
+        session_days = select(_utc_day(EmulationSessionHistory.queued_at)).where(
+            EmulationSessionHistory.session_id == session_id
+        )
+        capture_days = select(_utc_day(AdCapture.created_at)).where(
+            AdCapture.session_id == session_id
+        )
+        result = await self.session.execute(union(session_days, capture_days))
+        return set(result.scalars().all())
+
+    async def get_stored_open_days(self) -> set[datetime.date]:
+        result = await self.session.execute(select(DashboardRollupOpenDay.day))
+        return set(result.scalars().all())
+
+    async def replace_stored_open_days(self, days: set[datetime.date]) -> None:
+        await self.session.execute(delete(DashboardRollupOpenDay))
+        if days:
+            await self.session.execute(
+                insert(DashboardRollupOpenDay).values([{"day": day} for day in sorted(days)])
+            )
+
+    async def get_session_summary(self) -> dict[str, int]:
+        stmt = select(
+            DashboardSessionRollup.status,
+            func.sum(DashboardSessionRollup.sessions),
+            func.sum(DashboardSessionRollup.videos_watched),
+            func.sum(DashboardSessionRollup.ads_watched),
+        ).group_by(DashboardSessionRollup.status)
+        result = await self.session.execute(stmt)
+
+        summary = {
+            "total_sessions": 0,
+            "completed": 0,
+            "running": 0,
+            "failed": 0,
+            "stopped": 0,
+            "total_videos_watched": 0,
+            "total_ads_watched": 0,
+        }
+        for status, sessions, videos_watched, ads_watched in result.all():
+            summary["total_sessions"] += int(sessions or 0)
+            summary["total_videos_watched"] += int(videos_watched or 0)
+            summary["total_ads_watched"] += int(ads_watched or 0)
+            if status in summary:
+                summary[status] += int(sessions or 0)
+        return summary
+
+    async def get_capture_summary(self, top_advertisers: int = 6) -> dict[str, int]:
+        totals_stmt = select(
+            func.coalesce(func.sum(DashboardCaptureRollup.captures), 0),
+            func.coalesce(func.sum(DashboardCaptureRollup.video_captures), 0),
+            func.coalesce(func.sum(DashboardCaptureRollup.screenshot_fallbacks), 0),
+            func.coalesce(func.sum(DashboardCaptureRollup.landing_completed), 0),
+            func.coalesce(func.sum(DashboardCaptureRollup.relevant), 0),
+            func.coalesce(func.sum(DashboardCaptureRollup.not_relevant), 0),
+        )
+        (
+            total_ad_captures,
+            video_captures,
+            screenshot_fallbacks,
+            landing_completed,
+            relevant_ads,
+            not_relevant_ads,
+        ) = (int(value) for value in (await self.session.execute(totals_stmt)).one())
+
+        advertiser_total = func.sum(DashboardCaptureRollup.captures)
+        advertisers_stmt = (
+            select(DashboardCaptureRollup.advertiser_domain, advertiser_total)
+            .group_by(DashboardCaptureRollup.advertiser_domain)
+            .order_by(advertiser_total.desc(), DashboardCaptureRollup.advertiser_domain)
+            .limit(top_advertisers)
+        )
+        advertisers = await self.session.execute(advertisers_stmt)
+
+        return {
+            "total_ad_captures": total_ad_captures,
+            "video_captures": video_captures,
+            "screenshot_fallbacks": screenshot_fallbacks,
+            "landing_completed": landing_completed,
+            "relevant_ads": relevant_ads,
+            "not_relevant_ads": not_relevant_ads,
+            "analyzed_ads": relevant_ads + not_relevant_ads,
+            "top_advertisers": [(domain, int(total)) for domain, total in advertisers.all()],
+        }
+
+    async def get_top_requested_topics(self, limit: int = 8) -> list[tuple[str, int]]:
+        total = func.sum(DashboardTopicRollup.sessions)
+        stmt = (
+            select(DashboardTopicRollup.topic, total)
+            .group_by(DashboardTopicRollup.topic)
+            .order_by(total.desc(), DashboardTopicRollup.topic)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(topic, int(count)) for topic, count in result.all()]
+
+
 class AdCaptureGateway:
+    # Keeps each multi-row INSERT well below Postgres' bind parameter limit.
+    _INSERT_BATCH_ROWS = 1000
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def create(self, capture: AdCapture) -> AdCapture:
-        self.session.add(capture)
-        await self.session.flush()
-        return capture
+    async def insert_missing(self, rows: list[dict[str, object]]) -> dict[int, uuid.UUID]:
+        inserted: dict[int, uuid.UUID] = {}
+        for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+            stmt = (
+                insert(AdCapture)
+                .values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+                .on_conflict_do_nothing(constraint="ad_captures_session_id_ad_position_ukey")
+                .returning(AdCapture.ad_position, AdCapture.id)
+            )
+            result = await self.session.execute(stmt)
+            inserted.update(result.tuples().all())
+        return inserted
 
-    async def add_screenshot(self, screenshot: AdCaptureScreenshot) -> None:
-        self.session.add(screenshot)
-        await self.session.flush()
+    async def add_screenshots(self, rows: list[dict[str, object]]) -> None:
+        for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+            await self.session.execute(
+                insert(AdCaptureScreenshot).values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+            )
 
     async def get_by_session(self, session_id: str) -> list[AdCapture]:
         stmt = (
@@ -404,6 +725,133 @@ class AdCaptureGateway:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def count_pending_analysis(self, session_id: str) -> int:
+        # Served by the partial pending-analysis index, so the cost follows
+        # the pending backlog rather than the session's capture count.
+        stmt = select(func.count()).where(
+            AdCapture.session_id == session_id,
+            AdCapture.analysis_status == _PENDING_ANALYSIS,
+            AdCapture.video_status == VideoStatus.COMPLETED,
+            AdCapture.video_file.is_not(None),
+        )
+        return int((await self.session.execute(stmt)).scalar_one())
+
+    async def get_analysis_counts(self, session_id: str) -> tuple[int, int, int]:
+        """Return (analyzable, done, failed) over captures with a completed video."""
+        stmt = select(
+            func.count(),
+            func.count().filter(
+                AdCapture.analysis_status.in_(list(ANALYSIS_TERMINAL_STATUSES))
+            ),
+            func.count().filter(AdCapture.analysis_status == AnalysisStatus.FAILED),
+        ).where(
+            AdCapture.session_id == session_id,
+            AdCapture.video_status == VideoStatus.COMPLETED,
+        )
+        total, done, failed = (await self.session.execute(stmt)).one()
+        return int(total), int(done), int(failed)
+
+    async def get_pending_analysis(self, session_id: str) -> list[AdCapture]:
+        stmt = (
+            select(AdCapture)
+            .where(
+                AdCapture.session_id == session_id,
+                AdCapture.analysis_status == _PENDING_ANALYSIS,
+                AdCapture.video_status == VideoStatus.COMPLETED,
+                AdCapture.video_file.is_not(None),
+            )
+            .order_by(AdCapture.ad_position.asc(), AdCapture.created_at.asc())
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_video_file_refs(self, video_files: list[str]) -> dict[str, int]:
+        # Counted across sessions: captures linked through the creative
+        # registry point at files under another session's directory.
+        if not video_files:
+            return {}
+        stmt = (
+            select(AdCapture.video_file, func.count())
+            .where(AdCapture.video_file.in_(video_files))
+            .group_by(AdCapture.video_file)
+        )
+        result = await self.session.execute(stmt)
+        return {video_file: int(count) for video_file, count in result.all()}
+
+    async def get_analysis_state_rows(
+        self,
+        session_id: str,
+        since: datetime.datetime | None = None,
+    ) -> list[Row]:
+        stmt = (
+            select(
+                AdCapture.id,
+                AdCapture.ad_position,
+                AdCapture.video_src_url,
+                AdCapture.video_status,
+                AdCapture.video_file,
+                AdCapture.landing_url,
+                AdCapture.landing_status,
+                AdCapture.landing_dir,
+                AdCapture.analysis_status,
+                AdCapture.analysis_summary,
+                AdCapture.analysis_updated_at,
+            )
+            .where(AdCapture.session_id == session_id, AdCapture.ad_position > 0)
+            .order_by(AdCapture.ad_position.asc(), AdCapture.created_at.asc())
+        )
+        if since is not None:
+            stmt = stmt.where(AdCapture.analysis_updated_at > since)
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_screenshot_paths(
+        self, capture_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, list[tuple[int, str]]]:
+        if not capture_ids:
+            return {}
+        stmt = (
+            select(
+                AdCaptureScreenshot.capture_id,
+                AdCaptureScreenshot.offset_ms,
+                AdCaptureScreenshot.file_path,
+            )
+            .where(AdCaptureScreenshot.capture_id.in_(capture_ids))
+            .order_by(AdCaptureScreenshot.capture_id, AdCaptureScreenshot.offset_ms)
+        )
+        result = await self.session.execute(stmt)
+        paths: dict[uuid.UUID, list[tuple[int, str]]] = {}
+        for capture_id, offset_ms, file_path in result.all():
+            paths.setdefault(capture_id, []).append((offset_ms, file_path))
+        return paths
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+        advertiser_domain: str | None = None,
+        analysis_status: str | None = None,
+    ) -> list[AdCapture]:
+        ts_query = func.websearch_to_tsquery(CAPTURE_SEARCH_CONFIG, query)
+        stmt = (
+            select(AdCapture)
+            .options(selectinload(AdCapture.screenshots))
+            .where(AdCapture.search_vector.op("@@")(ts_query))
+        )
+        if advertiser_domain:
+            stmt = stmt.where(
+                func.lower(AdCapture.advertiser_domain) == advertiser_domain.strip().lower()
+            )
+        if analysis_status:
+            stmt = stmt.where(AdCapture.analysis_status == analysis_status)
+        if after is not None:
+            stmt = stmt.where(tuple_(AdCapture.created_at, AdCapture.id) < tuple_(*after))
+        stmt = stmt.order_by(AdCapture.created_at.desc(), AdCapture.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def update_landing_status(
         self, capture_id: uuid.UUID, status: str, landing_dir: str | None = None,
     ) -> None:
@@ -422,11 +870,236 @@ class AdCaptureGateway:
             if video_file:
                 capture.video_file = video_file
 
-    async def update_analysis(
-        self, capture_id: uuid.UUID, status: str, summary: str | None = None,
+    async def update_analysis_many(
+        self, results: list[tuple[uuid.UUID, str, str | None]],
     ) -> None:
-        capture = await self.session.get(AdCapture, capture_id)
-        if capture:
-            capture.analysis_status = status
-            if summary is not None:
-                capture.analysis_summary = summary
+        # (capture_id, status, summary) rows; a None summary keeps the stored one.
+        # Loaded captures are not refreshed, so callers track verdicts themselves.
+        analysis_updated_at = datetime.datetime.now(datetime.UTC)
+        for offset in range(0, len(results), self._INSERT_BATCH_ROWS):
+            verdicts = values(
+                column("id", UUID(as_uuid=True)),
+                column("status", String),
+                column("summary", Text),
+                name="verdicts",
+            ).data(results[offset : offset + self._INSERT_BATCH_ROWS])
+            stmt = (
+                update(AdCapture)
+                .where(AdCapture.id == verdicts.c.id)
+                .values(
+                    analysis_status=verdicts.c.status,
+                    analysis_summary=func.coalesce(
+                        verdicts.c.summary, AdCapture.analysis_summary
+                    ),
+                    analysis_updated_at=analysis_updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(stmt)
+
+    async def update_video_fingerprints(
+        self, rows: list[tuple],
+    ) -> None:
+        # (capture_id, content_hash, fingerprint, band0, band1, band2, band3) rows.
+        for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+            fingerprints = values(
+                column("id", UUID(as_uuid=True)),
+                column("content_hash", String),
+                column("fingerprint", Text),
+                column("band0", Integer),
+                column("band1", Integer),
+                column("band2", Integer),
+                column("band3", Integer),
+                name="fingerprints",
+            ).data(rows[offset : offset + self._INSERT_BATCH_ROWS])
+            stmt = (
+                update(AdCapture)
+                .where(AdCapture.id == fingerprints.c.id)
+                .values(
+                    video_content_hash=fingerprints.c.content_hash,
+                    video_fingerprint=fingerprints.c.fingerprint,
+                    video_fingerprint_band0=fingerprints.c.band0,
+                    video_fingerprint_band1=fingerprints.c.band1,
+                    video_fingerprint_band2=fingerprints.c.band2,
+                    video_fingerprint_band3=fingerprints.c.band3,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(stmt)
+
+    async def find_fingerprint_verdicts(
+        self,
+        bands: list[tuple[int, ...]],
+        prompt_version: str,
+        per_band_limit: int = 50,
+    ) -> list[tuple[str, AdAnalysisVerdict]]:
+        """Cached verdicts of creatives sharing at least one fingerprint band.
+
+        Candidates are collected per band and capped per band value, newest
+        first and one per content hash, so a popular value (dark or
+        letterboxed frames) cannot crowd out the others. The caller still
+        checks the exact distance.
+        """
+        if not bands:
+            return []
+        band_columns = (
+            AdCapture.video_fingerprint_band0,
+            AdCapture.video_fingerprint_band1,
+            AdCapture.video_fingerprint_band2,
+            AdCapture.video_fingerprint_band3,
+        )
+        per_band = []
+        for index, band_column in enumerate(band_columns):
+            latest = (
+                select(
+                    band_column.label("band"),
+                    AdCapture.video_content_hash.label("content_hash"),
+                    AdCapture.video_fingerprint.label("fingerprint"),
+                    AdCapture.created_at.label("created_at"),
+                )
+                .join(
+                    AdAnalysisVerdict,
+                    and_(
+                        AdAnalysisVerdict.content_hash == AdCapture.video_content_hash,
+                        AdAnalysisVerdict.prompt_version == prompt_version,
+                    ),
+                )
+                .where(
+                    band_column.in_(sorted({band[index] for band in bands})),
+                    AdCapture.video_fingerprint.is_not(None),
+                )
+                .distinct(band_column, AdCapture.video_content_hash)
+                .order_by(band_column, AdCapture.video_content_hash, AdCapture.created_at.desc())
+                .subquery()
+            )
+            ranked = select(
+                latest.c.content_hash,
+                latest.c.fingerprint,
+                func.row_number()
+                .over(partition_by=latest.c.band, order_by=latest.c.created_at.desc())
+                .label("rank"),
+            ).subquery()
+            per_band.append(
+                select(ranked.c.content_hash, ranked.c.fingerprint).where(
+                    ranked.c.rank <= per_band_limit
+                )
+            )
+        candidates = union_all(*per_band).subquery()
+        stmt = (
+            select(candidates.c.fingerprint, AdAnalysisVerdict)
+            .join(
+                AdAnalysisVerdict,
+                and_(
+                    AdAnalysisVerdict.content_hash == candidates.c.content_hash,
+                    AdAnalysisVerdict.prompt_version == prompt_version,
+                ),
+            )
+            .distinct(candidates.c.content_hash)
+            .order_by(candidates.c.content_hash)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_cached_verdicts(
+        self, content_hashes: list[str], prompt_version: str,
+    ) -> dict[str, AdAnalysisVerdict]:
+        if not content_hashes:
+            return {}
+        stmt = select(AdAnalysisVerdict).where(
+            AdAnalysisVerdict.prompt_version == prompt_version,
+            AdAnalysisVerdict.content_hash.in_(content_hashes),
+        )
+        result = await self.session.execute(stmt)
+        return {verdict.content_hash: verdict for verdict in result.scalars().all()}
+
+    async def add_cached_verdicts(self, rows: list[dict[str, object]]) -> None:
+        # Workers analysing the same creative concurrently race here; the first
+        # verdict stored wins.
+        for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+            await self.session.execute(
+                insert(AdAnalysisVerdict)
+                .values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+                .on_conflict_do_nothing(constraint="ad_analysis_verdicts_pkey")
+            )
+
+
+_CREATIVE_ARTIFACT_COLUMNS = (
+    "video_src_url",
+    "video_status",
+    "video_file",
+    "landing_url",
+    "landing_status",
+    "landing_dir",
+    "screenshot_paths",
+)
+
+
+class AdCreativeGateway:
+    _INSERT_BATCH_ROWS = 1000
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_by_registry_key(self, registry_key: str) -> AdCreative | None:
+        stmt = select(AdCreative).where(AdCreative.registry_key == registry_key)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def record_sightings(
+        self, session_id: str, sightings: list[dict[str, object]],
+    ) -> None:
+        """Upsert the creative behind each sighting and link the sighting to it.
+
+        A fresh capture (``reused`` false) re-points the creative at its own
+        artifacts; reused sightings only refresh ``last_seen_at``.
+        """
+        creatives: dict[str, dict[str, object]] = {}
+        for sighting in sightings:
+            registry_key = sighting["registry_key"]
+            if registry_key not in creatives or not sighting["reused"]:
+                creatives[registry_key] = sighting
+
+        seen_at = datetime.datetime.now(datetime.UTC)
+        creative_ids: dict[str, uuid.UUID] = {}
+        for reused in (False, True):
+            rows = [
+                {
+                    "registry_key": registry_key,
+                    "advertiser_domain": creative["advertiser_domain"],
+                    "headline_text": creative["headline_text"],
+                    "source_session_id": session_id,
+                    "last_seen_at": seen_at,
+                    **{name: creative[name] for name in _CREATIVE_ARTIFACT_COLUMNS},
+                }
+                for registry_key, creative in creatives.items()
+                if bool(creative["reused"]) is reused
+            ]
+            for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+                stmt = insert(AdCreative).values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+                set_ = {"last_seen_at": stmt.excluded.last_seen_at}
+                if not reused:
+                    set_["source_session_id"] = stmt.excluded.source_session_id
+                    set_.update(
+                        (name, stmt.excluded[name]) for name in _CREATIVE_ARTIFACT_COLUMNS
+                    )
+                stmt = stmt.on_conflict_do_update(
+                    constraint="ad_creatives_registry_key_ukey", set_=set_,
+                ).returning(AdCreative.registry_key, AdCreative.id)
+                creative_ids.update((await self.session.execute(stmt)).tuples().all())
+
+        rows = [
+            {
+                "creative_id": creative_ids[sighting["registry_key"]],
+                "session_id": session_id,
+                "ad_position": sighting["ad_position"],
+                "reused": bool(sighting["reused"]),
+            }
+            for sighting in sightings
+        ]
+        for offset in range(0, len(rows), self._INSERT_BATCH_ROWS):
+            await self.session.execute(
+                insert(AdCreativeSighting)
+                .values(rows[offset : offset + self._INSERT_BATCH_ROWS])
+                .on_conflict_do_nothing(
+                    constraint="ad_creative_sightings_session_id_ad_position_ukey",
+                )
+            )
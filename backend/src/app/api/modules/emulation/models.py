@@ -5,8 +5,24 @@ import uuid
 from enum import StrEnum
 from typing import Any
 
-from sqlalchemy import UUID, BigInteger, DateTime, Float, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    UUID,
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    FetchedValue,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base, DateTimeMixin, UUID7IDMixin
@@ -69,17 +85,52 @@ ANALYSIS_TERMINAL_STATUSES = frozenset(
     }
 )
 
+# Language-neutral: creatives are captured in many languages.
+CAPTURE_SEARCH_CONFIG = "simple"
+
 
 class AdCapture(Base, UUID7IDMixin, DateTimeMixin):
     __tablename__ = "ad_captures"
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id",
+            "ad_position",
+            name="ad_captures_session_id_ad_position_ukey",
+        ),
+        # Keeps the analysis loop's backlog checks proportional to the backlog.
+        Index(
+            "ad_captures_session_id_pending_analysis_idx",
+            "session_id",
+            postgresql_where=text("analysis_status = 'pending'"),
+        ),
+        # Backs the dashboard rollup's open-day scan of recent captures.
+        Index("ad_captures_created_at_idx", "created_at"),
+        Index(
+            "ad_captures_session_id_analysis_updated_at_idx",
+            "session_id",
+            "analysis_updated_at",
+        ),
+        Index(
+            "ad_captures_search_vector_idx",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        *(
+            Index(f"ad_captures_video_fingerprint_band{band}_idx", f"video_fingerprint_band{band}")
+            for band in range(4)
+        ),
+    )
 
     session_id: Mapped[str] = mapped_column(String(64), index=True)
     ad_position: Mapped[int] = mapped_column(Integer)
 
     advertiser_domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
     cta_href: Mapped[str | None] = mapped_column(Text, nullable=True)
+    cta_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     display_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     headline_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    full_text: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     ad_duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     landing_url: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -87,11 +138,36 @@ class AdCapture(Base, UUID7IDMixin, DateTimeMixin):
     landing_status: Mapped[str] = mapped_column(String(20), default=LandingStatus.PENDING)
 
     video_src_url: Mapped[str | None] = mapped_column(Text, nullable=True)
-    video_file: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Indexed for the cross-session reference counts taken before cleanup.
+    video_file: Mapped[str | None] = mapped_column(Text, nullable=True, index=True)
     video_status: Mapped[str] = mapped_column(String(20), default=VideoStatus.PENDING)
+    # Set by analysis. The fingerprint is per-frame dHashes (hex); its bands
+    # split the per-bit majority hash into 16-bit slices. Candidate lookups
+    # require a shared band, which is only guaranteed for majority hashes
+    # within three bits, so banding is a prefilter that trades some recall
+    # (against the mean per-frame distance threshold) for indexed lookups.
+    video_content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    video_fingerprint: Mapped[str | None] = mapped_column(Text, nullable=True)
+    video_fingerprint_band0: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    video_fingerprint_band1: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    video_fingerprint_band2: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    video_fingerprint_band3: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     analysis_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     analysis_status: Mapped[str] = mapped_column(String(20), default=AnalysisStatus.PENDING)
+    # Set whenever the verdict changes; the live state sync reads past it.
+    analysis_updated_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+    )
+
+    # Stored generated tsvector over the creative text; see CAPTURE_SEARCH_CONFIG.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=True,
+        deferred=True,
+    )
 
     screenshots: Mapped[list[AdCaptureScreenshot]] = relationship(
         back_populates="capture", cascade="all, delete-orphan",
@@ -114,6 +190,20 @@ class AdCaptureScreenshot(Base, UUID7IDMixin, DateTimeMixin):
 
 class EmulationSessionHistory(Base, DateTimeMixin):
     __tablename__ = "emulation_sessions"
+    __table_args__ = (
+        # Backs the history listing's (queued_at, session_id) keyset ordering.
+        Index(
+            "emulation_sessions_queued_at_session_id_idx",
+            "queued_at",
+            "session_id",
+        ),
+        Index(
+            "emulation_sessions_topics_search_text_trgm_idx",
+            "topics_search_text",
+            postgresql_using="gin",
+            postgresql_ops={"topics_search_text": "gin_trgm_ops"},
+        ),
+    )
 
     session_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     status: Mapped[str] = mapped_column(String(20), index=True, default=SessionStatus.QUEUED)
@@ -124,7 +214,6 @@ class EmulationSessionHistory(Base, DateTimeMixin):
     queued_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.current_timestamp(),
-        index=True,
     )
     started_at: Mapped[datetime.datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -149,6 +238,13 @@ class EmulationSessionHistory(Base, DateTimeMixin):
     watched_ads_count: Mapped[int] = mapped_column(Integer, default=0)
 
     topics_searched: Mapped[list[str]] = mapped_column(JSONB, default=list)
+    # Stored generated column: lower-cased text of both topic lists.
+    topics_search_text: Mapped[str | None] = mapped_column(
+        Text,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=True,
+    )
     watched_videos: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, default=list)
     watched_ads: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, default=list)
     watched_ads_analytics: Mapped[list[dict[str, Any]]] = mapped_column(
@@ -157,3 +253,134 @@ class EmulationSessionHistory(Base, DateTimeMixin):
     )
 
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class EmulationSessionVideo(Base, UUID7IDMixin, DateTimeMixin):
+    __tablename__ = "emulation_watched_videos"
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id",
+            "item_index",
+            name="emulation_watched_videos_session_id_item_index_ukey",
+        ),
+    )
+
+    session_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("emulation_sessions.session_id", ondelete="CASCADE"),
+    )
+    item_index: Mapped[int] = mapped_column(Integer)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+
+
+class EmulationSessionAd(Base, UUID7IDMixin, DateTimeMixin):
+    __tablename__ = "emulation_watched_ads"
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id",
+            "item_index",
+            name="emulation_watched_ads_session_id_item_index_ukey",
+        ),
+    )
+
+    session_id: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("emulation_sessions.session_id", ondelete="CASCADE"),
+    )
+    item_index: Mapped[int] = mapped_column(Integer)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+
+
+# One row per distinct creative across sessions; ``registry_key`` is the
+# capture path's creative key plus the normalised video source. The artifact
+# columns point at the capture whose files later sightings reuse.
+class AdCreative(Base, UUID7IDMixin, DateTimeMixin):
+    __tablename__ = "ad_creatives"
+
+    registry_key: Mapped[str] = mapped_column(Text, unique=True)
+    advertiser_domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    headline_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    source_session_id: Mapped[str] = mapped_column(String(64))
+
+    video_src_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    video_status: Mapped[str] = mapped_column(String(20), default=VideoStatus.PENDING)
+    video_file: Mapped[str | None] = mapped_column(Text, nullable=True)
+    landing_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    landing_status: Mapped[str] = mapped_column(String(20), default=LandingStatus.PENDING)
+    landing_dir: Mapped[str | None] = mapped_column(Text, nullable=True)
+    screenshot_paths: Mapped[list[list[Any]]] = mapped_column(JSONB, default=list)
+
+    last_seen_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+    )
+
+
+class AdCreativeSighting(Base, UUID7IDMixin, DateTimeMixin):
+    __tablename__ = "ad_creative_sightings"
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id",
+            "ad_position",
+            name="ad_creative_sightings_session_id_ad_position_ukey",
+        ),
+    )
+
+    creative_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("ad_creatives.id", ondelete="CASCADE"),
+        index=True,
+    )
+    session_id: Mapped[str] = mapped_column(String(64))
+    ad_position: Mapped[int] = mapped_column(Integer)
+    # False for the sighting that produced the creative's artifacts.
+    reused: Mapped[bool] = mapped_column(Boolean, default=False)
+
+
+# Verdicts for byte-identical videos, shared across sessions. ``parsed_result``
+# is the model's answer before guardrails; the analysis columns are final.
+class AdAnalysisVerdict(Base, DateTimeMixin):
+    __tablename__ = "ad_analysis_verdicts"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    prompt_version: Mapped[str] = mapped_column(String(16), primary_key=True)
+    parsed_result: Mapped[str] = mapped_column(String(20))
+    analysis_status: Mapped[str] = mapped_column(String(20))
+    analysis_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class DashboardSessionRollup(Base):
+    __tablename__ = "dashboard_session_rollups"
+
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    sessions: Mapped[int] = mapped_column(Integer, default=0)
+    videos_watched: Mapped[int] = mapped_column(BigInteger, default=0)
+    ads_watched: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+class DashboardTopicRollup(Base):
+    __tablename__ = "dashboard_topic_rollups"
+
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    topic: Mapped[str] = mapped_column(Text, primary_key=True)
+    sessions: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class DashboardCaptureRollup(Base):
+    __tablename__ = "dashboard_capture_rollups"
+
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    advertiser_domain: Mapped[str] = mapped_column(String(255), primary_key=True)
+    captures: Mapped[int] = mapped_column(Integer, default=0)
+    video_captures: Mapped[int] = mapped_column(Integer, default=0)
+    screenshot_fallbacks: Mapped[int] = mapped_column(Integer, default=0)
+    landing_completed: Mapped[int] = mapped_column(Integer, default=0)
+    relevant: Mapped[int] = mapped_column(Integer, default=0)
+    not_relevant: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class DashboardRollupOpenDay(Base):
+    __tablename__ = "dashboard_rollup_open_days"
+
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Depends, Request
@@ -5,8 +7,12 @@ from fastapi.params import Path, Query
 from fastapi.responses import FileResponse, StreamingResponse
 
 from app.api.common.auth import AuthenticateMainRoles
+from app.services.emulation.session.events import SessionEventHub
 
 from .schema import (
+    HISTORY_DETAIL_MAX_ITEMS,
+    EmulationCaptureSearchParams,
+    EmulationCaptureSearchResponse,
     EmulationCapturesResponse,
     EmulationDashboardSummaryResponse,
     EmulationHistoryDetailResponse,
@@ -57,11 +63,15 @@ async def get_emulation_history_detail(
     session_id: str = Path(...),
     include_raw_ads: bool = Query(False),
     include_captures: bool = Query(True),
+    items_offset: int = Query(0, ge=0),
+    items_limit: int | None = Query(None, ge=1, le=HISTORY_DETAIL_MAX_ITEMS),
 ) -> EmulationHistoryDetailResponse:
     return await session_service.get_session_detail(
         session_id=session_id,
         include_raw_ads=include_raw_ads,
         include_captures=include_captures,
+        items_offset=items_offset,
+        items_limit=items_limit,
     )
 
 
@@ -86,15 +96,22 @@ async def stream_emulation_status(
     session_id: str,
     request: Request,
     session_service: FromDishka[EmulationSessionService],
+    event_hub: FromDishka[SessionEventHub],
 ) -> StreamingResponse:
     initial_status = await session_service.get_status(session_id)
 
+    async def _events() -> AsyncIterator[str]:
+        async with event_hub.subscribe(session_id) as subscription:
+            async for chunk in stream_status_events(
+                initial_status=initial_status,
+                get_status=lambda data: session_service.get_status(session_id, data),
+                is_disconnected=request.is_disconnected,
+                subscription=subscription,
+            ):
+                yield chunk
+
     return StreamingResponse(
-        stream_status_events(
-            initial_status=initial_status,
-            get_status=lambda: session_service.get_status(session_id),
-            is_disconnected=request.is_disconnected,
-        ),
+        _events(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -136,6 +153,14 @@ async def delete_emulation_history(
     await session_service.delete_session(session_id)
 
 
+@router.get("/captures/search")
+async def search_emulation_captures(
+    history_service: FromDishka[EmulationHistoryService],
+    params: EmulationCaptureSearchParams = Query(),
+) -> EmulationCaptureSearchResponse:
+    return await history_service.search_captures(params)
+
+
 @router.get("/{session_id}/captures")
 async def get_emulation_captures(
     session_id: str,
@@ -6,6 +6,10 @@ from pydantic import BaseModel, ConfigDict, Field
 from app.api.common.schema import Pagination, PaginationParams
 from .models import PostProcessingStatus, SessionStatus
 
+STATUS_BATCH_MAX_SESSION_IDS = 500
+HISTORY_DETAIL_MAX_ITEMS = 500
+CAPTURE_SEARCH_MAX_LIMIT = 100
+
 
 class StartEmulationRequest(BaseModel):
     duration_minutes: int = Field(ge=1, le=480, description="Session duration in minutes")
@@ -28,7 +32,7 @@ class EmulationSessionActionRequest(BaseModel):
 
 
 class EmulationStatusBatchRequest(BaseModel):
-    session_ids: list[UUID] = Field(min_length=1, max_length=50)
+    session_ids: list[UUID] = Field(min_length=1, max_length=STATUS_BATCH_MAX_SESSION_IDS)
 
 
 class EmulationWatchedVideo(BaseModel):
@@ -178,8 +182,10 @@ class EmulationAdCaptureHistory(BaseModel):
     ad_position: int
     advertiser_domain: str | None = None
     cta_href: str | None = None
+    cta_text: str | None = None
     display_url: str | None = None
     headline_text: str | None = None
+    description_text: str | None = None
     ad_duration_seconds: float | None = None
     landing_url: str | None = None
     landing_dir: str | None = None
@@ -192,6 +198,17 @@ class EmulationAdCaptureHistory(BaseModel):
     screenshot_paths: list[EmulationAdCaptureScreenshotPath] = Field(default_factory=list)
 
 
+class EmulationCaptureSearchItem(EmulationAdCaptureHistory):
+    id: UUID
+    session_id: UUID
+    created_at: datetime.datetime
+
+
+class EmulationCaptureSearchResponse(BaseModel):
+    items: list[EmulationCaptureSearchItem] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
 class EmulationCaptureSummary(BaseModel):
     ads_total: int = 0
     video_captures: int = 0
@@ -232,6 +249,9 @@ class EmulationHistoryDetailResponse(EmulationHistoryItem):
 class EmulationHistoryResponse(Pagination[EmulationHistoryItem]):
     model_config = ConfigDict(from_attributes=True)
 
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
 
 class EmulationStatusBatchResponse(BaseModel):
     statuses: dict[str, EmulationSessionStatus] = Field(default_factory=dict)
@@ -290,3 +310,13 @@ class EmulationHistoryParams(PaginationParams):
     include_details: bool = False
     include_captures: bool = False
     include_raw_ads: bool = False
+    cursor: str | None = None
+    approximate_total: bool = False
+
+
+class EmulationCaptureSearchParams(BaseModel):
+    q: str = Field(min_length=1, max_length=256)
+    advertiser_domain: str | None = None
+    analysis_status: str | None = None
+    limit: int = Field(20, ge=1, le=CAPTURE_SEARCH_MAX_LIMIT)
+    cursor: str | None = None
@@ -12,11 +12,14 @@ from app.database.uow import UnitOfWork
 from app.services.emulation.common import derive_watched_video_counters, to_utc_datetime
 from app.services.emulation.core.ad_analytics import build_ads_analytics
 from app.services.emulation.session.store import EmulationSessionStore
+from app.services.metrics import MetricGroup
 
 from .gateway import EmulationHistoryQuery
 from .models import EmulationSessionHistory, SessionStatus
 from .schema import (
     EmulationAdCaptureHistory,
+    EmulationCaptureSearchParams,
+    EmulationCaptureSearchResponse,
     EmulationCapturesResponse,
     EmulationCaptureSummary,
     EmulationDashboardSummaryItem,
@@ -25,6 +28,7 @@ from .schema import (
     EmulationHistoryItem,
     EmulationHistoryParams,
     EmulationHistoryResponse,
+    STATUS_BATCH_MAX_SESSION_IDS,
     EmulationStatusBatchResponse,
     EmulationSessionStatus,
     StartEmulationRequest,
@@ -34,23 +38,42 @@ from .schema import (
 from .services.session_runtime import (
     build_resume_seed_from_history,
     build_resume_seed_from_live_payload,
+    build_status_from_history,
     build_status_response,
     elapsed_minutes_from_history,
     elapsed_minutes_from_live_payload,
-    is_break_phase_active,
-    last_activity_timestamp,
+    is_past_expected_runtime,
     normalize_profile_id,
 )
 from .utils import (
     build_capture_summary,
     build_post_processing_state,
     calculate_history_elapsed_minutes,
+    decode_capture_cursor,
+    decode_history_cursor,
+    encode_capture_cursor,
+    encode_history_cursor,
     map_ad_capture,
+    map_capture_search_item,
     normalize_watched_ads_payload,
     normalized_ads_count,
     normalized_videos_count,
 )
 
+STALE_RECONCILE_BATCH_SIZE = 200
+STALE_RECONCILER_METRICS_GROUP = "emulation_stale_reconciler"
+STALE_RECONCILER_METRICS: MetricGroup = {
+    "runs": ("counter", "Stale-session reconciler runs."),
+    "failures": ("counter", "Reconciler runs that raised."),
+    "reconciled_sessions": ("counter", "Sessions marked failed as stale."),
+    "duration_seconds": ("counter", "Total time spent in reconciler runs."),
+    "last_duration_seconds": ("gauge", "Duration of the latest reconciler run."),
+    "last_run_timestamp_seconds": ("gauge", "Unix time the latest reconciler run finished."),
+}
+
+# Sessions and captures settled within this window are still re-rolled up.
+DASHBOARD_ROLLUP_GRACE = datetime.timedelta(hours=1)
+
 
 class EmulationSessionService:
     def __init__(
@@ -123,6 +146,7 @@ class EmulationSessionService:
                 current_watch=None,
                 error="Stopped by user",
             )
+            await self._session_store.request_stop(session_id)
             await self._history_service.mark_stopped(
                 session_id,
                 await self._session_store.get(session_id) or {},
@@ -134,6 +158,7 @@ class EmulationSessionService:
             stop_requested=True,
             error=None,
         )
+        await self._session_store.request_stop(session_id)
         return StopEmulationResponse(session_id=session_id, status=SessionStatus.STOPPING)
 
     async def retry_session(self, session_id: str) -> StartEmulationResponse:
@@ -222,12 +247,16 @@ class EmulationSessionService:
             )
         return None, history
 
-    async def get_status(self, session_id: str) -> EmulationSessionStatus:
-        data = await self._session_store.get(session_id)
+    async def get_status(
+        self,
+        session_id: str,
+        data: dict | None = None,
+    ) -> EmulationSessionStatus:
+        if data is None:
+            data = await self._session_store.get(session_id)
         if data is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        data = await self._reconcile_stale_running_session(session_id, data)
         return build_status_response(session_id, data)
 
     async def get_status_batch(
@@ -235,57 +264,93 @@ class EmulationSessionService:
         session_ids: list[str],
     ) -> EmulationStatusBatchResponse:
         unique_session_ids = list(dict.fromkeys(session_ids))
-        if len(unique_session_ids) > 50:
+        if len(unique_session_ids) > STATUS_BATCH_MAX_SESSION_IDS:
             raise HTTPException(status_code=400, detail="Too many session ids")
 
-        results = await asyncio.gather(
-            *(self.get_status(session_id) for session_id in unique_session_ids),
-            return_exceptions=True,
-        )
+        payloads = await self._session_store.get_many(unique_session_ids)
 
         statuses: dict[str, EmulationSessionStatus] = {}
-        for session_id, result in zip(unique_session_ids, results, strict=False):
-            if isinstance(result, HTTPException) and result.status_code == 404:
+        missing_session_ids: list[str] = []
+        for session_id in unique_session_ids:
+            data = payloads.get(session_id)
+            if data is None:
+                missing_session_ids.append(session_id)
                 continue
-            if isinstance(result, Exception):
+            try:
+                statuses[session_id] = build_status_response(session_id, data)
+            except Exception:
                 continue
-            statuses[session_id] = result
 
-        return EmulationStatusBatchResponse(statuses=statuses)
-
-    async def _reconcile_stale_running_session(
-        self,
-        session_id: str,
-        data: dict,
-    ) -> dict:
-        if data.get("status") != SessionStatus.RUNNING:
-            return data
-
-        if is_break_phase_active(data):
-            return data
+        for record in await self._history_service.get_session_records(missing_session_ids):
+            try:
+                statuses[record.session_id] = build_status_from_history(record)
+            except Exception:
+                continue
 
-        started_at = data.get("started_at")
-        duration_minutes = data.get("duration_minutes")
-        if not isinstance(started_at, int | float) or not isinstance(duration_minutes, int | float):
-            return data
+        return EmulationStatusBatchResponse(
+            statuses={
+                session_id: statuses[session_id]
+                for session_id in unique_session_ids
+                if session_id in statuses
+            }
+        )
 
+    async def _reconcile_stale_running_sessions(
+        self,
+        payloads: dict[str, dict | None],
+    ) -> dict[str, dict]:
         now_ts = datetime.datetime.now(datetime.UTC).timestamp()
-        runtime_grace_seconds = 60
-        if (started_at + (float(duration_minutes) * 60.0) + runtime_grace_seconds) > now_ts:
-            return data
-
-        last_activity_at = last_activity_timestamp(data)
-        if (now_ts - last_activity_at) <= 60:
-            return data
-
-        if await self._session_store.is_run_lock_active(session_id) and (now_ts - last_activity_at) <= 90:
-            return data
+        candidates = {
+            session_id: data
+            for session_id, data in payloads.items()
+            if data is not None and is_past_expected_runtime(data, now_ts)
+        }
+        if not candidates:
+            return {}
+
+        # A run lock is refreshed by its worker for as long as the run is
+        # alive, so a session holding one is never failed here; a dead
+        # worker's lock expires and the next pass picks the session up.
+        locked_session_ids = await self._session_store.get_active_run_locks(list(candidates))
+        stale = {
+            session_id: data
+            for session_id, data in candidates.items()
+            if session_id not in locked_session_ids
+        }
+        if not stale:
+            return {}
 
         error = (
             "Session stale: no recent progress after expected runtime window; "
             "marked as failed during status reconciliation"
         )
         finished_at = now_ts
+        await asyncio.gather(
+            *(
+                self._fail_stale_live_session(session_id, data, finished_at, error)
+                for session_id, data in stale.items()
+            )
+        )
+
+        refreshed = await self._session_store.get_many(list(stale))
+        live_payloads: dict[str, dict] = {}
+        for session_id, data in stale.items():
+            live_payload = refreshed.get(session_id) or {**data}
+            live_payload["status"] = SessionStatus.FAILED
+            live_payload["finished_at"] = finished_at
+            live_payload["current_watch"] = None
+            live_payload["error"] = error
+            live_payloads[session_id] = live_payload
+        await self._history_service.mark_stale_failed_many(live_payloads, error)
+        return live_payloads
+
+    async def _fail_stale_live_session(
+        self,
+        session_id: str,
+        data: dict,
+        finished_at: float,
+        error: str,
+    ) -> None:
         await self._session_store.update(
             session_id,
             status=SessionStatus.FAILED,
@@ -297,13 +362,6 @@ class EmulationSessionService:
             session_id,
             profile_id=normalize_profile_id(data.get("profile_id")),
         )
-        live_payload = await self._session_store.get(session_id) or {**data}
-        live_payload["status"] = SessionStatus.FAILED
-        live_payload["finished_at"] = finished_at
-        live_payload["current_watch"] = None
-        live_payload["error"] = error
-        await self._history_service.mark_stale_failed(session_id, live_payload, error)
-        return live_payload
 
     @staticmethod
     def _calculate_remaining_minutes(
@@ -322,11 +380,9 @@ class EmulationSessionService:
         self,
         params: EmulationHistoryParams,
     ) -> EmulationHistoryResponse:
-        await self._reconcile_stale_history_records()
         return await self._history_service.get_history(params)
 
     async def get_dashboard_summary(self) -> EmulationDashboardSummaryResponse:
-        await self._reconcile_stale_history_records()
         return await self._history_service.get_dashboard_summary()
 
     async def get_session_detail(
@@ -335,12 +391,15 @@ class EmulationSessionService:
         *,
         include_raw_ads: bool,
         include_captures: bool,
+        items_offset: int = 0,
+        items_limit: int | None = None,
     ) -> EmulationHistoryDetailResponse:
-        await self._reconcile_stale_history_records(session_id=session_id)
         detail = await self._history_service.get_session_detail(
             session_id=session_id,
             include_raw_ads=include_raw_ads,
             include_captures=include_captures,
+            items_offset=items_offset,
+            items_limit=items_limit,
         )
         if detail.status == SessionStatus.FAILED and not detail.error:
             live_payload = await self._session_store.get(session_id)
@@ -349,52 +408,59 @@ class EmulationSessionService:
                 detail = detail.model_copy(update={"error": live_error})
         return detail
 
-    async def _reconcile_stale_history_records(self, session_id: str | None = None) -> None:
-        if session_id:
-            record = await self._history_service.get_session_record(session_id)
-            if record and record.status in (SessionStatus.QUEUED, SessionStatus.RUNNING):
-                await self._reconcile_stale_history_record(record)
-            return
+    async def reconcile_stale_sessions(self) -> int:
+        reconciled = 0
+        # Live sessions heartbeat into the active index, so only the ones that
+        # have gone quiet need their payloads read.
+        now_ts = datetime.datetime.now(datetime.UTC).timestamp()
+        quiet_session_ids = await self._session_store.get_active_session_ids(
+            heartbeat_before=now_ts - 60,
+        )
+        for offset in range(0, len(quiet_session_ids), STALE_RECONCILE_BATCH_SIZE):
+            batch = quiet_session_ids[offset : offset + STALE_RECONCILE_BATCH_SIZE]
+            payloads = await self._session_store.get_many(batch)
+            await self._session_store.remove_from_active_index(
+                [session_id for session_id, data in payloads.items() if data is None]
+            )
+            reconciled += len(await self._reconcile_stale_running_sessions(payloads))
 
         records = await self._history_service.get_active_session_records()
-        for record in records:
-            await self._reconcile_stale_history_record(record)
-
-    async def _reconcile_stale_history_record(
-        self,
-        record: EmulationSessionHistory,
-    ) -> None:
-        if record.status not in (SessionStatus.QUEUED, SessionStatus.RUNNING):
-            return
-
-        live_payload = await self._session_store.get(record.session_id)
-        if live_payload is not None:
-            if record.status == SessionStatus.RUNNING:
-                await self._reconcile_stale_running_session(record.session_id, live_payload)
-            return
+        if not records:
+            return reconciled
+        indexed_session_ids = set(await self._session_store.get_active_session_ids())
+        unindexed = [record for record in records if record.session_id not in indexed_session_ids]
+        for offset in range(0, len(unindexed), STALE_RECONCILE_BATCH_SIZE):
+            batch = unindexed[offset : offset + STALE_RECONCILE_BATCH_SIZE]
+            live_session_ids = await self._session_store.get_existing_session_ids(
+                [record.session_id for record in batch]
+            )
+            errors = {
+                record.session_id: error
+                for record in batch
+                if record.session_id not in live_session_ids
+                and (error := self._stale_error_without_live_state(record)) is not None
+            }
+            await self._history_service.mark_history_stale_failed_many(errors)
+            reconciled += len(errors)
+        return reconciled
 
+    @staticmethod
+    def _stale_error_without_live_state(record: EmulationSessionHistory) -> str | None:
         now = datetime.datetime.now(datetime.UTC)
-        error: str | None = None
-
         if record.status == SessionStatus.QUEUED:
             if (now - record.queued_at) > datetime.timedelta(hours=1):
-                error = "Session stale: queued session did not start within expected time window"
+                return "Session stale: queued session did not start within expected time window"
         elif record.status == SessionStatus.RUNNING and record.started_at is not None:
             expected_end = record.started_at + datetime.timedelta(
                 minutes=record.requested_duration_minutes,
             )
             grace = datetime.timedelta(minutes=5)
             if now > (expected_end + grace):
-                error = (
+                return (
                     "Session stale: running session exceeded expected runtime window "
                     "without live state"
                 )
-
-        if error:
-            await self._history_service.mark_history_stale_failed(
-                session_id=record.session_id,
-                error=error,
-            )
+        return None
 
 
 class EmulationHistoryService:
@@ -424,23 +490,44 @@ class EmulationHistoryService:
         await self.uow.commit()
 
     async def get_session_record(self, session_id: str) -> EmulationSessionHistory | None:
-        return await self.uow.emulation_history.get_by_session_id(session_id)
+        record = await self.uow.emulation_history.get_by_session_id(session_id)
+        if record is not None:
+            await self.uow.emulation_history.load_watched_items([record])
+        return record
 
     async def get_active_session_records(self) -> list[EmulationSessionHistory]:
         return await self.uow.emulation_history.get_by_statuses([SessionStatus.QUEUED, SessionStatus.RUNNING])
 
-    async def mark_stale_failed(
+    async def get_session_records(
         self,
-        session_id: str,
-        live_payload: dict,
+        session_ids: list[str],
+    ) -> list[EmulationSessionHistory]:
+        records = await self.uow.emulation_history.get_by_session_ids(session_ids)
+        await self.uow.emulation_history.load_watched_items(records)
+        return records
+
+    async def mark_stale_failed_many(
+        self,
+        live_payloads: dict[str, dict],
         error: str,
     ) -> None:
-        await self._update_terminal_from_live_payload(
-            session_id=session_id,
-            status=SessionStatus.FAILED,
-            live_payload=live_payload,
-            error=error,
+        await self.uow.emulation_history.update_sessions(
+            {
+                session_id: self._terminal_fields_from_live_payload(
+                    SessionStatus.FAILED,
+                    live_payload,
+                    error,
+                )
+                for session_id, live_payload in live_payloads.items()
+            }
         )
+        await self.uow.emulation_history.save_watched_items(
+            {
+                session_id: self._watched_items_from_live_payload(live_payload)
+                for session_id, live_payload in live_payloads.items()
+            }
+        )
+        await self.uow.commit()
 
     async def mark_stopped(
         self,
@@ -454,57 +541,76 @@ class EmulationHistoryService:
             error="Stopped by user",
         )
 
-    async def mark_history_stale_failed(
+    async def mark_history_stale_failed_many(self, errors: dict[str, str]) -> None:
+        if not errors:
+            return
+        finished_at = datetime.datetime.now(datetime.UTC)
+        await self.uow.emulation_history.update_sessions(
+            {
+                session_id: {
+                    "status": SessionStatus.FAILED,
+                    "finished_at": finished_at,
+                    "error": error,
+                }
+                for session_id, error in errors.items()
+            }
+        )
+        await self.uow.commit()
+
+    async def _update_terminal_from_live_payload(
         self,
         *,
         session_id: str,
+        status: str,
+        live_payload: dict,
         error: str,
     ) -> None:
         await self.uow.emulation_history.update_session(
             session_id,
-            status=SessionStatus.FAILED,
-            finished_at=datetime.datetime.now(datetime.UTC),
-            error=error,
+            **self._terminal_fields_from_live_payload(status, live_payload, error),
+        )
+        await self.uow.emulation_history.save_watched_items(
+            {session_id: self._watched_items_from_live_payload(live_payload)}
         )
         await self.uow.commit()
 
-    async def _update_terminal_from_live_payload(
-        self,
-        *,
-        session_id: str,
+    @staticmethod
+    def _terminal_fields_from_live_payload(
         status: str,
         live_payload: dict,
         error: str,
-    ) -> None:
+    ) -> dict[str, object]:
         watched_videos = live_payload.get("watched_videos") or []
         videos_watched, watched_videos_count = derive_watched_video_counters(
             watched_videos,
             fallback_completed=int(live_payload.get("videos_watched") or 0),
             fallback_total=int(live_payload.get("watched_videos_count") or 0),
         )
-        watched_ads = live_payload.get("watched_ads") or []
-        await self.uow.emulation_history.update_session(
-            session_id,
-            status=status,
-            started_at=to_utc_datetime(live_payload.get("started_at")),
-            finished_at=datetime.datetime.now(datetime.UTC),
-            mode=live_payload.get("mode"),
-            fatigue=live_payload.get("fatigue"),
-            current_topic=live_payload.get("current_topic"),
-            personality=live_payload.get("personality"),
-            bytes_downloaded=int(live_payload.get("bytes_downloaded") or 0),
-            total_duration_seconds=int(live_payload.get("total_duration_seconds") or 0),
-            videos_watched=videos_watched,
-            watched_videos_count=watched_videos_count,
-            watched_ads_count=int(live_payload.get("watched_ads_count") or 0),
-            topics_searched=live_payload.get("topics_searched") or [],
-            watched_videos=watched_videos,
-            watched_ads=watched_ads,
-            watched_ads_analytics=live_payload.get("watched_ads_analytics")
-            or build_ads_analytics(watched_ads),
-            error=error,
+        return {
+            "status": status,
+            "started_at": to_utc_datetime(live_payload.get("started_at")),
+            "finished_at": datetime.datetime.now(datetime.UTC),
+            "mode": live_payload.get("mode"),
+            "fatigue": live_payload.get("fatigue"),
+            "current_topic": live_payload.get("current_topic"),
+            "personality": live_payload.get("personality"),
+            "bytes_downloaded": int(live_payload.get("bytes_downloaded") or 0),
+            "total_duration_seconds": int(live_payload.get("total_duration_seconds") or 0),
+            "videos_watched": videos_watched,
+            "watched_videos_count": watched_videos_count,
+            "watched_ads_count": int(live_payload.get("watched_ads_count") or 0),
+            "topics_searched": live_payload.get("topics_searched") or [],
+            "error": error,
+        }
+
+    @staticmethod
+    def _watched_items_from_live_payload(
+        live_payload: dict,
+    ) -> tuple[list[dict], list[dict]]:
+        return (
+            live_payload.get("watched_videos") or [],
+            live_payload.get("watched_ads") or [],
         )
-        await self.uow.commit()
 
     async def delete_session(self, session_id: str) -> None:
         history = await self.uow.emulation_history.get_by_session_id(session_id)
@@ -515,7 +621,9 @@ class EmulationHistoryService:
                 status_code=409,
                 detail=f"Cannot delete session with status '{history.status}'",
             )
+        days = await self.uow.dashboard_rollups.get_session_days(session_id)
         await self.uow.emulation_history.delete_session(session_id)
+        await self.uow.dashboard_rollups.rebuild(sorted(days))
         await self.uow.commit()
 
     async def get_session_captures(
@@ -533,6 +641,27 @@ class EmulationHistoryService:
             captures=captures,
         )
 
+    async def search_captures(
+        self,
+        params: EmulationCaptureSearchParams,
+    ) -> EmulationCaptureSearchResponse:
+        after = decode_capture_cursor(params.cursor) if params.cursor else None
+        captures = await self.uow.ad_captures.search(
+            params.q,
+            limit=params.limit + 1,
+            after=after,
+            advertiser_domain=params.advertiser_domain,
+            analysis_status=params.analysis_status,
+        )
+        next_cursor = None
+        if len(captures) > params.limit:
+            captures = captures[: params.limit]
+            next_cursor = encode_capture_cursor(captures[-1].created_at, captures[-1].id)
+        return EmulationCaptureSearchResponse(
+            items=[map_capture_search_item(capture) for capture in captures],
+            next_cursor=next_cursor,
+        )
+
     async def get_history(
         self,
         params: EmulationHistoryParams,
@@ -552,12 +681,34 @@ class EmulationHistoryService:
             finished_from=params.finished_from,
             finished_to=params.finished_to,
         )
-        total = await self.uow.emulation_history.get_total_count(query)
+        after = decode_history_cursor(params.cursor) if params.cursor else None
         rows = await self.uow.emulation_history.get_history(
             query=query,
-            limit=params.page_size,
+            limit=params.page_size + 1,
             offset=params.offset,
+            after=after,
         )
+        has_more = len(rows) > params.page_size
+        rows = rows[: params.page_size]
+        next_cursor = (
+            encode_history_cursor(rows[-1].session.queued_at, rows[-1].session.session_id)
+            if has_more
+            else None
+        )
+
+        total_is_estimate = params.approximate_total
+        if total_is_estimate:
+            # Rows known so far, plus one when another page exists, so has_next holds.
+            seen = (0 if after is not None else params.offset) + len(rows) + int(has_more)
+            estimate = await self.uow.emulation_history.get_estimated_total_count(query)
+            total = max(seen, estimate or 0)
+        else:
+            total = await self.uow.emulation_history.get_total_count(query)
+
+        if params.include_details:
+            await self.uow.emulation_history.load_watched_items(
+                [row.session for row in rows]
+            )
 
         captures_by_session: dict[str, list[EmulationAdCaptureHistory]] = {}
         if params.include_captures and rows:
@@ -594,12 +745,28 @@ class EmulationHistoryService:
             total=total,
             page=params.page,
             page_size=params.page_size,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate,
         )
 
+    async def refresh_dashboard_rollups(self) -> int:
+        # Recomputes days that were still open on the previous run, days that
+        # are open now, and today; closed days never change again.
+        now = datetime.datetime.now(datetime.UTC)
+        open_days = await self.uow.dashboard_rollups.get_open_days(
+            now - DASHBOARD_ROLLUP_GRACE
+        )
+        stored_days = await self.uow.dashboard_rollups.get_stored_open_days()
+        days = sorted(open_days | stored_days | {now.date()})
+        await self.uow.dashboard_rollups.rebuild(days)
+        await self.uow.dashboard_rollups.replace_stored_open_days(open_days)
+        await self.uow.commit()
+        return len(days)
+
     async def get_dashboard_summary(self) -> EmulationDashboardSummaryResponse:
-        base = await self.uow.emulation_history.get_dashboard_base_summary()
-        capture_summary = await self.uow.emulation_history.get_dashboard_capture_summary()
-        top_topics = await self.uow.emulation_history.get_top_requested_topics()
+        base = await self.uow.dashboard_rollups.get_session_summary()
+        capture_summary = await self.uow.dashboard_rollups.get_capture_summary()
+        top_topics = await self.uow.dashboard_rollups.get_top_requested_topics()
 
         total_sessions = base["total_sessions"]
         avg_videos_per_session = (
@@ -639,10 +806,13 @@ class EmulationHistoryService:
         session_id: str,
         include_raw_ads: bool,
         include_captures: bool,
+        items_offset: int = 0,
+        items_limit: int | None = None,
     ) -> EmulationHistoryDetailResponse:
         payload = await self.uow.emulation_history.get_by_session_id(session_id)
         if payload is None:
             raise HTTPException(status_code=404, detail="Session history not found")
+        watched_items = await self._get_watched_items_page(payload, items_offset, items_limit)
 
         captures = []
         if include_captures:
@@ -664,9 +834,30 @@ class EmulationHistoryService:
                 include_details=True,
                 include_raw_ads=include_raw_ads,
                 ad_captures=captures if include_captures else None,
+                watched_items=watched_items,
             ).model_dump()
         )
 
+    async def _get_watched_items_page(
+        self,
+        payload: EmulationSessionHistory,
+        offset: int,
+        limit: int | None,
+    ) -> tuple[list[dict], list[dict]]:
+        gateway = self.uow.emulation_history
+        videos_total, ads_total = await gateway.count_watched_items(payload.session_id)
+        end = offset + limit if limit is not None else None
+        # Sessions not yet backfilled into the child tables page their JSONB lists.
+        if videos_total:
+            videos = await gateway.get_watched_videos(payload.session_id, offset, limit)
+        else:
+            videos = (payload.watched_videos or [])[offset:end]
+        if ads_total:
+            ads = await gateway.get_watched_ads(payload.session_id, offset, limit)
+        else:
+            ads = (payload.watched_ads or [])[offset:end]
+        return videos, ads
+
     def _map_history_item(
         self,
         payload: EmulationSessionHistory,
@@ -674,11 +865,20 @@ class EmulationHistoryService:
         include_details: bool,
         include_raw_ads: bool,
         ad_captures: list[EmulationAdCaptureHistory] | None,
+        watched_items: tuple[list[dict], list[dict]] | None = None,
     ) -> EmulationHistoryItem:
-        watched_videos = payload.watched_videos if include_details else None
-        watched_ads_analytics = payload.watched_ads_analytics if include_details else None
+        # A detail page passes one page of items; counters still cover the whole session.
+        if watched_items is not None:
+            page_videos, page_ads = watched_items
+            page_ads_analytics = build_ads_analytics(page_ads)
+        else:
+            page_videos = payload.watched_videos or []
+            page_ads = payload.watched_ads or []
+            page_ads_analytics = payload.watched_ads_analytics or build_ads_analytics(page_ads)
+        watched_videos = page_videos if include_details else None
+        watched_ads_analytics = page_ads_analytics if include_details else None
         watched_ads = (
-            normalize_watched_ads_payload(payload.watched_ads)
+            normalize_watched_ads_payload(page_ads)
             if (include_details and include_raw_ads)
             else None
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import datetime
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TypedDict
@@ -8,6 +7,7 @@ from typing import TypedDict
 from app.services.emulation.common import derive_watched_video_counters
 from app.services.emulation.core.ad_analytics import build_ads_analytics
 from app.services.emulation.session.bootstrap import sanitize_watched_ads
+from app.services.emulation.session.events import SessionEventSubscription
 
 from ..models import EmulationSessionHistory, PostProcessingStatus, SessionStatus
 from ..schema import EmulationSessionStatus
@@ -141,6 +141,21 @@ def build_status_response(
     )
 
 
+def build_status_from_history(history: EmulationSessionHistory) -> EmulationSessionStatus:
+    seed = build_resume_seed_from_history(history)
+    return build_status_response(
+        history.session_id,
+        {
+            **seed,
+            "status": history.status,
+            "topics": history.requested_topics or [],
+            "started_at": history.started_at.timestamp() if history.started_at else None,
+            "finished_at": history.finished_at.timestamp() if history.finished_at else None,
+            "error": history.error,
+        },
+    )
+
+
 def should_stream_continue(status: EmulationSessionStatus) -> bool:
     if status.status in {SessionStatus.QUEUED, SessionStatus.RUNNING, SessionStatus.STOPPING}:
         return True
@@ -153,23 +168,30 @@ def should_stream_continue(status: EmulationSessionStatus) -> bool:
 async def stream_status_events(
     *,
     initial_status: EmulationSessionStatus,
-    get_status: Callable[[], Awaitable[EmulationSessionStatus]],
+    get_status: Callable[[dict | None], Awaitable[EmulationSessionStatus]],
     is_disconnected: Callable[[], Awaitable[bool]],
-    poll_interval_seconds: float = 2.0,
+    subscription: SessionEventSubscription,
+    idle_timeout_seconds: float = 15.0,
 ) -> AsyncIterator[str]:
     current_status = initial_status
+    last_sent: str | None = None
 
     while True:
         if await is_disconnected():
             break
 
-        yield f"event: status\ndata: {current_status.model_dump_json()}\n\n"
+        status_json = current_status.model_dump_json()
+        if status_json != last_sent:
+            yield f"event: status\ndata: {status_json}\n\n"
+            last_sent = status_json
+        else:
+            yield ": keep-alive\n\n"
 
         if not should_stream_continue(current_status):
             break
 
-        await asyncio.sleep(poll_interval_seconds)
-        current_status = await get_status()
+        payload = await subscription.next_payload(idle_timeout_seconds)
+        current_status = await get_status(payload)
 
 
 def last_activity_timestamp(data: dict[str, object]) -> float:
@@ -215,6 +237,21 @@ def last_activity_timestamp(data: dict[str, object]) -> float:
     ).timestamp()
 
 
+def is_past_expected_runtime(data: dict[str, object], now_ts: float) -> bool:
+    if data.get("status") != SessionStatus.RUNNING or is_break_phase_active(data):
+        return False
+
+    started_at = data.get("started_at")
+    duration_minutes = data.get("duration_minutes")
+    if not isinstance(started_at, int | float) or not isinstance(duration_minutes, int | float):
+        return False
+
+    runtime_grace_seconds = 60
+    if (started_at + (float(duration_minutes) * 60.0) + runtime_grace_seconds) > now_ts:
+        return False
+    return (now_ts - last_activity_timestamp(data)) > 60
+
+
 def elapsed_minutes_from_live_payload(data: dict[str, object]) -> float:
     started_at = data.get("started_at")
     if isinstance(started_at, int | float):
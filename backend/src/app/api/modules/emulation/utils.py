@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import datetime
 import json
 import time
+import uuid
 from pathlib import Path
 
 from fastapi import HTTPException
@@ -22,6 +25,7 @@ from .models import (
 from .schema import (
     EmulationAdCaptureHistory,
     EmulationAdCaptureScreenshotPath,
+    EmulationCaptureSearchItem,
     EmulationCaptureSummary,
     EmulationPostProcessingProgress,
 )
@@ -54,6 +58,40 @@ def resolve_media_path(media_path: str) -> Path:
     return candidate
 
 
+def _encode_keyset_cursor(timestamp: datetime.datetime, key: str) -> str:
+    raw = json.dumps([timestamp.isoformat(), key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_keyset_cursor(cursor: str) -> tuple[datetime.datetime, str]:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    timestamp, key = json.loads(raw)
+    return datetime.datetime.fromisoformat(timestamp), str(key)
+
+
+def encode_history_cursor(queued_at: datetime.datetime, session_id: str) -> str:
+    return _encode_keyset_cursor(queued_at, session_id)
+
+
+def decode_history_cursor(cursor: str) -> tuple[datetime.datetime, str]:
+    try:
+        return _decode_keyset_cursor(cursor)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid history cursor") from exc
+
+
+def encode_capture_cursor(created_at: datetime.datetime, capture_id: uuid.UUID) -> str:
+    return _encode_keyset_cursor(created_at, str(capture_id))
+
+
+def decode_capture_cursor(cursor: str) -> tuple[datetime.datetime, uuid.UUID]:
+    try:
+        created_at, capture_id = _decode_keyset_cursor(cursor)
+        return created_at, uuid.UUID(capture_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid capture cursor") from exc
+
+
 def calculate_history_elapsed_minutes(payload: EmulationSessionHistory) -> float | None:
     if not payload.started_at:
         return None
@@ -205,8 +243,10 @@ def map_ad_capture(capture: AdCapture) -> EmulationAdCaptureHistory:
         ad_position=capture.ad_position,
         advertiser_domain=capture.advertiser_domain,
         cta_href=capture.cta_href,
+        cta_text=capture.cta_text,
         display_url=capture.display_url,
         headline_text=capture.headline_text,
+        description_text=capture.description_text,
         ad_duration_seconds=capture.ad_duration_seconds,
         landing_url=None if hide_media else capture.landing_url,
         landing_dir=None if hide_media else capture.landing_dir,
@@ -218,3 +258,12 @@ def map_ad_capture(capture: AdCapture) -> EmulationAdCaptureHistory:
         analysis_summary=_parse_analysis_summary(capture.analysis_summary),
         screenshot_paths=screenshot_paths,
     )
+
+
+def map_capture_search_item(capture: AdCapture) -> EmulationCaptureSearchItem:
+    return EmulationCaptureSearchItem(
+        **map_ad_capture(capture).model_dump(),
+        id=capture.id,
+        session_id=capture.session_id,
+        created_at=capture.created_at,
+    )
@@ -5,13 +5,43 @@ from contextlib import asynccontextmanager
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import REGISTRY
 from prometheus_fastapi_instrumentator import Instrumentator
+from redis import Redis
 
 from app.api import register_routers
+from app.api.modules.emulation.service import (
+    STALE_RECONCILER_METRICS,
+    STALE_RECONCILER_METRICS_GROUP,
+)
 from app.ioc import get_async_container
+from app.services.emulation.session.progress_writer import (
+    PROGRESS_WRITER_METRICS,
+    PROGRESS_WRITER_METRICS_GROUP,
+)
 from app.services.logging import setup_logging
+from app.services.metrics import (
+    SHARED_METRICS_REDIS_TIMEOUT_S,
+    MetricGroup,
+    SharedMetricsCollector,
+)
 from app.settings import get_config
 
+_SHARED_METRIC_GROUPS: dict[str, MetricGroup] = {
+    PROGRESS_WRITER_METRICS_GROUP: PROGRESS_WRITER_METRICS,
+    STALE_RECONCILER_METRICS_GROUP: STALE_RECONCILER_METRICS,
+}
+
+try:
+    from app.services.emulation.ads.analysis.cache import (
+        AD_ANALYSIS_CACHE_METRICS,
+        AD_ANALYSIS_CACHE_METRICS_GROUP,
+    )
+
+    _SHARED_METRIC_GROUPS[AD_ANALYSIS_CACHE_METRICS_GROUP] = AD_ANALYSIS_CACHE_METRICS
+except ModuleNotFoundError:
+    pass
+
 config = get_config()
 setup_logging(config.env)
 logger = logging.getLogger(__name__)
@@ -56,5 +86,15 @@ def get_production_app() -> FastAPI:
 
     instrumentator = Instrumentator()
     instrumentator.instrument(app).expose(app)
+    REGISTRY.register(
+        SharedMetricsCollector(
+            Redis.from_url(
+                config.redis_url,
+                socket_timeout=SHARED_METRICS_REDIS_TIMEOUT_S,
+                socket_connect_timeout=SHARED_METRICS_REDIS_TIMEOUT_S,
+            ),
+            _SHARED_METRIC_GROUPS,
+        )
+    )
 
     return app
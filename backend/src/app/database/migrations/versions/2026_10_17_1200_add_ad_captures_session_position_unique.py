@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "b8c2d4e6f1a3"
+down_revision: str | None = "f1a4b6c7d8e9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep the earliest capture per (session_id, ad_position); screenshots of
+    # the removed duplicates go with them through the FK cascade.
+    op.execute(
+        """
+        DELETE FROM ad_captures AS duplicate
+        USING ad_captures AS kept
+        WHERE duplicate.session_id = kept.session_id
+          AND duplicate.ad_position = kept.ad_position
+          AND (duplicate.created_at, duplicate.id) > (kept.created_at, kept.id)
+        """
+    )
+    op.create_unique_constraint(
+        "ad_captures_session_id_ad_position_ukey",
+        "ad_captures",
+        ["session_id", "ad_position"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ad_captures_session_id_ad_position_ukey",
+        "ad_captures",
+        type_="unique",
+    )
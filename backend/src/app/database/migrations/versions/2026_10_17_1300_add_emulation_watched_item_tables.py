@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c3e5a7f9b1d2"
+down_revision: str | None = "b8c2d4e6f1a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = (
+    ("emulation_watched_videos", "watched_videos"),
+    ("emulation_watched_ads", "watched_ads"),
+)
+
+
+def upgrade() -> None:
+    for table_name, source_column in _TABLES:
+        op.create_table(
+            table_name,
+            sa.Column("session_id", sa.String(length=64), nullable=False),
+            sa.Column("item_index", sa.Integer(), nullable=False),
+            sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+            sa.Column("id", sa.UUID(), server_default=sa.text("uuidv7()"), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+                nullable=False,
+            ),
+            sa.ForeignKeyConstraint(
+                ["session_id"],
+                ["emulation_sessions.session_id"],
+                name=op.f(f"{table_name}_session_id_fkey"),
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("id", name=op.f(f"{table_name}_pkey")),
+            sa.UniqueConstraint(
+                "session_id",
+                "item_index",
+                name=op.f(f"{table_name}_session_id_item_index_ukey"),
+            ),
+        )
+        # The JSONB columns are kept, so readers fall back to them for any
+        # session without child rows and a downgrade loses nothing.
+        op.execute(
+            f"""
+            INSERT INTO {table_name} (session_id, item_index, payload)
+            SELECT s.session_id, item.ordinality - 1, item.value
+            FROM emulation_sessions AS s
+            CROSS JOIN LATERAL jsonb_array_elements(s.{source_column})
+                WITH ORDINALITY AS item(value, ordinality)
+            WHERE jsonb_typeof(s.{source_column}) = 'array'
+              AND jsonb_typeof(item.value) = 'object'
+            """
+        )
+
+
+def downgrade() -> None:
+    for table_name, _ in reversed(_TABLES):
+        op.drop_table(table_name)
@@ -0,0 +1,29 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "d4f6b8a0c2e3"
+down_revision: str | None = "c3e5a7f9b1d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The composite index also serves plain queued_at range filters.
+    op.create_index(
+        "emulation_sessions_queued_at_session_id_idx",
+        "emulation_sessions",
+        ["queued_at", "session_id"],
+        unique=False,
+    )
+    op.drop_index(op.f("emulation_sessions_queued_at_idx"), table_name="emulation_sessions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("emulation_sessions_queued_at_idx"),
+        "emulation_sessions",
+        ["queued_at"],
+        unique=False,
+    )
+    op.drop_index("emulation_sessions_queued_at_session_id_idx", table_name="emulation_sessions")
@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e5a7c9b1d3f4"
+down_revision: str | None = "d4f6b8a0c2e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "emulation_sessions",
+        sa.Column(
+            "topics_search_text",
+            sa.Text(),
+            sa.Computed(
+                "lower(requested_topics::text || ' ' || topics_searched::text)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "emulation_sessions_topics_search_text_trgm_idx",
+        "emulation_sessions",
+        ["topics_search_text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"topics_search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # pg_trgm stays installed; other objects in the database may depend on it.
+    op.drop_index(
+        "emulation_sessions_topics_search_text_trgm_idx",
+        table_name="emulation_sessions",
+    )
+    op.drop_column("emulation_sessions", "topics_search_text")
@@ -0,0 +1,106 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f6b8d0c2e4a5"
+down_revision: str | None = "e5a7c9b1d3f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _counter(name: str, type_: sa.types.TypeEngine | None = None) -> sa.Column:
+    return sa.Column(name, type_ or sa.Integer(), nullable=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_session_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        _counter("sessions"),
+        _counter("videos_watched", sa.BigInteger()),
+        _counter("ads_watched", sa.BigInteger()),
+        sa.PrimaryKeyConstraint("day", "status", name=op.f("dashboard_session_rollups_pkey")),
+    )
+    op.create_table(
+        "dashboard_topic_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("topic", sa.Text(), nullable=False),
+        _counter("sessions"),
+        sa.PrimaryKeyConstraint("day", "topic", name=op.f("dashboard_topic_rollups_pkey")),
+    )
+    op.create_table(
+        "dashboard_capture_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("advertiser_domain", sa.String(length=255), nullable=False),
+        _counter("captures"),
+        _counter("video_captures"),
+        _counter("screenshot_fallbacks"),
+        _counter("landing_completed"),
+        _counter("relevant"),
+        _counter("not_relevant"),
+        sa.PrimaryKeyConstraint(
+            "day", "advertiser_domain", name=op.f("dashboard_capture_rollups_pkey")
+        ),
+    )
+    op.create_table(
+        "dashboard_rollup_open_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("day", name=op.f("dashboard_rollup_open_days_pkey")),
+    )
+
+    # Initial fill over all history; the periodic refresh keeps it current and
+    # `rebuild_dashboard_rollups` recomputes it from scratch.
+    op.execute(
+        """
+        INSERT INTO dashboard_session_rollups (day, status, sessions, videos_watched, ads_watched)
+        SELECT (timezone('UTC', queued_at))::date, status, count(*),
+               coalesce(sum(videos_watched), 0), coalesce(sum(watched_ads_count), 0)
+        FROM emulation_sessions
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        r"""
+        INSERT INTO dashboard_topic_rollups (day, topic, sessions)
+        SELECT day, topic, count(*)
+        FROM (
+            SELECT (timezone('UTC', s.queued_at))::date AS day,
+                   btrim(item.value #>> '{}', E' \t\n\r\f\v') AS topic
+            FROM emulation_sessions AS s
+            CROSS JOIN LATERAL jsonb_array_elements(
+                CASE WHEN jsonb_typeof(s.requested_topics) = 'array'
+                     THEN s.requested_topics ELSE '[]'::jsonb END
+            ) AS item(value)
+            WHERE jsonb_typeof(item.value) = 'string'
+        ) AS topics
+        WHERE topic <> ''
+        GROUP BY day, topic
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO dashboard_capture_rollups (
+            day, advertiser_domain, captures, video_captures, screenshot_fallbacks,
+            landing_completed, relevant, not_relevant
+        )
+        SELECT (timezone('UTC', created_at))::date,
+               coalesce(nullif(btrim(advertiser_domain), ''), 'unknown'),
+               count(*),
+               count(*) FILTER (WHERE video_status = 'completed'),
+               count(*) FILTER (WHERE video_status = 'fallback_screenshots'),
+               count(*) FILTER (WHERE landing_status = 'completed'),
+               count(*) FILTER (WHERE analysis_status = 'completed'),
+               count(*) FILTER (WHERE analysis_status = 'not_relevant')
+        FROM ad_captures
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_rollup_open_days")
+    op.drop_table("dashboard_capture_rollups")
+    op.drop_table("dashboard_topic_rollups")
+    op.drop_table("dashboard_session_rollups")
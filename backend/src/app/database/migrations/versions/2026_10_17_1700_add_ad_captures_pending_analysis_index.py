@@ -0,0 +1,23 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a7c9e1d3f5b6"
+down_revision: str | None = "f6b8d0c2e4a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ad_captures_session_id_pending_analysis_idx",
+        "ad_captures",
+        ["session_id"],
+        unique=False,
+        postgresql_where=sa.text("analysis_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ad_captures_session_id_pending_analysis_idx", table_name="ad_captures")
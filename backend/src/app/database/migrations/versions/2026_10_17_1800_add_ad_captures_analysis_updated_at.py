@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b8d0f2a4c6e7"
+down_revision: str | None = "a7c9e1d3f5b6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ad_captures",
+        sa.Column("analysis_updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE ad_captures SET analysis_updated_at = updated_at "
+        "WHERE analysis_status <> 'pending'"
+    )
+    op.create_index(
+        "ad_captures_session_id_analysis_updated_at_idx",
+        "ad_captures",
+        ["session_id", "analysis_updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ad_captures_session_id_analysis_updated_at_idx", table_name="ad_captures")
+    op.drop_column("ad_captures", "analysis_updated_at")
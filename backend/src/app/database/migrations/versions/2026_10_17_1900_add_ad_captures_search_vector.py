@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c9e1a3b5d7f8"
+down_revision: str | None = "b8d0f2a4c6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Advertiser and headline rank above CTA and description, then the raw text.
+_SEARCH_VECTOR = """
+setweight(to_tsvector('simple',
+    coalesce(advertiser_domain, '') || ' ' || coalesce(display_url, '') || ' '
+    || coalesce(headline_text, '')), 'A')
+|| setweight(to_tsvector('simple',
+    coalesce(cta_text, '') || ' ' || coalesce(cta_href, '') || ' '
+    || coalesce(description_text, '')), 'B')
+|| setweight(to_tsvector('simple', coalesce(full_text, '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    op.add_column("ad_captures", sa.Column("cta_text", sa.Text(), nullable=True))
+    op.add_column("ad_captures", sa.Column("description_text", sa.Text(), nullable=True))
+    op.add_column("ad_captures", sa.Column("full_text", sa.Text(), nullable=True))
+    # Earlier captures get their text from the stored watched-ad payloads.
+    op.execute(
+        """
+        UPDATE ad_captures AS c
+        SET cta_text = w.payload ->> 'cta_text',
+            description_text = w.payload ->> 'description_text',
+            full_text = w.payload ->> 'full_text'
+        FROM emulation_watched_ads AS w
+        WHERE w.session_id = c.session_id
+          AND jsonb_typeof(w.payload -> 'position') = 'number'
+          AND (w.payload ->> 'position')::numeric = c.ad_position
+        """
+    )
+    op.add_column(
+        "ad_captures",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ad_captures_search_vector_idx",
+        "ad_captures",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ad_captures_search_vector_idx", table_name="ad_captures")
+    op.drop_column("ad_captures", "search_vector")
+    op.drop_column("ad_captures", "full_text")
+    op.drop_column("ad_captures", "description_text")
+    op.drop_column("ad_captures", "cta_text")
@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d0f2b4c6e8a9"
+down_revision: str | None = "c9e1a3b5d7f8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ad_analysis_verdicts",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("prompt_version", sa.String(length=16), nullable=False),
+        sa.Column("parsed_result", sa.String(length=20), nullable=False),
+        sa.Column("analysis_status", sa.String(length=20), nullable=False),
+        sa.Column("analysis_summary", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "content_hash", "prompt_version", name=op.f("ad_analysis_verdicts_pkey"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ad_analysis_verdicts")
@@ -0,0 +1,97 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "e1a3c5d7f9b0"
+down_revision: str | None = "d0f2b4c6e8a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ad_creatives",
+        sa.Column("registry_key", sa.Text(), nullable=False),
+        sa.Column("advertiser_domain", sa.String(length=255), nullable=True),
+        sa.Column("headline_text", sa.Text(), nullable=True),
+        sa.Column("source_session_id", sa.String(length=64), nullable=False),
+        sa.Column("video_src_url", sa.Text(), nullable=True),
+        sa.Column("video_status", sa.String(length=20), nullable=False),
+        sa.Column("video_file", sa.Text(), nullable=True),
+        sa.Column("landing_url", sa.Text(), nullable=True),
+        sa.Column("landing_status", sa.String(length=20), nullable=False),
+        sa.Column("landing_dir", sa.Text(), nullable=True),
+        sa.Column("screenshot_paths", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "last_seen_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuidv7()"), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name=op.f("ad_creatives_pkey")),
+        sa.UniqueConstraint("registry_key", name=op.f("ad_creatives_registry_key_ukey")),
+    )
+    op.create_table(
+        "ad_creative_sightings",
+        sa.Column("creative_id", sa.UUID(), nullable=False),
+        sa.Column("session_id", sa.String(length=64), nullable=False),
+        sa.Column("ad_position", sa.Integer(), nullable=False),
+        sa.Column("reused", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.UUID(), server_default=sa.text("uuidv7()"), nullable=False),
+        *_timestamps(),
+        sa.ForeignKeyConstraint(
+            ["creative_id"],
+            ["ad_creatives.id"],
+            name=op.f("ad_creative_sightings_creative_id_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("ad_creative_sightings_pkey")),
+        sa.UniqueConstraint(
+            "session_id",
+            "ad_position",
+            name="ad_creative_sightings_session_id_ad_position_ukey",
+        ),
+    )
+    op.create_index(
+        op.f("ad_creative_sightings_creative_id_idx"),
+        "ad_creative_sightings",
+        ["creative_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ad_captures_video_file_idx"),
+        "ad_captures",
+        ["video_file"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ad_captures_video_file_idx"), table_name="ad_captures")
+    op.drop_index(
+        op.f("ad_creative_sightings_creative_id_idx"),
+        table_name="ad_creative_sightings",
+    )
+    op.drop_table("ad_creative_sightings")
+    op.drop_table("ad_creatives")
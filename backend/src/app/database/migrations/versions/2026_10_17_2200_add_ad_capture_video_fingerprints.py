@@ -0,0 +1,41 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f2b4d6e8a0c1"
+down_revision: str | None = "e1a3c5d7f9b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BANDS = range(4)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ad_captures",
+        sa.Column("video_content_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column("ad_captures", sa.Column("video_fingerprint", sa.Text(), nullable=True))
+    for band in _BANDS:
+        op.add_column(
+            "ad_captures",
+            sa.Column(f"video_fingerprint_band{band}", sa.Integer(), nullable=True),
+        )
+        op.create_index(
+            op.f(f"ad_captures_video_fingerprint_band{band}_idx"),
+            "ad_captures",
+            [f"video_fingerprint_band{band}"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for band in _BANDS:
+        op.drop_index(
+            op.f(f"ad_captures_video_fingerprint_band{band}_idx"),
+            table_name="ad_captures",
+        )
+        op.drop_column("ad_captures", f"video_fingerprint_band{band}")
+    op.drop_column("ad_captures", "video_fingerprint")
+    op.drop_column("ad_captures", "video_content_hash")
@@ -0,0 +1,21 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "a3c5e7f9b1d2"
+down_revision: str | None = "f2b4d6e8a0c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ad_captures_created_at_idx"),
+        "ad_captures",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ad_captures_created_at_idx"), table_name="ad_captures")
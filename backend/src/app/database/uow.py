@@ -2,20 +2,29 @@ from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.modules.emulation.gateway import AdCaptureGateway, EmulationHistoryGateway
+from app.api.modules.emulation.gateway import (
+    AdCaptureGateway,
+    AdCreativeGateway,
+    DashboardRollupGateway,
+    EmulationHistoryGateway,
+)
 from app.api.modules.users.gateway import UserGateway
 
 
 class UnitOfWork:
     users: UserGateway
     ad_captures: AdCaptureGateway
+    ad_creatives: AdCreativeGateway
     emulation_history: EmulationHistoryGateway
+    dashboard_rollups: DashboardRollupGateway
 
     def __init__(self, session: AsyncSession):
         self.session = session
         self.users = UserGateway(session)
         self.ad_captures = AdCaptureGateway(session)
+        self.ad_creatives = AdCreativeGateway(session)
         self.emulation_history = EmulationHistoryGateway(session)
+        self.dashboard_rollups = DashboardRollupGateway(session)
 
     async def __aenter__(self):
         return self
@@ -19,7 +19,9 @@ from app.services.emulation.core.capture_factory import (
 )
 from app.services.emulation.orchestration.scheduler import EmulationOrchestrationService
 from app.services.emulation.persistence import EmulationPersistenceService
+from app.services.emulation.session.events import SessionEventHub
 from app.services.emulation.session.store import EmulationSessionStore
+from app.services.metrics import SharedMetrics
 from app.settings import Config, get_config
 
 try:
@@ -30,6 +32,7 @@ try:
         ChromiumSessionProvider,
         UserAgentProvider,
     )
+    from app.services.emulation.browser.ads.registry import AdCreativeRegistry
 
     _BROWSER_AVAILABLE = True
 except ModuleNotFoundError:
@@ -37,6 +40,8 @@ except ModuleNotFoundError:
 
 try:
     from app.clients.gemini import GeminiClient
+    from app.services.emulation.ads.analysis.fingerprint import VideoFingerprinter
+    from app.services.emulation.ads.analysis.limiter import AnalysisConcurrencyLimiter
     from app.services.emulation.ads.analysis.service import AdAnalysisService
     from app.services.emulation.media_storage import LocalMediaStorage, MediaStorage
     from app.services.emulation.ads.analysis.sampler import AdAnalysisVideoSampler
@@ -127,6 +132,10 @@ if _BROWSER_AVAILABLE:
             yield provider
             await provider.stop()
 
+        @provide(scope=Scope.APP)
+        def get_ad_creative_registry(self, config: Config, redis: Redis) -> AdCreativeRegistry:
+            return AdCreativeRegistry(redis, config.storage.ad_captures_path)
+
         @provide(scope=Scope.REQUEST)
         def get_browser_service(
             self, session_provider: BrowserSessionProvider
@@ -145,6 +154,20 @@ class EmulationDIProvider(Provider):
     def get_session_store(self, redis: Redis) -> EmulationSessionStore:
         return EmulationSessionStore(redis)
 
+    @provide(scope=Scope.APP)
+    def get_shared_metrics(self, redis: Redis) -> SharedMetrics:
+        return SharedMetrics(redis)
+
+    @provide(scope=Scope.APP)
+    async def get_session_event_hub(
+        self,
+        redis: Redis,
+        session_store: EmulationSessionStore,
+    ) -> AsyncIterator[SessionEventHub]:
+        hub = SessionEventHub(redis, session_store)
+        yield hub
+        await hub.close()
+
     @provide(scope=Scope.APP)
     def get_ad_capture_factory(self) -> AdCaptureProviderFactory:
         return DefaultAdCaptureProviderFactory()
@@ -166,11 +189,29 @@ if _GEMINI_AVAILABLE:
         def get_ad_analysis_video_sampler(self) -> AdAnalysisVideoSampler:
             return AdAnalysisVideoSampler()
 
+        @provide(scope=Scope.APP)
+        def get_video_fingerprinter(self) -> VideoFingerprinter:
+            return VideoFingerprinter()
+
+        @provide(scope=Scope.APP)
+        def get_analysis_concurrency_limiter(
+            self, config: Config, redis: Redis,
+        ) -> AnalysisConcurrencyLimiter:
+            return AnalysisConcurrencyLimiter(
+                config.ad_analysis.max_concurrency,
+                redis=redis,
+                global_limit=config.ad_analysis.global_max_concurrency,
+                slot_ttl_seconds=config.ad_analysis.global_slot_ttl_seconds,
+            )
+
         @provide(scope=Scope.REQUEST)
         async def get_ad_analysis_service(
             self, gemini: GeminiClient, uow: UnitOfWork, config: Config,
             storage: MediaStorage,
             video_sampler: AdAnalysisVideoSampler,
+            limiter: AnalysisConcurrencyLimiter,
+            metrics: SharedMetrics,
+            fingerprinter: VideoFingerprinter,
         ) -> AdAnalysisService:
             return AdAnalysisService(
                 gemini,
@@ -178,6 +219,10 @@ if _GEMINI_AVAILABLE:
                 config.storage.ad_captures_path,
                 storage,
                 video_sampler,
+                config.ad_analysis,
+                limiter,
+                metrics,
+                fingerprinter,
             )
 
 
@@ -1,4 +1,11 @@
+from .fingerprint import VideoFingerprint, VideoFingerprinter
 from .sampler import AdAnalysisVideoSampler, PreparedAnalysisVideo
 from .service import AdAnalysisService
 
-__all__ = ["AdAnalysisService", "AdAnalysisVideoSampler", "PreparedAnalysisVideo"]
+__all__ = [
+    "AdAnalysisService",
+    "AdAnalysisVideoSampler",
+    "PreparedAnalysisVideo",
+    "VideoFingerprint",
+    "VideoFingerprinter",
+]
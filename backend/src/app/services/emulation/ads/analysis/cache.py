@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+from app.services.metrics import MetricGroup
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+AD_ANALYSIS_CACHE_METRICS_GROUP = "ad_analysis_verdict_cache"
+AD_ANALYSIS_CACHE_METRICS: MetricGroup = {
+    "lookups": ("counter", "Captures looked up in the analysis verdict cache."),
+    "hits": ("counter", "Captures resolved from a cached verdict."),
+    "near_duplicate_hits": ("counter", "Captures resolved from a near-identical creative's verdict."),
+    "saved_gemini_calls": ("counter", "Gemini video calls avoided by cached verdicts."),
+    "fingerprint_seconds": ("counter", "Time spent fingerprinting uncached captures."),
+    "stored": ("counter", "Verdicts added to the cache."),
+    "last_hit_ratio": ("gauge", "Cache hit ratio of the latest analysis run."),
+}
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def hash_video_file(path: Path) -> str | None:
+    """Return the SHA-256 of a captured video, or None if it cannot be read."""
+    try:
+        return await asyncio.to_thread(_hash_file, path)
+    except OSError:
+        return None
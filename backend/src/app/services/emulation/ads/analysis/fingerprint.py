@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# dHash compares horizontally adjacent pixels, so 9x8 frames give 64 bits.
+_HASH_WIDTH = 9
+_HASH_HEIGHT = 8
+_FRAME_BYTES = _HASH_WIDTH * _HASH_HEIGHT
+_SAMPLE_FPS = 4
+_FRAME_COUNT = 8
+# Leading and trailing frames are dropped so trims and fades shift less.
+_EDGE_FRACTION = 0.05
+
+FINGERPRINT_BANDS = 4
+_BAND_BITS = 64 // FINGERPRINT_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+# Near-uniform videos (black frames, static slides) hash to almost all-zero
+# bits and would match each other.
+_MIN_SUMMARY_BITS = 8
+
+
+def dhash(pixels: bytes) -> int:
+    """64-bit difference hash of one 9x8 grayscale frame."""
+    value = 0
+    for row in range(_HASH_HEIGHT):
+        offset = row * _HASH_WIDTH
+        for col in range(_HASH_WIDTH - 1):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+@dataclass(frozen=True)
+class VideoFingerprint:
+    frame_hashes: tuple[int, ...]
+
+    @property
+    def summary(self) -> int:
+        # Per-bit majority over the frames: a single video-level hash whose
+        # bands are indexed for candidate lookups.
+        threshold = len(self.frame_hashes) / 2
+        value = 0
+        for bit in range(63, -1, -1):
+            votes = sum((frame_hash >> bit) & 1 for frame_hash in self.frame_hashes)
+            value = (value << 1) | (votes > threshold)
+        return value
+
+    @property
+    def bands(self) -> tuple[int, ...]:
+        summary = self.summary
+        return tuple(
+            (summary >> (band * _BAND_BITS)) & _BAND_MASK for band in range(FINGERPRINT_BANDS)
+        )
+
+    @property
+    def informative(self) -> bool:
+        return _MIN_SUMMARY_BITS <= self.summary.bit_count() <= 64 - _MIN_SUMMARY_BITS
+
+    def distance(self, other: VideoFingerprint) -> float:
+        """Mean Hamming distance between frames at the same relative position."""
+        pairs = list(zip(self.frame_hashes, other.frame_hashes, strict=False))
+        if not pairs:
+            return 64.0
+        return sum((left ^ right).bit_count() for left, right in pairs) / len(pairs)
+
+    def to_hex(self) -> str:
+        return "".join(f"{frame_hash:016x}" for frame_hash in self.frame_hashes)
+
+    @classmethod
+    def from_hex(cls, value: str) -> VideoFingerprint:
+        return cls(tuple(int(value[i : i + 16], 16) for i in range(0, len(value), 16)))
+
+    @classmethod
+    def from_frames(cls, frames: list[bytes]) -> VideoFingerprint | None:
+        edge = int(len(frames) * _EDGE_FRACTION)
+        frames = frames[edge : len(frames) - edge] or frames
+        if not frames:
+            return None
+        count = min(_FRAME_COUNT, len(frames))
+        step = len(frames) / count
+        return cls(tuple(dhash(frames[int(step * (i + 0.5))]) for i in range(count)))
+
+
+class VideoFingerprinter:
+    def __init__(self, *, ffmpeg_bin: str | None = None) -> None:
+        self._ffmpeg_bin = ffmpeg_bin or shutil.which("ffmpeg")
+
+    async def fingerprint(self, video_path: Path) -> VideoFingerprint | None:
+        if not self._ffmpeg_bin:
+            return None
+
+        # One decode pass; ffmpeg downscales to 9x8 gray so only 72 bytes
+        # per sampled frame cross the pipe.
+        process = await asyncio.create_subprocess_exec(
+            self._ffmpeg_bin,
+            "-v",
+            "error",
+            "-i",
+            str(video_path),
+            "-an",
+            "-vf",
+            f"fps={_SAMPLE_FPS},scale={_HASH_WIDTH}:{_HASH_HEIGHT}:flags=area,format=gray",
+            "-f",
+            "rawvideo",
+            "-",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            logger.warning(
+                "ffmpeg fingerprint failed for %s: %s",
+                video_path,
+                stderr.decode("utf-8", errors="ignore").strip(),
+            )
+            return None
+
+        frames = [
+            stdout[offset : offset + _FRAME_BYTES]
+            for offset in range(0, len(stdout) - _FRAME_BYTES + 1, _FRAME_BYTES)
+        ]
+        return VideoFingerprint.from_frames(frames)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+_GLOBAL_SLOTS_KEY = "emulation:ad_analysis:slots"
+_GLOBAL_POLL_INTERVAL_S = 0.25
+
+# KEYS[1] is a sorted set of slot holders scored by expiry time; ARGV is the
+# current time, the holder's expiry, the slot limit and the holder id. Expired
+# holders (crashed workers) are dropped before counting.
+_ACQUIRE_SLOT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2]) - tonumber(ARGV[1])))
+    return 1
+end
+return 0
+"""
+
+
+class AnalysisConcurrencyLimiter:
+    """Caps in-flight capture analyses per worker and, with Redis, across workers."""
+
+    def __init__(
+        self,
+        local_limit: int,
+        *,
+        redis: Redis | None = None,
+        global_limit: int = 0,
+        slot_ttl_seconds: float = 900.0,
+    ) -> None:
+        self._local_limit = max(local_limit, 1)
+        self._local = asyncio.Semaphore(self._local_limit)
+        self._redis = redis if global_limit > 0 else None
+        self._global_limit = global_limit
+        self._slot_ttl_seconds = slot_ttl_seconds
+        self._acquire_script = (
+            self._redis.register_script(_ACQUIRE_SLOT_SCRIPT) if self._redis is not None else None
+        )
+
+    @property
+    def local_limit(self) -> int:
+        return self._local_limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._local:
+            holder = await self._acquire_global()
+            try:
+                yield
+            finally:
+                if holder is not None:
+                    await self._release_global(holder)
+
+    async def _acquire_global(self) -> str | None:
+        if self._acquire_script is None:
+            return None
+        holder = uuid.uuid4().hex
+        while True:
+            now = time.time()
+            try:
+                acquired = await self._acquire_script(
+                    keys=[_GLOBAL_SLOTS_KEY],
+                    args=[now, now + self._slot_ttl_seconds, self._global_limit, holder],
+                )
+            except RedisError as exc:
+                # Fail open: the per-worker limit still applies.
+                logger.warning("Global analysis slot unavailable, continuing without it: %s", exc)
+                return None
+            if acquired:
+                return holder
+            await asyncio.sleep(_GLOBAL_POLL_INTERVAL_S)
+
+    async def _release_global(self, holder: str) -> None:
+        try:
+            await self._redis.zrem(_GLOBAL_SLOTS_KEY, holder)
+        except RedisError as exc:
+            logger.warning("Failed to release global analysis slot %s: %s", holder, exc)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+
 _RELEVANCE_SCOPE = """\
 Classify relevance for a narrow acquisition scope.
 
@@ -74,6 +76,11 @@ Examples:
 {{"result": "not_relevant", "reason": "The ad is for business intelligence software serving fintech companies, not for trading or earning money"}}
 """
 
+# Cached verdicts are keyed by this, so editing either prompt invalidates them.
+ANALYSIS_PROMPT_VERSION = hashlib.sha256(
+    f"{ANALYSIS_PROMPT}\0{TEXT_ANALYSIS_PROMPT}".encode()
+).hexdigest()[:16]
+
 
 def build_text_prompt(capture) -> str | None:
     fields = {
@@ -6,7 +6,8 @@ import logging
 import re
 import shutil
 import tempfile
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,12 @@ _WHOLE_VIDEO_MAX_SECONDS = 30.0
 _HEAD_SEGMENT_SECONDS = 20.0
 _TAIL_SEGMENT_SECONDS = 10.0
 _FFMPEG_TIME_RE = re.compile(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
+_PROBE_CACHE_SIZE = 256
+# Codecs each container can take as-is; anything else is re-encoded.
+_COPY_CONTAINERS = {
+    "webm": ({"vp8", "vp9", "av1"}, {"opus", "vorbis"}),
+    "mp4": ({"h264", "hevc", "av1"}, {"aac", "mp3", "opus"}),
+}
 
 
 @dataclass(frozen=True)
@@ -30,18 +37,33 @@ class PreparedAnalysisVideo:
         await asyncio.to_thread(shutil.rmtree, self.cleanup_dir, ignore_errors=True)
 
 
+@dataclass(frozen=True)
+class _ProbeResult:
+    duration: float | None
+    video_codec: str | None
+    audio_codec: str | None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None
+
+
 class AdAnalysisVideoSampler:
     def __init__(
         self,
         *,
         ffmpeg_bin: str | None = None,
         ffprobe_bin: str | None = None,
+        stream_copy: bool = True,
     ) -> None:
         self._ffmpeg_bin = ffmpeg_bin or shutil.which("ffmpeg")
         self._ffprobe_bin = ffprobe_bin or shutil.which("ffprobe")
+        self._stream_copy = stream_copy
+        self._probe_cache: OrderedDict[tuple[str, int, int], _ProbeResult] = OrderedDict()
 
     async def prepare(self, video_path: Path) -> PreparedAnalysisVideo:
-        duration = await self._probe_duration(video_path)
+        probe = await self._probe(video_path)
+        duration = probe.duration if probe is not None else None
         if duration is None:
             return PreparedAnalysisVideo(path=video_path)
 
@@ -63,7 +85,7 @@ class AdAnalysisVideoSampler:
                 duration_seconds=duration,
             )
 
-        output = await self._build_head_tail_sample(video_path, duration)
+        output = await self._build_head_tail_sample(video_path, probe)
         if output is None:
             return PreparedAnalysisVideo(
                 path=video_path,
@@ -71,16 +93,40 @@ class AdAnalysisVideoSampler:
             )
         return output
 
-    async def _probe_duration(self, video_path: Path) -> float | None:
+    async def _probe(self, video_path: Path) -> _ProbeResult | None:
         if not self._ffprobe_bin:
             return None
+        try:
+            stat = video_path.stat()
+        except OSError:
+            return None
 
+        # Captures are written once, so path, mtime and size identify the content.
+        cache_key = (str(video_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._probe_cache.get(cache_key)
+        if cached is not None:
+            self._probe_cache.move_to_end(cache_key)
+            return cached
+
+        probe = await self._run_ffprobe(video_path)
+        if probe is None:
+            probe = _ProbeResult(duration=None, video_codec=None, audio_codec=None)
+        if probe.duration is None:
+            # MediaRecorder webm files usually carry no duration header.
+            probe = replace(probe, duration=await self._probe_duration_with_ffmpeg(video_path))
+
+        self._probe_cache[cache_key] = probe
+        if len(self._probe_cache) > _PROBE_CACHE_SIZE:
+            self._probe_cache.popitem(last=False)
+        return probe
+
+    async def _run_ffprobe(self, video_path: Path) -> _ProbeResult | None:
         process = await asyncio.create_subprocess_exec(
             self._ffprobe_bin,
             "-v",
             "error",
             "-show_entries",
-            "format=duration",
+            "format=duration:stream=codec_type,codec_name,duration",
             "-of",
             "json",
             str(video_path),
@@ -94,27 +140,48 @@ class AdAnalysisVideoSampler:
                 video_path,
                 stderr.decode("utf-8", errors="ignore").strip(),
             )
-            return await self._probe_duration_with_ffmpeg(video_path)
+            return None
 
         try:
             payload = json.loads(stdout.decode("utf-8"))
             duration = self._extract_duration(payload)
+            streams = [
+                stream for stream in payload.get("streams", []) or [] if isinstance(stream, dict)
+            ]
         except (ValueError, json.JSONDecodeError, AttributeError, TypeError):
-            logger.warning("Unable to parse ffprobe duration for %s", video_path)
-            duration = None
+            logger.warning("Unable to parse ffprobe output for %s", video_path)
+            return None
 
-        if duration is not None and duration > 0:
-            return duration
-        return await self._probe_duration_with_ffmpeg(video_path)
+        def first_codec(codec_type: str) -> str | None:
+            return next(
+                (
+                    stream.get("codec_name") or "unknown"
+                    for stream in streams
+                    if stream.get("codec_type") == codec_type
+                ),
+                None,
+            )
+
+        return _ProbeResult(
+            duration=duration,
+            video_codec=first_codec("video"),
+            audio_codec=first_codec("audio"),
+        )
 
     async def _probe_duration_with_ffmpeg(self, video_path: Path) -> float | None:
         if not self._ffmpeg_bin:
             return None
 
+        # Stream copy to the null muxer only demuxes, so this reads the file
+        # without decoding a single frame.
         process = await asyncio.create_subprocess_exec(
             self._ffmpeg_bin,
             "-i",
             str(video_path),
+            "-map",
+            "0",
+            "-c",
+            "copy",
             "-f",
             "null",
             "-",
@@ -134,11 +201,12 @@ class AdAnalysisVideoSampler:
     async def _build_head_tail_sample(
         self,
         video_path: Path,
-        duration: float,
+        probe: _ProbeResult,
     ) -> PreparedAnalysisVideo | None:
-        if not self._ffmpeg_bin:
+        if not self._ffmpeg_bin or probe.duration is None:
             return None
 
+        duration = probe.duration
         head_seconds = min(_HEAD_SEGMENT_SECONDS, duration)
         tail_seconds = min(_TAIL_SEGMENT_SECONDS, max(duration - head_seconds, 0.0))
         tail_start = max(duration - tail_seconds, head_seconds)
@@ -150,9 +218,129 @@ class AdAnalysisVideoSampler:
             )
 
         temp_dir = Path(tempfile.mkdtemp(prefix="ad-analysis-", suffix="-sample"))
+        output_path = None
+        sample_duration: float | None = head_seconds + tail_seconds
+        container = _copy_container(probe) if self._stream_copy else None
+        if container is not None:
+            output_path = await self._copy_head_tail(
+                video_path, temp_dir, container, head_seconds, tail_start,
+            )
+            if output_path is None:
+                logger.info("Stream copy sample failed for %s, re-encoding", video_path)
+            else:
+                # Copied segments start on keyframes, so only the output knows
+                # how long the sample really is.
+                sample_probe = await self._run_ffprobe(output_path)
+                sample_duration = sample_probe.duration if sample_probe is not None else None
+        if output_path is None:
+            output_path = await self._encode_head_tail(
+                video_path, temp_dir, probe, head_seconds, tail_start,
+            )
+        if output_path is None:
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+            return None
+
+        return PreparedAnalysisVideo(
+            path=output_path,
+            cleanup_dir=temp_dir,
+            sampled=True,
+            duration_seconds=sample_duration,
+        )
+
+    async def _copy_head_tail(
+        self,
+        video_path: Path,
+        temp_dir: Path,
+        container: str,
+        head_seconds: float,
+        tail_start: float,
+    ) -> Path | None:
+        # Input seeking with stream copy starts each segment at the keyframe
+        # at or before the cut, so the tail may run slightly long. Both
+        # segments come out of one ffmpeg run and are joined by the concat
+        # demuxer, which rebases their timestamps without decoding.
+        head_path = temp_dir / f"head.{container}"
+        tail_path = temp_dir / f"tail.{container}"
+        copy_args = ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+        if not await self._run_ffmpeg(
+            video_path,
+            "-t",
+            str(head_seconds),
+            "-i",
+            str(video_path),
+            "-ss",
+            str(tail_start),
+            "-i",
+            str(video_path),
+            "-map",
+            "0:v:0",
+            "-map",
+            "0:a:0?",
+            *copy_args,
+            str(head_path),
+            "-map",
+            "1:v:0",
+            "-map",
+            "1:a:0?",
+            *copy_args,
+            str(tail_path),
+        ):
+            return None
+
+        list_path = temp_dir / "segments.ffconcat"
+        list_path.write_text(
+            f"ffconcat version 1.0\nfile '{head_path.name}'\nfile '{tail_path.name}'\n",
+            encoding="utf-8",
+        )
+        output_path = temp_dir / f"analysis_sample.{container}"
+        faststart = ["-movflags", "+faststart"] if container == "mp4" else []
+        if not await self._run_ffmpeg(
+            video_path,
+            "-f",
+            "concat",
+            "-i",
+            str(list_path),
+            "-c",
+            "copy",
+            *faststart,
+            str(output_path),
+        ):
+            return None
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            return None
+        return output_path
+
+    async def _run_ffmpeg(self, video_path: Path, *args: str) -> bool:
+        process = await asyncio.create_subprocess_exec(
+            self._ffmpeg_bin,
+            "-y",
+            "-v",
+            "error",
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            logger.debug(
+                "ffmpeg stream copy failed for %s: %s",
+                video_path,
+                stderr.decode("utf-8", errors="ignore").strip(),
+            )
+            return False
+        return True
+
+    async def _encode_head_tail(
+        self,
+        video_path: Path,
+        temp_dir: Path,
+        probe: _ProbeResult,
+        head_seconds: float,
+        tail_start: float,
+    ) -> Path | None:
+        duration = probe.duration
         output_path = temp_dir / "analysis_sample.mp4"
-        has_audio = await self._has_audio_stream(video_path)
-        if has_audio:
+        if probe.has_audio:
             filter_complex = ";".join(
                 [
                     f"[0:v]trim=start=0:end={head_seconds},setpts=PTS-STARTPTS[v0]",
@@ -200,42 +388,8 @@ class AdAnalysisVideoSampler:
                 video_path,
                 stderr.decode("utf-8", errors="ignore").strip(),
             )
-            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
             return None
-
-        return PreparedAnalysisVideo(
-            path=output_path,
-            cleanup_dir=temp_dir,
-            sampled=True,
-            duration_seconds=head_seconds + tail_seconds,
-        )
-
-    async def _has_audio_stream(self, video_path: Path) -> bool:
-        if not self._ffprobe_bin:
-            return False
-
-        process = await asyncio.create_subprocess_exec(
-            self._ffprobe_bin,
-            "-v",
-            "error",
-            "-select_streams",
-            "a",
-            "-show_entries",
-            "stream=index",
-            "-of",
-            "json",
-            str(video_path),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await process.communicate()
-        if process.returncode != 0:
-            return False
-        try:
-            payload = json.loads(stdout.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return False
-        return bool(payload.get("streams"))
+        return output_path
 
     @staticmethod
     def _extract_duration(payload: dict) -> float | None:
@@ -265,3 +419,12 @@ class AdAnalysisVideoSampler:
         if not positive:
             return None
         return max(positive)
+
+
+def _copy_container(probe: _ProbeResult) -> str | None:
+    for container, (video_codecs, audio_codecs) in _COPY_CONTAINERS.items():
+        if probe.video_codec in video_codecs and (
+            probe.audio_codec is None or probe.audio_codec in audio_codecs
+        ):
+            return container
+    return None
@@ -1,79 +1,90 @@
 from __future__ import annotations
 
+import asyncio
+import datetime
 import json
 import logging
+import time
+import uuid
 from collections import Counter
 from pathlib import Path
 
 from app.api.modules.emulation.models import (
     ANALYSIS_TERMINAL_STATUSES,
+    AdAnalysisVerdict,
     AdCapture,
     AnalysisStatus,
     PostProcessingStatus,
-    VideoStatus,
 )
 from app.clients.gemini import GeminiClient
 from app.database.uow import UnitOfWork
+from app.settings import AdAnalysisConfig
+from app.services.emulation.ads.analysis.cache import (
+    AD_ANALYSIS_CACHE_METRICS_GROUP,
+    hash_video_file,
+)
 from app.services.emulation.media_storage import MediaStorage
+from app.services.emulation.ads.analysis.fingerprint import (
+    VideoFingerprint,
+    VideoFingerprinter,
+)
 from app.services.emulation.ads.analysis.guardrails import AdAnalysisGuardrails
+from app.services.emulation.ads.analysis.limiter import AnalysisConcurrencyLimiter
 from app.services.emulation.ads.analysis.parser import parse_result
-from app.services.emulation.ads.analysis.prompt import ANALYSIS_PROMPT, build_text_prompt
+from app.services.emulation.ads.analysis.prompt import (
+    ANALYSIS_PROMPT,
+    ANALYSIS_PROMPT_VERSION,
+    build_text_prompt,
+)
 from app.services.emulation.ads.analysis.sampler import AdAnalysisVideoSampler
+from app.services.metrics import SharedMetrics
 
 logger = logging.getLogger(__name__)
 
 _MAX_VIDEO_SIZE_MB = 20
+# Unclear verdicts are not cached; the next sighting gets a fresh attempt.
+_CACHEABLE_RESULTS = {
+    "relevant": AnalysisStatus.COMPLETED,
+    "not_relevant": AnalysisStatus.NOT_RELEVANT,
+}
 
 
 class AdAnalysisService:
     def __init__(
         self, gemini: GeminiClient, uow: UnitOfWork, base_path: Path,
         storage: MediaStorage, video_sampler: AdAnalysisVideoSampler,
+        config: AdAnalysisConfig,
+        limiter: AnalysisConcurrencyLimiter,
+        metrics: SharedMetrics | None = None,
+        fingerprinter: VideoFingerprinter | None = None,
     ) -> None:
         self._gemini = gemini
         self._uow = uow
         self._base_path = base_path
         self._storage = storage
         self._video_sampler = video_sampler
+        self._config = config
+        self._limiter = limiter
+        self._metrics = metrics
+        self._fingerprinter = fingerprinter
         self._guardrails = AdAnalysisGuardrails(gemini)
+        self._pending_verdicts: list[tuple[uuid.UUID, AnalysisStatus, str | None]] = []
+        self._committed_verdicts: dict[uuid.UUID, AnalysisStatus] = {}
+        self._pending_cache_entries: dict[str, dict[str, object]] = {}
+        self._pending_fingerprints: list[tuple] = []
+        self._last_commit = 0.0
 
     async def get_session_analysis_workload(self, session_id: str) -> int:
-        captures = await self._uow.ad_captures.get_by_session(session_id)
-        return len(
-            [
-                c
-                for c in captures
-                if c.video_status == VideoStatus.COMPLETED
-                and c.analysis_status == AnalysisStatus.PENDING
-                and c.video_file
-            ]
-        )
+        return await self._uow.ad_captures.count_pending_analysis(session_id)
 
     async def summarize_session_analysis(
         self,
         session_id: str,
     ) -> tuple[PostProcessingStatus | None, int, int]:
-        captures = await self._uow.ad_captures.get_by_session(session_id)
-        analyzable = [
-            c
-            for c in captures
-            if c.video_status == VideoStatus.COMPLETED
-        ]
-        total = len(analyzable)
+        total, done, failed = await self._uow.ad_captures.get_analysis_counts(session_id)
         if total == 0:
             return None, 0, 0
 
-        done = sum(
-            1
-            for capture in analyzable
-            if str(capture.analysis_status or "").lower() in ANALYSIS_TERMINAL_STATUSES
-        )
-        failed = sum(
-            1
-            for capture in analyzable
-            if str(capture.analysis_status or "").lower() == AnalysisStatus.FAILED
-        )
-
         if done < total:
             status = PostProcessingStatus.RUNNING
         elif failed > 0:
@@ -85,81 +96,326 @@ class AdAnalysisService:
     async def build_live_capture_analysis_state(
         self,
         session_id: str,
-    ) -> dict[int, dict[str, object]]:
-        captures = await self._uow.ad_captures.get_by_session(session_id)
-        updates: dict[int, dict[str, object]] = {}
-        for capture in captures:
-            ad_position = int(capture.ad_position or 0)
-            if ad_position <= 0:
-                continue
+        since: datetime.datetime | None = None,
+    ) -> tuple[dict[int, dict[str, object]], datetime.datetime | None]:
+        # With ``since`` only captures whose verdict changed after it are read;
+        # the returned watermark is the latest verdict time seen.
+        rows = await self._uow.ad_captures.get_analysis_state_rows(session_id, since)
+        watermark = max(
+            (row.analysis_updated_at for row in rows if row.analysis_updated_at is not None),
+            default=since,
+        )
+        hidden = {
+            row.id
+            for row in rows
+            if str(row.analysis_status or "").lower() == AnalysisStatus.NOT_RELEVANT
+        }
+        screenshot_paths = await self._uow.ad_captures.get_screenshot_paths(
+            [row.id for row in rows if row.id not in hidden]
+        )
 
+        updates: dict[int, dict[str, object]] = {}
+        for row in rows:
             analysis_summary = None
-            if capture.analysis_summary:
+            if row.analysis_summary:
                 try:
-                    analysis_summary = json.loads(capture.analysis_summary)
+                    analysis_summary = json.loads(row.analysis_summary)
                 except (json.JSONDecodeError, TypeError):
                     analysis_summary = None
 
-            hide_media = str(capture.analysis_status or "").lower() == AnalysisStatus.NOT_RELEVANT
-            updates[ad_position] = {
-                "video_src_url": capture.video_src_url,
-                "video_status": str(capture.video_status),
-                "video_file": None if hide_media else capture.video_file,
-                "landing_url": None if hide_media else capture.landing_url,
-                "landing_status": str(capture.landing_status),
-                "landing_dir": None if hide_media else capture.landing_dir,
-                "screenshot_paths": [] if hide_media else [
-                    {"offset_ms": screenshot.offset_ms, "file_path": screenshot.file_path}
-                    for screenshot in sorted(capture.screenshots, key=lambda item: item.offset_ms)
+            hide_media = row.id in hidden
+            updates[int(row.ad_position)] = {
+                "video_src_url": row.video_src_url,
+                "video_status": str(row.video_status),
+                "video_file": None if hide_media else row.video_file,
+                "landing_url": None if hide_media else row.landing_url,
+                "landing_status": str(row.landing_status),
+                "landing_dir": None if hide_media else row.landing_dir,
+                "screenshot_paths": [
+                    {"offset_ms": offset_ms, "file_path": file_path}
+                    for offset_ms, file_path in screenshot_paths.get(row.id, [])
                 ],
-                "analysis_status": str(capture.analysis_status or AnalysisStatus.PENDING),
+                "analysis_status": str(row.analysis_status or AnalysisStatus.PENDING),
                 "analysis_summary": analysis_summary,
             }
-        return updates
+        return updates, watermark
 
     async def analyze_session_captures(
         self,
         session_id: str,
     ) -> tuple[PostProcessingStatus | None, int, int]:
-        captures = await self._uow.ad_captures.get_by_session(session_id)
-        pending = [
-            c for c in captures
-            if c.video_status == VideoStatus.COMPLETED
-            and c.analysis_status == AnalysisStatus.PENDING
-            and c.video_file
-        ]
+        pending = await self._uow.ad_captures.get_pending_analysis(session_id)
         if not pending:
             return None, 0, 0
 
-        video_refcounts = Counter(c.video_file for c in captures if c.video_file)
+        video_refcounts = Counter(
+            await self._uow.ad_captures.count_video_file_refs(
+                sorted({c.video_file for c in pending if c.video_file}),
+            )
+        )
+        self._pending_verdicts = []
+        self._committed_verdicts = {}
+        self._pending_cache_entries = {}
+        self._pending_fingerprints = []
+        self._last_commit = time.monotonic()
         dirs_to_cleanup: list[str] = []
+        started = time.monotonic()
 
+        content_hashes = await self._hash_videos(pending)
+        cached = await self._uow.ad_captures.get_cached_verdicts(
+            sorted(set(content_hashes.values())), ANALYSIS_PROMPT_VERSION,
+        )
+        misses: list[AdCapture] = []
         for capture in pending:
-            cleanup_dir = await self._analyze_one(session_id, capture, video_refcounts)
+            verdict = cached.get(content_hashes.get(capture.id))
+            if verdict is None:
+                misses.append(capture)
+                continue
+            cleanup_dir = self._apply_cached_verdict(session_id, capture, verdict, video_refcounts)
             if cleanup_dir:
                 dirs_to_cleanup.append(cleanup_dir)
+        exact_hits = len(pending) - len(misses)
+        misses = await self._resolve_near_duplicates(
+            session_id, misses, content_hashes, video_refcounts, dirs_to_cleanup,
+        )
+        await self._record_cache_metrics(
+            len(content_hashes), exact_hits, len(pending) - len(misses) - exact_hits,
+        )
 
-        try:
-            await self._uow.commit()
-        except Exception:
-            logger.exception("Session %s: failed to commit analysis results", session_id)
-            await self._uow.rollback()
-            return PostProcessingStatus.FAILED, 0, len(pending)
+        async def analyze(capture: AdCapture) -> str | None:
+            async with self._limiter.slot():
+                return await self._analyze_one(
+                    session_id, capture, video_refcounts, content_hashes.get(capture.id),
+                )
 
-        for rel_dir in dirs_to_cleanup:
-            await self._storage.remove_capture_dir(rel_dir)
+        # Workers never touch the database session: verdicts are recorded in
+        # memory and committed here, between completions.
+        tasks = [asyncio.create_task(analyze(capture)) for capture in misses]
+        committed = True
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                cleanup_dir = await next_done
+                if cleanup_dir:
+                    dirs_to_cleanup.append(cleanup_dir)
+                if (
+                    len(self._pending_verdicts) >= self._config.commit_batch_size
+                    or time.monotonic() - self._last_commit >= self._config.commit_interval_seconds
+                ):
+                    committed = await self._commit_verdicts(session_id, dirs_to_cleanup)
+                    if not committed:
+                        break
+            else:
+                committed = await self._commit_verdicts(session_id, dirs_to_cleanup)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if not committed:
+                await self._uow.rollback()
 
-        done = sum(
-            1 for capture in pending if str(capture.analysis_status or "").lower() in ANALYSIS_TERMINAL_STATUSES
-        )
-        failed = sum(
-            1 for capture in pending if str(capture.analysis_status or "").lower() == AnalysisStatus.FAILED
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Session %s: analysed %d captures in %.1fs (%.2f/s, concurrency %d)",
+            session_id,
+            len(self._committed_verdicts),
+            elapsed,
+            len(self._committed_verdicts) / elapsed if elapsed > 0 else 0.0,
+            self._limiter.local_limit,
         )
+
+        statuses = list(self._committed_verdicts.values())
+        done = sum(1 for status in statuses if status in ANALYSIS_TERMINAL_STATUSES)
+        if done < len(pending):
+            return PostProcessingStatus.FAILED, done, len(pending)
+        failed = sum(1 for status in statuses if status == AnalysisStatus.FAILED)
         final_status = PostProcessingStatus.FAILED if failed > 0 else PostProcessingStatus.COMPLETED
         return final_status, done, len(pending)
 
+    def _record_verdict(
+        self, capture: AdCapture, status: AnalysisStatus, summary: str | None = None,
+    ) -> None:
+        self._pending_verdicts.append((capture.id, status, summary))
+
+    async def _hash_videos(self, captures: list[AdCapture]) -> dict[uuid.UUID, str]:
+        hashes = await asyncio.gather(
+            *(hash_video_file(self._base_path / capture.video_file) for capture in captures)
+        )
+        return {
+            capture.id: content_hash
+            for capture, content_hash in zip(captures, hashes, strict=True)
+            if content_hash is not None
+        }
+
+    def _apply_cached_verdict(
+        self,
+        session_id: str,
+        capture: AdCapture,
+        verdict: AdAnalysisVerdict,
+        video_refcounts: Counter[str],
+    ) -> str | None:
+        status = AnalysisStatus(verdict.analysis_status)
+        self._record_verdict(capture, status, verdict.analysis_summary)
+        logger.info(
+            "Session %s: capture %s resolved from cached verdict %s (%s)",
+            session_id,
+            capture.id,
+            verdict.content_hash[:12],
+            status,
+        )
+        if status == AnalysisStatus.NOT_RELEVANT:
+            return self._resolve_cleanup_dir(capture.video_file, video_refcounts)
+        return None
+
+    async def _resolve_near_duplicates(
+        self,
+        session_id: str,
+        captures: list[AdCapture],
+        content_hashes: dict[uuid.UUID, str],
+        video_refcounts: Counter[str],
+        dirs_to_cleanup: list[str],
+    ) -> list[AdCapture]:
+        """Apply verdicts of near-identical creatives; return the captures left to analyse."""
+        if self._fingerprinter is None or not captures:
+            return captures
+
+        started = time.monotonic()
+        fingerprints = await self._fingerprint_videos(captures)
+        self._pending_fingerprints = [
+            (
+                capture.id,
+                content_hashes.get(capture.id),
+                fingerprint.to_hex(),
+                *fingerprint.bands,
+            )
+            for capture in captures
+            if (fingerprint := fingerprints.get(capture.id)) is not None
+        ]
+        usable = {
+            capture_id: fingerprint
+            for capture_id, fingerprint in fingerprints.items()
+            if fingerprint.informative
+        }
+        candidates = [
+            (VideoFingerprint.from_hex(fingerprint_hex), verdict)
+            for fingerprint_hex, verdict in await self._uow.ad_captures.find_fingerprint_verdicts(
+                [fingerprint.bands for fingerprint in usable.values()],
+                ANALYSIS_PROMPT_VERSION,
+            )
+            if fingerprint_hex
+        ]
+        if self._metrics is not None:
+            try:
+                await self._metrics.increment(
+                    AD_ANALYSIS_CACHE_METRICS_GROUP,
+                    fingerprint_seconds=time.monotonic() - started,
+                )
+            except Exception as exc:
+                logger.warning("Failed to push analysis cache metrics: %s", exc)
+
+        remaining: list[AdCapture] = []
+        for capture in captures:
+            fingerprint = usable.get(capture.id)
+            match = None
+            if fingerprint is not None:
+                match = min(
+                    (
+                        (fingerprint.distance(other), verdict)
+                        for other, verdict in candidates
+                        if any(a == b for a, b in zip(fingerprint.bands, other.bands, strict=True))
+                    ),
+                    key=lambda item: item[0],
+                    default=None,
+                )
+            if match is None or match[0] > self._config.fingerprint_max_distance:
+                remaining.append(capture)
+                continue
+            logger.info(
+                "Session %s: capture %s is a near-duplicate (distance %.1f) of creative %s",
+                session_id,
+                capture.id,
+                match[0],
+                match[1].content_hash[:12],
+            )
+            cleanup_dir = self._apply_cached_verdict(session_id, capture, match[1], video_refcounts)
+            if cleanup_dir:
+                dirs_to_cleanup.append(cleanup_dir)
+        return remaining
+
+    async def _fingerprint_videos(
+        self, captures: list[AdCapture],
+    ) -> dict[uuid.UUID, VideoFingerprint]:
+        semaphore = asyncio.Semaphore(max(self._config.fingerprint_concurrency, 1))
+
+        async def fingerprint(capture: AdCapture) -> VideoFingerprint | None:
+            async with semaphore:
+                return await self._fingerprinter.fingerprint(self._base_path / capture.video_file)
+
+        results = await asyncio.gather(
+            *(fingerprint(capture) for capture in captures), return_exceptions=True,
+        )
+        return {
+            capture.id: result
+            for capture, result in zip(captures, results, strict=True)
+            if isinstance(result, VideoFingerprint)
+        }
+
+    async def _record_cache_metrics(self, lookups: int, hits: int, near_hits: int) -> None:
+        if self._metrics is None or lookups == 0:
+            return
+        try:
+            await self._metrics.increment(
+                AD_ANALYSIS_CACHE_METRICS_GROUP,
+                lookups=lookups,
+                hits=hits,
+                near_duplicate_hits=near_hits,
+                saved_gemini_calls=hits + near_hits,
+            )
+            await self._metrics.set(
+                AD_ANALYSIS_CACHE_METRICS_GROUP,
+                last_hit_ratio=(hits + near_hits) / lookups,
+            )
+        except Exception as exc:
+            logger.warning("Failed to push analysis cache metrics: %s", exc)
+
+    async def _commit_verdicts(self, session_id: str, dirs_to_cleanup: list[str]) -> bool:
+        # Committing in small groups makes verdicts visible while slower
+        # captures are still being analysed.
+        verdicts, self._pending_verdicts = self._pending_verdicts, []
+        cache_entries, self._pending_cache_entries = self._pending_cache_entries, {}
+        fingerprints, self._pending_fingerprints = self._pending_fingerprints, []
+        self._last_commit = time.monotonic()
+        if verdicts or fingerprints:
+            try:
+                await self._uow.ad_captures.update_analysis_many(verdicts)
+                await self._uow.ad_captures.update_video_fingerprints(fingerprints)
+                await self._uow.ad_captures.add_cached_verdicts(list(cache_entries.values()))
+                await self._uow.commit()
+            except Exception:
+                # The caller rolls back once no capture is still in flight.
+                logger.exception("Session %s: failed to commit analysis results", session_id)
+                return False
+            self._committed_verdicts.update(
+                (capture_id, status) for capture_id, status, _ in verdicts
+            )
+            if cache_entries and self._metrics is not None:
+                try:
+                    await self._metrics.increment(
+                        AD_ANALYSIS_CACHE_METRICS_GROUP, stored=len(cache_entries),
+                    )
+                except Exception as exc:
+                    logger.warning("Failed to push analysis cache metrics: %s", exc)
+
+        for rel_dir in dirs_to_cleanup:
+            await self._storage.remove_capture_dir(rel_dir)
+        dirs_to_cleanup.clear()
+        return True
+
     async def _analyze_one(
-        self, session_id: str, capture: AdCapture, video_refcounts: Counter[str],
+        self,
+        session_id: str,
+        capture: AdCapture,
+        video_refcounts: Counter[str],
+        content_hash: str | None = None,
     ) -> str | None:
         video_path = self._base_path / capture.video_file
         prepared_video = None
@@ -169,7 +425,7 @@ class AdAnalysisService:
                     "Session %s: video missing for capture %s",
                     session_id, capture.id,
                 )
-                await self._uow.ad_captures.update_analysis(capture.id, AnalysisStatus.FAILED)
+                self._record_verdict(capture, AnalysisStatus.FAILED)
                 return None
 
             prepared_video = await self._video_sampler.prepare(video_path)
@@ -194,12 +450,13 @@ class AdAnalysisService:
                     video_refcounts=video_refcounts,
                 )
 
-            raw = await self._gemini.generate_from_video(prepared_video.path, _ANALYSIS_PROMPT)
+            raw = await self._gemini.generate_from_video(prepared_video.path, ANALYSIS_PROMPT)
             return await self._apply_analysis_result(
                 session_id=session_id,
                 capture=capture,
                 raw_response=raw,
                 video_refcounts=video_refcounts,
+                content_hash=content_hash,
             )
 
         except Exception:
@@ -235,14 +492,7 @@ class AdAnalysisService:
                 session_id,
                 capture.id,
             )
-            try:
-                await self._uow.ad_captures.update_analysis(capture.id, AnalysisStatus.FAILED)
-            except Exception:
-                logger.exception(
-                    "Session %s: failed to mark capture %s as failed",
-                    session_id,
-                    capture.id,
-                )
+            self._record_verdict(capture, AnalysisStatus.FAILED)
             return None
 
     async def _analyze_from_text(
@@ -254,7 +504,7 @@ class AdAnalysisService:
     ) -> str | None:
         prompt = build_text_prompt(capture)
         if prompt is None:
-            await self._uow.ad_captures.update_analysis(capture.id, AnalysisStatus.SKIPPED)
+            self._record_verdict(capture, AnalysisStatus.SKIPPED)
             return None
         raw = await self._gemini.generate_from_text(prompt)
         return await self._apply_analysis_result(
@@ -271,21 +521,22 @@ class AdAnalysisService:
         capture: AdCapture,
         raw_response: str,
         video_refcounts: Counter[str],
+        content_hash: str | None = None,
     ) -> str | None:
-        result, data = parse_result(raw_response)
+        parsed_result, data = parse_result(raw_response)
         result, data = await self._guardrails.apply(
             capture=capture,
-            result=result,
+            result=parsed_result,
             data=data,
         )
         summary = json.dumps(data, ensure_ascii=False)
+        # Only video verdicts are cached; text fallbacks depend on the
+        # capture's metadata rather than on the creative itself.
+        if content_hash is not None:
+            self._cache_verdict(content_hash, parsed_result, result, summary)
 
         if result == "relevant":
-            await self._uow.ad_captures.update_analysis(
-                capture.id,
-                AnalysisStatus.COMPLETED,
-                summary,
-            )
+            self._record_verdict(capture, AnalysisStatus.COMPLETED, summary)
             logger.info(
                 "Session %s: capture %s RELEVANT — %s",
                 session_id,
@@ -294,11 +545,7 @@ class AdAnalysisService:
             )
             return None
         if result == "not_relevant":
-            await self._uow.ad_captures.update_analysis(
-                capture.id,
-                AnalysisStatus.NOT_RELEVANT,
-                summary,
-            )
+            self._record_verdict(capture, AnalysisStatus.NOT_RELEVANT, summary)
             logger.info(
                 "Session %s: capture %s NOT relevant — %s",
                 session_id,
@@ -307,11 +554,7 @@ class AdAnalysisService:
             )
             return self._resolve_cleanup_dir(capture.video_file, video_refcounts)
 
-        await self._uow.ad_captures.update_analysis(
-            capture.id,
-            AnalysisStatus.SKIPPED,
-            summary,
-        )
+        self._record_verdict(capture, AnalysisStatus.SKIPPED, summary)
         logger.warning(
             "Session %s: capture %s UNCLEAR — %s",
             session_id,
@@ -320,6 +563,23 @@ class AdAnalysisService:
         )
         return None
 
+    def _cache_verdict(
+        self, content_hash: str, parsed_result: str, result: str, summary: str,
+    ) -> None:
+        status = _CACHEABLE_RESULTS.get(result)
+        if status is None:
+            return
+        self._pending_cache_entries.setdefault(
+            content_hash,
+            {
+                "content_hash": content_hash,
+                "prompt_version": ANALYSIS_PROMPT_VERSION,
+                "parsed_result": parsed_result,
+                "analysis_status": status,
+                "analysis_summary": summary,
+            },
+        )
+
     def _resolve_cleanup_dir(
         self, video_file: str, video_refcounts: Counter[str],
     ) -> str | None:
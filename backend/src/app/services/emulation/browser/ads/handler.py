@@ -21,6 +21,7 @@ from ..humanizer import Humanizer
 from app.api.modules.emulation.models import VideoStatus
 
 from .capture import AdCaptureProvider, CaptureResult
+from .registry import AdCreativeRegistry, build_registry_key, has_reusable_artifacts
 from .snapshot import (
     AdRecord,
     freeze_timing,
@@ -42,12 +43,14 @@ class AdHandler:
         state: SessionState,
         capture: AdCaptureProvider | None = None,
         on_capture_ready: Callable[[list[dict[str, object]], dict[str, object]], Awaitable[None]] | None = None,
+        registry: AdCreativeRegistry | None = None,
     ) -> None:
         self._page = page
         self._h = humanizer
         self._state = state
         self._capture = capture
         self._on_capture_ready = on_capture_ready
+        self._registry = registry
         self._capturing = False
         self._pending_records: list[AdRecord] = []
         self._interrupted_records: list[AdRecord] | None = None
@@ -213,14 +216,24 @@ class AdHandler:
     async def _start_capture(self, rec: AdRecord) -> None:
         creative_key = self._creative_key(rec)
         if creative_key:
+            if self._registry is not None and self._capture:
+                rec.creative_registry_key = build_registry_key(
+                    creative_key, await self._current_video_src(),
+                )
             reused_result = self._completed_captures_by_creative.get(creative_key)
+            source = "this session"
+            if reused_result is None and rec.creative_registry_key:
+                reused_result = await self._registry.lookup(rec.creative_registry_key)
+                source = "creative registry"
             if reused_result is not None:
                 rec.capture_id = f"reuse-{uuid.uuid4().hex[:12]}"
                 rec._capture_result = replace(reused_result, capture_id=rec.capture_id)
+                rec.creative_reused = True
                 logger.info(
-                    "Session %s: ad capture %s reused existing creative artifacts (%s)",
+                    "Session %s: ad capture %s reused existing creative artifacts from %s (%s)",
                     self._state.session_id,
                     rec.capture_id,
+                    source,
                     creative_key,
                 )
                 return
@@ -305,7 +318,7 @@ class AdHandler:
             try:
                 rec._capture_result = await rec._capture_task
                 self._normalize_capture_result(rec)
-                self._cache_creative_result(rec)
+                await self._cache_creative_result(rec)
                 self._log_capture_outcome(rec)
             except Exception as exc:
                 logger.warning(
@@ -327,7 +340,7 @@ class AdHandler:
             try:
                 rec._capture_result = await task
                 self._normalize_capture_result(rec)
-                self._cache_creative_result(rec)
+                await self._cache_creative_result(rec)
                 self._log_capture_outcome(rec)
             except Exception as exc:
                 logger.warning(
@@ -513,7 +526,7 @@ class AdHandler:
             result.capture_id,
         )
 
-    def _cache_creative_result(self, rec: AdRecord) -> None:
+    async def _cache_creative_result(self, rec: AdRecord) -> None:
         result = rec._capture_result
         if result is None:
             return
@@ -521,15 +534,27 @@ class AdHandler:
         creative_key = self._creative_key(rec)
         if not creative_key:
             return
-        if not (result.video_file or result.landing_dir or result.screenshot_paths):
+        if not has_reusable_artifacts(result):
             return
 
         self._completed_captures_by_creative[creative_key] = replace(result)
+        if self._registry is not None and rec.creative_registry_key:
+            await self._registry.remember(rec.creative_registry_key, result)
+
+    async def _current_video_src(self) -> str | None:
+        try:
+            return await self._page.evaluate("""() => {
+                const v = document.querySelector("video");
+                return v ? (v.currentSrc || v.src || null) : null;
+            }""")
+        except Exception:
+            return None
 
     def _refresh_state_entry(self, rec: AdRecord) -> None:
         if rec._state_entry is None:
             return
         rec._state_entry.update(rec.to_dict())
+        self._state.mark_watched_ad_changed(rec._state_entry)
 
     async def _notify_capture_ready(self, rec: AdRecord) -> None:
         if self._on_capture_ready is None or rec._state_entry is None:
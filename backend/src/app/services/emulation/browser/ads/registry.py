@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.api.modules.emulation.models import AdCreative, VideoStatus
+from app.database.engine import SessionFactory
+from app.database.uow import UnitOfWork
+
+from ...config import AD_CREATIVE_REGISTRY_TTL_S
+from .capture import CaptureResult
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "emulation:creatives:"
+# googlevideo URLs carry per-playback signatures and expiry; only these
+# parameters identify the media itself.
+_STABLE_VIDEO_SRC_PARAMS = ("id", "itag")
+_ARTIFACT_FIELDS = (
+    "video_src_url",
+    "video_status",
+    "video_file",
+    "landing_url",
+    "landing_status",
+    "landing_dir",
+    "screenshot_paths",
+)
+
+
+def normalize_video_src(value: str | None) -> str:
+    src = (value or "").strip()
+    # MediaSource blob URLs are minted per page and identify nothing.
+    if not src or src.startswith(("blob:", "data:")):
+        return ""
+    parts = urlsplit(src)
+    if not parts.scheme or not parts.netloc:
+        return ""
+    host = parts.netloc.lower()
+    if host.endswith(".googlevideo.com"):
+        host = "googlevideo.com"
+    query = parse_qs(parts.query)
+    stable = [(name, query[name][0]) for name in _STABLE_VIDEO_SRC_PARAMS if name in query]
+    return urlunsplit((parts.scheme.lower(), host, parts.path, urlencode(stable), ""))
+
+
+def build_registry_key(creative_key: str, video_src_url: str | None) -> str:
+    return f"{creative_key}|{normalize_video_src(video_src_url)}"
+
+
+def has_reusable_artifacts(result: CaptureResult) -> bool:
+    return bool(result.video_file or result.landing_dir or result.screenshot_paths)
+
+
+class AdCreativeRegistry:
+    """Cross-session creative lookup: Redis first, then the ad_creatives table.
+
+    Entries only point at artifacts on shared storage, so a hit whose files
+    have since been cleaned up is dropped and treated as a miss.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        base_path: Path,
+        ttl_seconds: int = AD_CREATIVE_REGISTRY_TTL_S,
+    ) -> None:
+        self._redis = redis
+        self._base_path = base_path
+        self._ttl_seconds = ttl_seconds
+
+    async def lookup(self, registry_key: str) -> CaptureResult | None:
+        artifacts = await self._get_cached(registry_key)
+        if artifacts is None:
+            artifacts = await self._load(registry_key)
+            if artifacts is None:
+                return None
+            await self._set_cached(registry_key, artifacts)
+
+        if not self._artifacts_exist(artifacts):
+            logger.info("Creative registry entry has missing artifacts, recapturing: %s", registry_key)
+            await self._forget(registry_key)
+            return None
+        return CaptureResult(
+            capture_id="",
+            **{**artifacts, "screenshot_paths": [tuple(item) for item in artifacts["screenshot_paths"]]},
+        )
+
+    async def remember(self, registry_key: str, result: CaptureResult) -> None:
+        if not has_reusable_artifacts(result):
+            return
+        artifacts = {name: value for name, value in asdict(result).items() if name in _ARTIFACT_FIELDS}
+        await self._set_cached(registry_key, artifacts)
+
+    def _artifacts_exist(self, artifacts: dict[str, object]) -> bool:
+        paths = [artifacts.get("video_file"), artifacts.get("landing_dir")]
+        paths.extend(file_path for _, file_path in artifacts.get("screenshot_paths") or [])
+        return all((self._base_path / path).exists() for path in paths if path)
+
+    async def _load(self, registry_key: str) -> dict[str, object] | None:
+        try:
+            async with SessionFactory() as session:
+                creative = await UnitOfWork(session).ad_creatives.get_by_registry_key(registry_key)
+        except Exception as exc:
+            logger.warning("Creative registry lookup failed for %s: %s", registry_key, exc)
+            return None
+        if creative is None:
+            return None
+        return _creative_artifacts(creative)
+
+    async def _get_cached(self, registry_key: str) -> dict[str, object] | None:
+        try:
+            raw = await self._redis.get(_cache_key(registry_key))
+        except RedisError as exc:
+            logger.warning("Creative registry cache unavailable: %s", exc)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _set_cached(self, registry_key: str, artifacts: dict[str, object]) -> None:
+        try:
+            await self._redis.set(_cache_key(registry_key), json.dumps(artifacts), ex=self._ttl_seconds)
+        except RedisError as exc:
+            logger.warning("Creative registry cache write failed: %s", exc)
+
+    async def _forget(self, registry_key: str) -> None:
+        try:
+            await self._redis.delete(_cache_key(registry_key))
+        except RedisError as exc:
+            logger.warning("Creative registry cache delete failed: %s", exc)
+
+
+def _cache_key(registry_key: str) -> str:
+    return _KEY_PREFIX + hashlib.sha1(registry_key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _creative_artifacts(creative: AdCreative) -> dict[str, object]:
+    return {
+        "video_src_url": creative.video_src_url,
+        "video_status": creative.video_status or VideoStatus.PENDING,
+        "video_file": creative.video_file,
+        "landing_url": creative.landing_url,
+        "landing_status": creative.landing_status,
+        "landing_dir": creative.landing_dir,
+        "screenshot_paths": list(creative.screenshot_paths or []),
+    }
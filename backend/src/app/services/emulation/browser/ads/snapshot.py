@@ -248,6 +248,10 @@ class AdRecord:
     text_samples: list[dict[str, object]] = field(default_factory=list)
 
     capture_id: str | None = None
+    # Set when the creative registry is enabled; ``creative_reused`` marks a
+    # sighting that links existing artifacts instead of capturing new ones.
+    creative_registry_key: str | None = None
+    creative_reused: bool = False
 
     # capture-related runtime fields (set by AdHandler)
     _capture_handle: CaptureHandle | None = field(default=None, repr=False)
@@ -321,6 +325,8 @@ class AdRecord:
             "end_reason": self.end_reason,
             "capture_id": self.capture_id,
             "capture": capture_payload,
+            "creative_registry_key": self.creative_registry_key,
+            "creative_reused": self.creative_reused,
         }
 
 
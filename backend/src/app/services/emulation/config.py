@@ -137,8 +137,15 @@ AD_CAPTURE_RECORDING_START_TIMEOUT_S = 6.0
 AD_CAPTURE_RECORDING_RETRY_INTERVAL_S = 0.35
 AD_CAPTURE_RECORDER_WARMUP_MS = 0
 AD_COMPLETION_OVERFLOW_MAX_S = 30.0
+AD_CREATIVE_REGISTRY_TTL_S = 7 * 24 * 3600
 
 LIVE_PROGRESS_SYNC_INTERVAL_S = 3.0
+LIVE_PROGRESS_MIN_FLUSH_INTERVAL_S = 1.0
+# Must stay well below the profile lock's active-session grace period.
+LIVE_PROGRESS_HEARTBEAT_INTERVAL_S = 10.0
+LIVE_PROGRESS_METRICS_PUSH_INTERVAL_S = 60.0
+CAPTURE_PERSIST_FLUSH_INTERVAL_S = 0.5
+CAPTURE_PERSIST_MAX_BATCH = 25
 
 
 ORCHESTRATION_MIN_WINDOW_MINUTES = 180
@@ -147,4 +154,5 @@ ORCHESTRATION_ACTIVE_CHUNK_SECONDS = (20 * 60, 55 * 60)
 ORCHESTRATION_BREAK_SECONDS = (10 * 60, 90 * 60)
 ORCHESTRATION_MIN_ACTIVE_REMAINDER_SECONDS = 4 * 60
 ORCHESTRATION_MIN_NEXT_CHUNK_SECONDS = 8 * 60
-ORCHESTRATION_RUN_LOCK_TTL_SECONDS = 4 * 60 * 60
+RUN_LOCK_TTL_SECONDS = 10 * 60
+RUN_LOCK_HEARTBEAT_INTERVAL_S = 60.0
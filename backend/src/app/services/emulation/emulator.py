@@ -8,7 +8,12 @@ from typing import Awaitable, Callable
 from playwright.async_api import Page
 
 from .browser.ads.capture import AdCaptureProvider
+from .browser.ads.registry import AdCreativeRegistry
+from app.services.metrics import SharedMetrics
+
+from .session.progress_writer import ProgressWriter
 from .session.state import EmulationResult, SessionState
+from .session.stop_signal import SessionStopSignal
 from .session.store import EmulationSessionStore
 from .runtime import build_runtime
 from .session_loop import SessionLoop
@@ -27,6 +32,8 @@ class YouTubeEmulator:
         capture: AdCaptureProvider | None = None,
         bootstrap: dict[str, object] | None = None,
         on_capture_ready: Callable[[list[dict[str, object]], dict[str, object]], Awaitable[None]] | None = None,
+        metrics: SharedMetrics | None = None,
+        creative_registry: AdCreativeRegistry | None = None,
     ) -> None:
         self.session_store = session_store
 
@@ -37,12 +44,15 @@ class YouTubeEmulator:
             bootstrap=bootstrap,
         )
         self.session_state = session_state
+        self.stop_signal = SessionStopSignal(session_store, session_state)
 
         runtime = build_runtime(
             page,
             session_state,
             capture,
             on_capture_ready=on_capture_ready,
+            stop_signal=self.stop_signal,
+            creative_registry=creative_registry,
         )
         self.ads = runtime.ads
         self.humanizer = runtime.humanizer
@@ -56,15 +66,23 @@ class YouTubeEmulator:
             dispatcher=runtime.dispatcher,
             fatigue=runtime.fatigue,
             humanizer=runtime.humanizer,
-            traffic=runtime.traffic,
-            session_store=session_store,
+            progress_writer=ProgressWriter(
+                session_store,
+                session_state,
+                lambda: runtime.traffic.bytes_downloaded,
+                metrics,
+            ),
             flush_pending_captures=self.ads.flush_pending_captures,
         )
 
     async def run(self) -> EmulationResult:
         self._log_session_start()
-        await self._bootstrap()
-        await self._loop.run()
+        self.stop_signal.start()
+        try:
+            await self._bootstrap()
+            await self._loop.run()
+        finally:
+            await self.stop_signal.close()
         await self.ads.flush_pending_captures()
         result = await self._build_result()
         logger.info(
@@ -8,7 +8,6 @@ from taskiq.kicker import AsyncKicker
 
 from app.api.modules.emulation.models import SessionStatus
 from app.services.emulation.common import derive_watched_video_counters
-from app.services.emulation.core.ad_analytics import build_ads_analytics
 from app.services.emulation.orchestration.policy import (
     clamp_non_negative_int,
     pick_break_seconds,
@@ -76,7 +75,6 @@ class EmulationOrchestrationService:
                 watched_videos=result.watched_videos,
                 watched_ads_count=len(result.watched_ads),
                 watched_ads=result.watched_ads,
-                watched_ads_analytics=build_ads_analytics(result.watched_ads),
                 total_duration_seconds=spent_after,
                 mode=current_mode,
                 fatigue=current_fatigue,
@@ -126,7 +124,6 @@ class EmulationOrchestrationService:
             watched_videos=result.watched_videos,
             watched_ads_count=len(result.watched_ads),
             watched_ads=result.watched_ads,
-            watched_ads_analytics=build_ads_analytics(result.watched_ads),
             total_duration_seconds=spent_after,
             mode=current_mode,
             fatigue=current_fatigue,
@@ -189,7 +186,6 @@ class EmulationOrchestrationService:
             videos_watched=completed_videos,
             watched_videos_count=total_videos,
             watched_ads_count=len(watched_ads),
-            watched_ads_analytics=build_ads_analytics(watched_ads),
             orchestration=orchestration,
         )
         live_payload = await self._store.get(session_id) or {}
@@ -1,11 +1,6 @@
 from __future__ import annotations
 
-from app.api.modules.emulation.models import (
-    AdCapture,
-    AdCaptureScreenshot,
-    LandingStatus,
-    VideoStatus,
-)
+from app.api.modules.emulation.models import LandingStatus, VideoStatus
 from app.database.uow import UnitOfWork
 
 
@@ -23,13 +18,9 @@ class CapturePersistenceService:
         if start_index >= len(watched_ads):
             return
 
-        existing = await self._uow.ad_captures.get_by_session(session_id)
-        existing_positions = {
-            capture.ad_position
-            for capture in existing
-            if isinstance(capture.ad_position, int) and capture.ad_position > 0
-        }
-
+        rows: list[dict[str, object]] = []
+        screenshot_paths: dict[int, list] = {}
+        sightings: list[dict[str, object]] = []
         for i, ad in enumerate(watched_ads[start_index:], start=start_index + 1):
             if not ad.get("capture_id"):
                 continue
@@ -38,34 +29,65 @@ class CapturePersistenceService:
             ad_position = ad.get("position")
             if not isinstance(ad_position, int) or ad_position <= 0:
                 ad_position = i
-            if ad_position in existing_positions:
+            if ad_position in screenshot_paths:
                 continue
 
-            record = AdCapture(
-                session_id=session_id,
-                ad_position=ad_position,
-                advertiser_domain=ad.get("advertiser_domain"),
-                cta_href=ad.get("cta_href"),
-                display_url=ad.get("display_url"),
-                headline_text=ad.get("headline_text"),
-                ad_duration_seconds=ad.get("ad_duration_seconds"),
-                landing_url=cap.get("landing_url"),
-                landing_dir=cap.get("landing_dir"),
-                landing_status=cap.get("landing_status", LandingStatus.SKIPPED),
-                video_src_url=cap.get("video_src_url"),
-                video_file=cap.get("video_file"),
-                video_status=cap.get("video_status", VideoStatus.NO_SRC),
+            rows.append(
+                {
+                    "session_id": session_id,
+                    "ad_position": ad_position,
+                    "advertiser_domain": ad.get("advertiser_domain"),
+                    "cta_href": ad.get("cta_href"),
+                    "cta_text": ad.get("cta_text"),
+                    "display_url": ad.get("display_url"),
+                    "headline_text": ad.get("headline_text"),
+                    "description_text": ad.get("description_text"),
+                    "full_text": ad.get("full_text"),
+                    "ad_duration_seconds": ad.get("ad_duration_seconds"),
+                    "landing_url": cap.get("landing_url"),
+                    "landing_dir": cap.get("landing_dir"),
+                    "landing_status": cap.get("landing_status", LandingStatus.SKIPPED),
+                    "video_src_url": cap.get("video_src_url"),
+                    "video_file": cap.get("video_file"),
+                    "video_status": cap.get("video_status", VideoStatus.NO_SRC),
+                }
             )
-            await self._uow.ad_captures.create(record)
-            existing_positions.add(ad_position)
-
-            for offset_ms, file_path in cap.get("screenshot_paths", []):
-                await self._uow.ad_captures.add_screenshot(
-                    AdCaptureScreenshot(
-                        capture_id=record.id,
-                        offset_ms=offset_ms,
-                        file_path=file_path,
-                    ),
+            screenshot_paths[ad_position] = cap.get("screenshot_paths", [])
+            registry_key = ad.get("creative_registry_key")
+            if registry_key and (
+                cap.get("video_file") or cap.get("landing_dir") or cap.get("screenshot_paths")
+            ):
+                sightings.append(
+                    {
+                        "registry_key": registry_key,
+                        "ad_position": ad_position,
+                        "reused": bool(ad.get("creative_reused")),
+                        "advertiser_domain": ad.get("advertiser_domain"),
+                        "headline_text": ad.get("headline_text"),
+                        "video_src_url": cap.get("video_src_url"),
+                        "video_status": cap.get("video_status", VideoStatus.NO_SRC),
+                        "video_file": cap.get("video_file"),
+                        "landing_url": cap.get("landing_url"),
+                        "landing_status": cap.get("landing_status", LandingStatus.SKIPPED),
+                        "landing_dir": cap.get("landing_dir"),
+                        "screenshot_paths": cap.get("screenshot_paths", []),
+                    }
                 )
 
+        if not rows:
+            return
+
+        # Positions already stored for the session are skipped by the unique
+        # (session_id, ad_position) constraint; only new captures get screenshots.
+        inserted = await self._uow.ad_captures.insert_missing(rows)
+        await self._uow.ad_captures.add_screenshots(
+            [
+                {"capture_id": capture_id, "offset_ms": offset_ms, "file_path": file_path}
+                for ad_position, capture_id in inserted.items()
+                for offset_ms, file_path in screenshot_paths[ad_position]
+            ]
+        )
+        sightings = [sighting for sighting in sightings if sighting["ad_position"] in inserted]
+        if sightings:
+            await self._uow.ad_creatives.record_sightings(session_id, sightings)
         await self._uow.commit()
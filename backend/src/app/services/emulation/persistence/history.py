@@ -5,7 +5,6 @@ from datetime import UTC, datetime
 from app.api.modules.emulation.models import SessionStatus
 from app.database.uow import UnitOfWork
 from app.services.emulation.common import derive_watched_video_counters, to_utc_datetime
-from app.services.emulation.core.ad_analytics import build_ads_analytics
 
 
 class HistoryPersistenceService:
@@ -44,10 +43,6 @@ class HistoryPersistenceService:
             fallback_total=_as_int(live_payload.get("watched_videos_count")),
         )
 
-        ads_analytics = live_payload.get("watched_ads_analytics")
-        if not ads_analytics:
-            ads_analytics = build_ads_analytics(final_watched_ads)
-
         finished_at = None
         if status in (SessionStatus.COMPLETED, SessionStatus.FAILED, SessionStatus.STOPPED):
             finished_at = to_utc_datetime(live_payload.get("finished_at")) or _utcnow()
@@ -71,16 +66,17 @@ class HistoryPersistenceService:
             topics_searched=final_topics,
             videos_watched=final_videos_watched,
             watched_videos_count=final_watched_videos_count,
-            watched_videos=final_watched_videos,
             watched_ads_count=max(
                 _as_int(live_payload.get("watched_ads_count")),
                 len(final_watched_ads),
             ),
-            watched_ads=final_watched_ads,
-            watched_ads_analytics=ads_analytics,
             total_duration_seconds=final_total_duration,
             error=error,
         )
+        # Lists go to the child tables; ads analytics are rebuilt from the ads on read.
+        await self._uow.emulation_history.save_watched_items(
+            {session_id: (final_watched_videos, final_watched_ads)}
+        )
         await self._uow.commit()
 
     async def persist_history_running(
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import uuid
+from contextlib import suppress
 from typing import Any
 
 from playwright.async_api import BrowserContext, Page
 
 from app.api.modules.emulation.models import AnalysisStatus, SessionStatus, VideoStatus
 from app.services.browser.provider import BrowserSessionProvider
+from app.services.emulation.browser.ads.registry import AdCreativeRegistry
 from app.services.emulation import YouTubeEmulator
-from app.services.emulation.core.ad_analytics import build_ads_analytics
 from app.services.emulation.session.bootstrap import build_bootstrap_payload
 from app.services.emulation.core.capture_factory import AdCaptureProviderFactory
-from app.services.emulation.config import ORCHESTRATION_RUN_LOCK_TTL_SECONDS
+from app.services.emulation.config import (
+    RUN_LOCK_HEARTBEAT_INTERVAL_S,
+    RUN_LOCK_TTL_SECONDS,
+)
 from app.services.emulation.orchestration.policy import (
     build_orchestration_payload,
     clamp_non_negative_int,
@@ -22,12 +27,10 @@ from app.services.emulation.orchestration.policy import (
 from app.services.emulation.orchestrator import EmulationOrchestrationService
 from app.services.emulation.persistence import EmulationPersistenceService
 from app.services.emulation.session.store import EmulationSessionStore
+from app.services.emulation.workflow.capture_writer import CaptureWriter
 from app.services.emulation.workflow.finalizer import finalize_completed, finalize_stopped
-from app.services.emulation.workflow.progress import (
-    persist_incremental_ad_captures,
-    persist_safely,
-    queue_ad_analysis,
-)
+from app.services.emulation.workflow.progress import persist_safely, queue_ad_analysis
+from app.services.metrics import SharedMetrics
 from app.settings import Config
 
 logger = logging.getLogger(__name__)
@@ -137,6 +140,8 @@ class EmulationRunService:
         persistence: EmulationPersistenceService,
         orchestrator: EmulationOrchestrationService,
         ad_analysis: Any = None,
+        metrics: SharedMetrics | None = None,
+        creative_registry: AdCreativeRegistry | None = None,
     ) -> None:
         self._session_provider = session_provider
         self._session_store = session_store
@@ -145,6 +150,8 @@ class EmulationRunService:
         self._persistence = persistence
         self._orchestrator = orchestrator
         self._ad_analysis = ad_analysis
+        self._metrics = metrics
+        self._creative_registry = creative_registry
 
     async def run(
         self,
@@ -160,16 +167,42 @@ class EmulationRunService:
         ctx: BrowserContext | None = None
         page: Page | None = None
         runtime_debug_state: dict[str, bool] | None = None
+        capture_writer: CaptureWriter | None = None
 
         lock_acquired = await self._session_store.try_acquire_run_lock(
             session_id=session_id,
             holder=run_holder,
-            ttl_seconds=ORCHESTRATION_RUN_LOCK_TTL_SECONDS,
+            ttl_seconds=RUN_LOCK_TTL_SECONDS,
         )
         if not lock_acquired:
             logger.info("Session %s: skipping — another chunk is active", session_id)
             return {"status": "already_running", "session_id": session_id}
 
+        async def _heartbeat_locks() -> None:
+            while True:
+                await asyncio.sleep(RUN_LOCK_HEARTBEAT_INTERVAL_S)
+                try:
+                    if not await self._session_store.refresh_run_lock(
+                        session_id,
+                        run_holder,
+                        RUN_LOCK_TTL_SECONDS,
+                    ):
+                        logger.warning("Session %s: run lock is no longer held", session_id)
+                    if resolved_profile_id and not await self._session_store.refresh_profile_lock(
+                        resolved_profile_id,
+                        profile_lock_holder,
+                        RUN_LOCK_TTL_SECONDS,
+                    ):
+                        logger.warning(
+                            "Session %s: profile lock for %s is no longer held",
+                            session_id,
+                            resolved_profile_id,
+                        )
+                except Exception:
+                    logger.exception("Session %s: failed to refresh run locks", session_id)
+
+        heartbeat_task = asyncio.create_task(_heartbeat_locks())
+
         try:
             live_payload = await self._session_store.get(session_id)
             if live_payload is None:
@@ -181,6 +214,9 @@ class EmulationRunService:
                 SessionStatus.STOPPED,
             }:
                 logger.info("Session %s: already finished, skipping duplicate task", session_id)
+                # A session stopped while queued never reaches finalize_stopped,
+                # so its stop key would otherwise linger for the full TTL.
+                await self._session_store.clear_stop_request(session_id)
                 return {"status": "already_finished", "session_id": session_id}
 
             resolved_profile_id = _normalize_profile_id(profile_id) or _normalize_profile_id(
@@ -190,7 +226,7 @@ class EmulationRunService:
                 profile_locked = await self._session_store.try_acquire_profile_lock(
                     profile_id=resolved_profile_id,
                     holder=profile_lock_holder,
-                    ttl_seconds=ORCHESTRATION_RUN_LOCK_TTL_SECONDS,
+                    ttl_seconds=RUN_LOCK_TTL_SECONDS,
                 )
                 if not profile_locked:
                     raise RuntimeError(f"AdsPower profile {resolved_profile_id} is already in use")
@@ -241,48 +277,17 @@ class EmulationRunService:
                     orchestration,
                 )
 
-            persisted_ads_count = ad_persist_from
-
-            async def _handle_ready_capture(
+            async def _on_captures_persisted(
                 watched_ads: list[dict[str, object]],
-                state_entry: dict[str, object],
+                previous_count: int,
+                persisted_count: int,
             ) -> None:
-                nonlocal persisted_ads_count, orchestration
-
-                capture_payload = state_entry.get("capture")
-                if isinstance(capture_payload, dict):
-                    capture_payload.setdefault("analysis_status", AnalysisStatus.PENDING)
-                    capture_payload.setdefault("analysis_summary", None)
-
-                await self._session_store.update(
-                    session_id,
-                    watched_ads=watched_ads,
-                    watched_ads_count=len(watched_ads),
-                    watched_ads_analytics=build_ads_analytics(watched_ads),
-                )
-
-                if persisted_ads_count >= len(watched_ads):
-                    return
-
-                await persist_safely(
-                    persist_incremental_ad_captures(
-                        session_id=session_id,
-                        watched_ads=watched_ads,
-                        from_index=persisted_ads_count,
-                    ),
-                    session_id,
-                    self._persistence,
-                    "incremental ad captures",
-                )
-
-                previous_count = persisted_ads_count
-                persisted_ads_count = len(watched_ads)
                 if orchestration is not None:
-                    orchestration["persisted_ads_count"] = persisted_ads_count
+                    orchestration["persisted_ads_count"] = persisted_count
                     await self._session_store.update(session_id, orchestration=orchestration)
 
                 try:
-                    new_items = watched_ads[previous_count:persisted_ads_count]
+                    new_items = watched_ads[previous_count:persisted_count]
                     total_hint = sum(
                         1
                         for item in new_items
@@ -302,6 +307,26 @@ class EmulationRunService:
                         session_id,
                     )
 
+            capture_writer = CaptureWriter(session_id, ad_persist_from, _on_captures_persisted)
+
+            async def _handle_ready_capture(
+                watched_ads: list[dict[str, object]],
+                state_entry: dict[str, object],
+            ) -> None:
+                capture_payload = state_entry.get("capture")
+                if isinstance(capture_payload, dict):
+                    capture_payload.setdefault("analysis_status", AnalysisStatus.PENDING)
+                    capture_payload.setdefault("analysis_summary", None)
+
+                position = state_entry.get("position")
+                await self._session_store.sync_watched_ads(
+                    session_id,
+                    watched_ads,
+                    [position - 1] if isinstance(position, int) else [],
+                    watched_ads_count=len(watched_ads),
+                )
+                await capture_writer.submit(watched_ads)
+
             run_duration_minutes = max(1, int((chunk_seconds + 59) // 60))
             ctx = await self._session_provider.acquire_context(profile_id=resolved_profile_id)
             page = await _acquire_page(ctx, session_id)
@@ -324,15 +349,18 @@ class EmulationRunService:
                 capture=capture,
                 bootstrap=bootstrap,
                 on_capture_ready=_handle_ready_capture,
+                metrics=self._metrics,
+                creative_registry=self._creative_registry,
             )
             result = await emulator.run()
             completed_at = time.time()
 
+            await capture_writer.close()
             await persist_safely(
                 self._persistence.persist_ad_captures(
                     session_id=session_id,
                     watched_ads=result.watched_ads,
-                    from_index=persisted_ads_count,
+                    from_index=capture_writer.persisted_count,
                 ),
                 session_id,
                 self._persistence,
@@ -471,6 +499,14 @@ class EmulationRunService:
             )
             raise
         finally:
+            heartbeat_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat_task
+            if capture_writer is not None:
+                try:
+                    await capture_writer.close()
+                except Exception:
+                    logger.exception("Session %s: failed to close capture writer", session_id)
             if runtime_debug_state is not None:
                 runtime_debug_state["shutting_down"] = True
             if page:
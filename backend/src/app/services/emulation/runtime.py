@@ -7,6 +7,7 @@ from playwright.async_api import Page
 
 from .browser.ads.capture import AdCaptureProvider
 from .browser.ads.handler import AdHandler
+from .browser.ads.registry import AdCreativeRegistry
 from .browser.humanizer import Humanizer
 from .browser.navigator import Navigator
 from .browser.playback import PlaybackController
@@ -18,6 +19,7 @@ from .decision import ActionPicker
 from .session.clock import SessionClock
 from .session.fatigue import FatigueManager
 from .session.state import SessionState
+from .session.stop_signal import SessionStopSignal
 from .workflow.dispatcher import ActionDispatcher
 
 
@@ -38,9 +40,18 @@ def build_runtime(
     state: SessionState,
     capture: AdCaptureProvider | None = None,
     on_capture_ready: Callable[[list[dict[str, object]], dict[str, object]], Awaitable[None]] | None = None,
+    stop_signal: SessionStopSignal | None = None,
+    creative_registry: AdCreativeRegistry | None = None,
 ) -> EmulationRuntime:
     humanizer = Humanizer(page, state)
-    ads = AdHandler(page, humanizer, state, capture=capture, on_capture_ready=on_capture_ready)
+    ads = AdHandler(
+        page,
+        humanizer,
+        state,
+        capture=capture,
+        on_capture_ready=on_capture_ready,
+        registry=creative_registry,
+    )
     playback = PlaybackController(page, humanizer)
     finder = VideoFinder(page, state, humanizer)
 
@@ -52,7 +63,7 @@ def build_runtime(
     clock = SessionClock(state)
     picker = ActionPicker(state)
     fatigue = FatigueManager(state, humanizer, navigator)
-    dispatcher = ActionDispatcher(state, navigator, watcher, clock)
+    dispatcher = ActionDispatcher(state, navigator, watcher, clock, stop_signal=stop_signal)
     traffic = TrafficTracker(page)
 
     return EmulationRuntime(
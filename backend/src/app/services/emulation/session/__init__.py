@@ -1,10 +1,13 @@
 from .bootstrap import build_bootstrap_payload, extract_seen_video_ids, sanitize_watched_ads
+from .events import SessionEventHub, SessionEventSubscription
 from .state import EmulationResult, SessionState
 from .store import EmulationSessionStore
 
 __all__ = [
     "EmulationResult",
     "EmulationSessionStore",
+    "SessionEventHub",
+    "SessionEventSubscription",
     "SessionState",
     "build_bootstrap_payload",
     "extract_seen_video_ids",
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import zlib
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+# Values at least this large are zlib-compressed when that saves space.
+COMPRESS_MIN_BYTES = 1024
+_ZLIB_LEVEL = 1
+# Compressed values start with a format byte that JSON text never starts with,
+# so plain JSON values written before the codec existed still decode.
+_ZLIB_JSON = b"\x01"
+
+
+def _dumps(value: object) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode(value: object, *, compress: bool = True) -> bytes:
+    raw = _dumps(value)
+    if compress and len(raw) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(raw, _ZLIB_LEVEL)
+        if len(packed) + len(_ZLIB_JSON) < len(raw):
+            return _ZLIB_JSON + packed
+    return raw
+
+
+def decode(raw: bytes | str) -> object:
+    if isinstance(raw, str):
+        raw = raw.encode()
+    if raw[:1] == _ZLIB_JSON:
+        raw = zlib.decompress(raw[1:])
+    return _loads(raw)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from redis.asyncio import Redis
+
+from ..core.ad_analytics import build_ads_analytics
+from .store import SESSION_EVENTS_CHANNEL, EmulationSessionStore
+
+_RECONNECT_DELAY_SECONDS = 1.0
+logger = logging.getLogger(__name__)
+
+
+class SessionEventSubscription:
+    def __init__(self, hub: SessionEventHub, session_id: str) -> None:
+        self._hub = hub
+        self.session_id = session_id
+        self.version: int | None = None
+        self._changed = asyncio.Event()
+
+    def notify(self, version: int) -> None:
+        if self.version is not None and version <= self.version:
+            return
+        self.version = version
+        self._changed.set()
+
+    async def next_payload(self, timeout: float) -> dict | None:
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            return await self._hub.load_payload(self.session_id)
+        self._changed.clear()
+        return await self._hub.get_payload(self.session_id, self.version or 0)
+
+
+class SessionEventHub:
+    def __init__(self, redis: Redis, store: EmulationSessionStore) -> None:
+        self._redis = redis
+        self.store = store
+        self._subscriptions: dict[str, set[SessionEventSubscription]] = {}
+        self._payloads: dict[str, tuple[int, asyncio.Future[dict | None]]] = {}
+        # Decoded watched lists per session, tagged with the lists_version
+        # they were read at.
+        self._lists: dict[str, tuple[object, dict[str, object]]] = {}
+        self._listener: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, session_id: str) -> AsyncIterator[SessionEventSubscription]:
+        subscription = SessionEventSubscription(self, session_id)
+        self._subscriptions.setdefault(session_id, set()).add(subscription)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(session_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    self._subscriptions.pop(session_id, None)
+                    self._payloads.pop(session_id, None)
+                    self._lists.pop(session_id, None)
+
+    async def get_payload(self, session_id: str, version: int) -> dict | None:
+        cached = self._payloads.get(session_id)
+        if cached is not None and cached[0] >= version:
+            return await asyncio.shield(cached[1])
+
+        future = asyncio.ensure_future(self.load_payload(session_id))
+        self._payloads[session_id] = (version, future)
+        return await asyncio.shield(future)
+
+    async def load_payload(self, session_id: str) -> dict | None:
+        # Most events are progress ticks that leave the watched lists alone,
+        # so the lists are only re-read when their version moved.
+        fields, lists_version = await self.store.get_hash_fields(session_id)
+        if fields is None or "watched_videos" in fields:
+            return fields
+
+        cached = self._lists.get(session_id)
+        if cached is None or lists_version is None or cached[0] != lists_version:
+            lists = await self.store.get_fields(session_id, "watched_videos", "watched_ads")
+            if lists is None:
+                return None
+            lists["watched_ads_analytics"] = build_ads_analytics(lists["watched_ads"])
+            cached = (lists_version, lists)
+            if session_id in self._subscriptions:
+                self._lists[session_id] = cached
+        return {**fields, **cached[1]}
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(SESSION_EVENTS_CHANNEL)
+                    async for message in pubsub.listen():
+                        self._dispatch(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Session event listener failed, reconnecting")
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    def _dispatch(self, raw_event: object) -> None:
+        try:
+            event = json.loads(raw_event)
+        except (TypeError, ValueError):
+            return
+        if not isinstance(event, dict):
+            return
+
+        subscriptions = self._subscriptions.get(str(event.get("session_id")))
+        version = event.get("version")
+        if not subscriptions or not isinstance(version, int):
+            return
+        for subscription in tuple(subscriptions):
+            subscription.notify(version)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from app.services.metrics import MetricGroup, SharedMetrics
+
+from ..config import (
+    LIVE_PROGRESS_HEARTBEAT_INTERVAL_S,
+    LIVE_PROGRESS_METRICS_PUSH_INTERVAL_S,
+    LIVE_PROGRESS_MIN_FLUSH_INTERVAL_S,
+)
+from .state import SessionState
+from .store import EmulationSessionStore
+
+PROGRESS_WRITER_METRICS_GROUP = "emulation_progress_writer"
+PROGRESS_WRITER_METRICS: MetricGroup = {
+    "requests": ("counter", "Progress sync requests issued by session loops."),
+    "writes": ("counter", "Progress writes sent to Redis."),
+    "forced_writes": ("counter", "Progress writes forced by terminal events."),
+    "skipped_idle": ("counter", "Requests dropped because nothing changed."),
+    "coalesced": ("counter", "Requests merged into a deferred write."),
+}
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressWriter:
+    """Write-behind live progress: idle requests wait for the heartbeat, bursts coalesce."""
+
+    def __init__(
+        self,
+        store: EmulationSessionStore,
+        state: SessionState,
+        bytes_downloaded: Callable[[], int],
+        metrics: SharedMetrics | None = None,
+        *,
+        min_interval_s: float = LIVE_PROGRESS_MIN_FLUSH_INTERVAL_S,
+        heartbeat_interval_s: float = LIVE_PROGRESS_HEARTBEAT_INTERVAL_S,
+    ) -> None:
+        self._store = store
+        self._state = state
+        self._bytes_downloaded = bytes_downloaded
+        self._metrics = metrics
+        self._min_interval_s = min_interval_s
+        self._heartbeat_interval_s = heartbeat_interval_s
+        self._lock = asyncio.Lock()
+        self._deferred: asyncio.Task[None] | None = None
+        self._last_write_at: float | None = None
+        self._stats: Counter[str] = Counter()
+        self._pushed_stats: Counter[str] = Counter()
+        self._last_push_at = time.monotonic()
+
+    async def sync(self) -> None:
+        self._stats["requests"] += 1
+        since_write = (
+            time.monotonic() - self._last_write_at
+            if self._last_write_at is not None
+            else float("inf")
+        )
+        if not self._is_dirty():
+            if since_write < self._heartbeat_interval_s:
+                self._stats["skipped_idle"] += 1
+                return
+        elif since_write < self._min_interval_s:
+            self._stats["coalesced"] += 1
+            self._schedule(self._min_interval_s - since_write)
+            return
+
+        self._cancel_deferred()
+        await self._write()
+
+    async def flush(self) -> None:
+        self._cancel_deferred()
+        self._stats["forced_writes"] += 1
+        await self._write()
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.warning(
+                "Session %s: final progress write failed: %s",
+                self._state.session_id,
+                exc,
+            )
+        await self._push_metrics()
+        logger.info(
+            "Session %s: progress writer requests=%d writes=%d saved=%d",
+            self._state.session_id,
+            self._stats["requests"],
+            self._stats["writes"],
+            self._stats["skipped_idle"] + self._stats["coalesced"],
+        )
+
+    def _is_dirty(self) -> bool:
+        if self._state.has_pending_list_changes():
+            return True
+        return bool(
+            self._store.pending_progress_fields(self._state, self._bytes_downloaded())
+        )
+
+    def _schedule(self, delay: float) -> None:
+        if self._deferred is None or self._deferred.done():
+            self._deferred = asyncio.create_task(self._deferred_write(delay))
+
+    def _cancel_deferred(self) -> None:
+        if self._deferred is not None and not self._deferred.done():
+            self._deferred.cancel()
+        self._deferred = None
+
+    async def _deferred_write(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # Detach before writing so a forced flush cannot cancel a write in flight.
+        self._deferred = None
+        try:
+            await self._write()
+        except Exception as exc:
+            logger.warning(
+                "Session %s: deferred progress write failed: %s",
+                self._state.session_id,
+                exc,
+            )
+
+    async def _write(self) -> None:
+        async with self._lock:
+            fields = self._store.pending_progress_fields(
+                self._state,
+                self._bytes_downloaded(),
+            )
+            await self._store.sync_progress(self._state.session_id, self._state, fields)
+            self._last_write_at = time.monotonic()
+            self._stats["writes"] += 1
+
+        if time.monotonic() - self._last_push_at >= LIVE_PROGRESS_METRICS_PUSH_INTERVAL_S:
+            await self._push_metrics()
+
+    async def _push_metrics(self) -> None:
+        self._last_push_at = time.monotonic()
+        if self._metrics is None:
+            return
+        deltas = self._stats - self._pushed_stats
+        if not deltas:
+            return
+        try:
+            await self._metrics.increment(PROGRESS_WRITER_METRICS_GROUP, **deltas)
+        except Exception as exc:
+            logger.warning(
+                "Session %s: progress writer metrics push failed: %s",
+                self._state.session_id,
+                exc,
+            )
+            return
+        self._pushed_stats.update(deltas)
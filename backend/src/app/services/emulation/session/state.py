@@ -86,6 +86,9 @@ class SessionState:
     cycle_duration: float = 0.0
     started_at_monotonic: float = field(default_factory=time.monotonic)
     started_at_wallclock: float = field(default_factory=time.time)
+    synced_progress_fields: dict[str, object] = field(default_factory=dict, repr=False)
+    pending_video_indices: set[int] = field(default_factory=set, repr=False)
+    pending_ad_indices: set[int] = field(default_factory=set, repr=False)
 
     mode: Mode = field(init=False)
     initial_mode: Mode = field(init=False)
@@ -249,6 +252,7 @@ class SessionState:
             previous_url = str(previous.get("url") or "")
             if is_same_video_url(clean_url, previous_url):
                 self._merge_into_previous(previous, watched, target, completed, matched, keywords)
+                self.pending_video_indices.add(len(self.watched_videos) - 1)
                 self.mark_video_seen(clean_url)
                 self.refresh_video_counters()
                 return
@@ -269,6 +273,7 @@ class SessionState:
                 "recorded_at": time.time(),
             }
         )
+        self.pending_video_indices.add(len(self.watched_videos) - 1)
         self.mark_video_seen(clean_url)
         self.refresh_video_counters()
 
@@ -310,8 +315,30 @@ class SessionState:
         ad_record["position"] = len(self.watched_ads) + 1
         ad_record["recorded_at"] = time.time()
         self.watched_ads.append(ad_record)
+        self.pending_ad_indices.add(len(self.watched_ads) - 1)
         return ad_record
 
+    def mark_watched_ad_changed(self, ad_record: dict[str, object]) -> None:
+        position = ad_record.get("position")
+        if isinstance(position, int) and 0 < position <= len(self.watched_ads):
+            self.pending_ad_indices.add(position - 1)
+
+    def has_pending_list_changes(self) -> bool:
+        return bool(self.pending_video_indices or self.pending_ad_indices)
+
+    def take_pending_list_changes(self) -> tuple[set[int], set[int]]:
+        video_indices, self.pending_video_indices = self.pending_video_indices, set()
+        ad_indices, self.pending_ad_indices = self.pending_ad_indices, set()
+        return video_indices, ad_indices
+
+    def restore_pending_list_changes(
+        self,
+        video_indices: set[int],
+        ad_indices: set[int],
+    ) -> None:
+        self.pending_video_indices |= video_indices
+        self.pending_ad_indices |= ad_indices
+
     def completed_watched_videos_count(self) -> int:
         completed, _ = derive_watched_video_counters(
             self.watched_videos,
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+
+from .state import SessionState
+from .store import EmulationSessionStore
+
+_RECONNECT_DELAY_SECONDS = 1.0
+logger = logging.getLogger(__name__)
+
+
+class SessionStopSignal:
+    def __init__(self, store: EmulationSessionStore, state: SessionState) -> None:
+        self._store = store
+        self._state = state
+        self._event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    def trigger(self) -> None:
+        if self._event.is_set():
+            return
+        logger.info("Session %s: stop requested by user", self._state.session_id)
+        self._state.request_stop()
+        self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _watch(self) -> None:
+        while not self._event.is_set():
+            try:
+                await self._store.wait_for_stop(self._state.session_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Session %s: stop signal listener failed: %s",
+                    self._state.session_id,
+                    exc,
+                )
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+                continue
+            self.trigger()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import time
+import uuid
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 
 from app.api.modules.emulation.models import (
     AnalysisStatus,
@@ -14,12 +18,285 @@ from app.api.modules.emulation.models import (
     SessionStatus,
 )
 from ..core.ad_analytics import build_ads_analytics
+from . import codec
 
 _TTL = 86400
 _STALE_TERMINAL_LOCK_GRACE_SECONDS = 20.0
 _STALE_ACTIVE_LOCK_GRACE_SECONDS = 30.0
+_VERSION_FIELD = "version"
+# Payload version of the last write that touched a watched list; lets readers
+# that keep decoded lists skip re-reading them on hash-only updates.
+_LISTS_VERSION_FIELD = "lists_version"
+# Bookkeeping fields that are not part of the session payload callers see.
+_INTERNAL_FIELDS = (_VERSION_FIELD, _LISTS_VERSION_FIELD)
+_LEGACY_PAYLOAD = -1
+_LISTS_OUT_OF_SYNC = -2
+_LIST_FIELDS = ("watched_videos", "watched_ads")
+_DERIVED_FIELDS = frozenset({"watched_ads_analytics"})
+_LIST_KEEP = "keep"
+_LIST_SET = "set"
+_LIST_REPLACE = "replace"
+_LIST_CAS = "cas"
+_PATCH_CAPTURE_ATTEMPTS = 3
+SESSION_EVENTS_CHANNEL = "emulation:session:events"
+ACTIVE_SESSIONS_KEY = "emulation:sessions:active"
+_ACTIVE_STATUSES = (SessionStatus.QUEUED, SessionStatus.RUNNING)
+SESSION_EVENT_FIELDS = (
+    "status",
+    "stop_requested",
+    "videos_watched",
+    "watched_videos_count",
+    "watched_ads_count",
+    "post_processing_status",
+    "post_processing_done",
+    "post_processing_total",
+    "updated_at",
+)
 logger = logging.getLogger(__name__)
 
+# Writes only the given hash fields plus the requested list changes and bumps
+# the payload version in one atomic step. KEYS are the session hash, its
+# watched_videos / watched_ads lists and the active-session index (a sorted
+# set scored by updated_at that holds queued and running sessions, kept in
+# step with the status written here); ARGV is the TTL, the event channel, the
+# session id, the hash field/value count and pairs, then per list a mode, an
+# item count and the items. "set"
+# items are (index, value) pairs in ascending order that overwrite an entry or
+# append right after the tail; a gap means the list no longer mirrors the
+# caller and nothing is written. "cas" items are (index, expected, value)
+# triples that overwrite an entry only if it still holds the expected value;
+# any mismatch writes nothing either. Every write other than a bare updated_at
+# heartbeat publishes a compact change event built from the stored fields.
+# Missing sessions are left untouched; pre-hash payloads that are still stored
+# as a single JSON string are reported back for migration.
+_UPDATE_FIELDS_SCRIPT = """
+local key_type = redis.call('TYPE', KEYS[1]).ok
+if key_type == 'none' then
+    return 0
+end
+if key_type ~= 'hash' then
+    return -1
+end
+
+local ttl = ARGV[1]
+local field_start = 5
+local field_end = field_start + tonumber(ARGV[4]) - 1
+local cursor = field_end + 1
+local sections = {}
+local publish = not (field_end == field_start + 1 and ARGV[field_start] == 'updated_at')
+local lists_changed = false
+for list_index = 2, 3 do
+    local mode = ARGV[cursor]
+    local first = cursor + 2
+    local last = first + tonumber(ARGV[cursor + 1]) - 1
+    if mode == 'set' then
+        local length = redis.call('LLEN', KEYS[list_index])
+        for i = first, last, 2 do
+            local index = tonumber(ARGV[i])
+            if index > length then
+                return -2
+            end
+            if index == length then
+                length = length + 1
+            end
+        end
+    elseif mode == 'cas' then
+        for i = first, last, 3 do
+            if redis.call('LINDEX', KEYS[list_index], tonumber(ARGV[i])) ~= ARGV[i + 1] then
+                return -2
+            end
+        end
+    end
+    sections[list_index] = {mode, first, last}
+    publish = publish or mode ~= 'keep'
+    lists_changed = lists_changed or mode == 'replace' or (mode ~= 'keep' and last >= first)
+    cursor = last + 1
+end
+
+if field_end >= field_start then
+    redis.call('HSET', KEYS[1], unpack(ARGV, field_start, field_end))
+end
+for list_index = 2, 3 do
+    local key = KEYS[list_index]
+    local mode, first, last = unpack(sections[list_index])
+    if mode == 'replace' then
+        redis.call('DEL', key)
+        for i = first, last, 1000 do
+            redis.call('RPUSH', key, unpack(ARGV, i, math.min(i + 999, last)))
+        end
+    elseif mode == 'set' then
+        local length = redis.call('LLEN', key)
+        for i = first, last, 2 do
+            local index = tonumber(ARGV[i])
+            if index < length then
+                redis.call('LSET', key, index, ARGV[i + 1])
+            else
+                redis.call('RPUSH', key, ARGV[i + 1])
+                length = length + 1
+            end
+        end
+    elseif mode == 'cas' then
+        for i = first, last, 3 do
+            redis.call('LSET', key, tonumber(ARGV[i]), ARGV[i + 2])
+        end
+    end
+    redis.call('EXPIRE', key, ttl)
+end
+local version = redis.call('HINCRBY', KEYS[1], 'version', 1)
+if lists_changed then
+    redis.call('HSET', KEYS[1], '__LISTS_VERSION_FIELD__', version)
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+
+local state = redis.call('HMGET', KEYS[1], 'status', 'updated_at')
+local status = state[1] and cjson.decode(state[1])
+local active_statuses = {__ACTIVE_STATUSES__}
+if active_statuses[status] then
+    local heartbeat = state[2] and tonumber(cjson.decode(state[2]))
+    redis.call('ZADD', KEYS[4], heartbeat or 0, ARGV[3])
+else
+    redis.call('ZREM', KEYS[4], ARGV[3])
+end
+
+if publish then
+    local event_fields = {__EVENT_FIELDS__}
+    local values = redis.call('HMGET', KEYS[1], unpack(event_fields))
+    local parts = {'"session_id":' .. cjson.encode(ARGV[3]), '"version":' .. version}
+    for i, name in ipairs(event_fields) do
+        parts[#parts + 1] = '"' .. name .. '":' .. (values[i] or 'null')
+    end
+    redis.call('PUBLISH', ARGV[2], '{' .. table.concat(parts, ',') .. '}')
+end
+return version
+""".replace(
+    "__EVENT_FIELDS__", ", ".join(f"'{name}'" for name in SESSION_EVENT_FIELDS)
+).replace(
+    "__LISTS_VERSION_FIELD__", _LISTS_VERSION_FIELD
+).replace(
+    "__ACTIVE_STATUSES__", ", ".join(f"['{status}'] = true" for status in _ACTIVE_STATUSES)
+)
+
+# Lock scripts compare the stored holder token before touching the key, so a
+# worker can never extend or delete a lock that has since changed hands.
+_REFRESH_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_RELEASE_SESSION_LOCK_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and string.match(holder, '^([^:]+)') == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Takes the profile lock, or steals it when the holding session is gone, has
+# lost its run lock, or stopped heartbeating past its grace period. The holder
+# session's hash and run lock are derived from the holder token, so this relies
+# on a single-node Redis (as deployed) rather than cluster key routing.
+# Returns {acquired, stolen, holder, status, age_seconds, ttl_ms}.
+_ACQUIRE_PROFILE_LOCK_SCRIPT = """
+if redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2], 'NX') then
+    return {1, 0, '', '', '-1', -2}
+end
+
+local holder = redis.call('GET', KEYS[1])
+local ttl_ms = redis.call('PTTL', KEYS[1])
+local session_id = string.match(holder, '^([^:]+)')
+local stale = false
+local status = nil
+local age = nil
+if session_id then
+    local session_key = ARGV[6] .. session_id
+    local key_type = redis.call('TYPE', session_key).ok
+    local updated_at = nil
+    if key_type == 'hash' then
+        local values = redis.call('HMGET', session_key, 'status', 'updated_at')
+        if values[1] then
+            status = cjson.decode(values[1])
+        end
+        if values[2] then
+            updated_at = cjson.decode(values[2])
+        end
+    elseif key_type == 'string' then
+        local payload = cjson.decode(redis.call('GET', session_key))
+        status = payload['status']
+        updated_at = payload['updated_at']
+    else
+        stale = true
+    end
+    if type(status) ~= 'string' then
+        status = nil
+    end
+    if type(updated_at) == 'number' then
+        age = math.max(0, tonumber(ARGV[3]) - updated_at)
+    end
+
+    if redis.call('EXISTS', ARGV[7] .. session_id) == 0 then
+        stale = true
+    elseif status and age then
+        if string.find(',' .. ARGV[8] .. ',', ',' .. status .. ',', 1, true) then
+            stale = stale or age >= tonumber(ARGV[4])
+        elseif string.find(',' .. ARGV[9] .. ',', ',' .. status .. ',', 1, true) then
+            stale = stale or age >= tonumber(ARGV[5])
+        end
+    end
+end
+
+local age_text = age and tostring(age) or '-1'
+if not stale then
+    return {0, 0, holder, status or '', age_text, ttl_ms}
+end
+redis.call('DEL', ARGV[7] .. session_id)
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return {1, 1, holder, status or '', age_text, ttl_ms}
+"""
+
+
+# Fields the Lua scripts read back (event payloads, lock staleness checks)
+# stay plain JSON; everything else may be compressed by the codec.
+_PLAIN_FIELDS = frozenset({*SESSION_EVENT_FIELDS, _VERSION_FIELD, _LISTS_VERSION_FIELD})
+
+
+def _encode_field(name: str, value: object) -> bytes:
+    return codec.encode(value, compress=name not in _PLAIN_FIELDS)
+
+
+def _encode_item(value: object) -> bytes:
+    return codec.encode(value)
+
+
+def _decode_fields(raw_fields: dict[bytes | str, bytes | str]) -> dict[str, object]:
+    decoded: dict[str, object] = {}
+    for raw_name, raw_value in raw_fields.items():
+        name = raw_name.decode("utf-8") if isinstance(raw_name, bytes) else str(raw_name)
+        decoded[name] = codec.decode(raw_value)
+    return decoded
+
+
+def _is_wrong_type_error(exc: ResponseError) -> bool:
+    return "WRONGTYPE" in str(exc)
+
+
+def _decode_text(value: bytes | str) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+    return str(value)
+
+
+def _decode_list(raw_items: list[bytes | str]) -> list[dict[str, object]]:
+    return [codec.decode(raw_item) for raw_item in raw_items]
+
 
 def _watched_duration_seconds(watched_videos: list[dict[str, object]]) -> int:
     total = 0.0
@@ -31,6 +308,22 @@ def _watched_duration_seconds(watched_videos: list[dict[str, object]]) -> int:
     return int(round(total))
 
 
+def _build_payload(
+    raw_fields: dict[bytes, bytes],
+    raw_videos: list[bytes],
+    raw_ads: list[bytes],
+) -> dict | None:
+    if not raw_fields:
+        return None
+    payload = _decode_fields(raw_fields)
+    for name in _INTERNAL_FIELDS:
+        payload.pop(name, None)
+    payload["watched_videos"] = _decode_list(raw_videos)
+    payload["watched_ads"] = _decode_list(raw_ads)
+    payload["watched_ads_analytics"] = build_ads_analytics(payload["watched_ads"])
+    return payload
+
+
 def _merge_live_capture_analysis(
     *,
     current_ads: list[dict[str, object]],
@@ -94,10 +387,29 @@ if TYPE_CHECKING:
 class EmulationSessionStore:
     def __init__(self, redis: Redis) -> None:
         self._redis = redis
+        self._update_fields_script = redis.register_script(_UPDATE_FIELDS_SCRIPT)
+        self._acquire_profile_lock_script = redis.register_script(_ACQUIRE_PROFILE_LOCK_SCRIPT)
+        self._refresh_lock_script = redis.register_script(_REFRESH_LOCK_SCRIPT)
+        self._release_lock_script = redis.register_script(_RELEASE_LOCK_SCRIPT)
+        self._release_session_lock_script = redis.register_script(_RELEASE_SESSION_LOCK_SCRIPT)
 
     def _key(self, session_id: str) -> str:
         return f"emulation:session:{session_id}"
 
+    def _videos_key(self, session_id: str) -> str:
+        return f"emulation:session:{session_id}:watched_videos"
+
+    def _ads_key(self, session_id: str) -> str:
+        return f"emulation:session:{session_id}:watched_ads"
+
+    def _list_key(self, session_id: str, name: str) -> str:
+        if name == "watched_videos":
+            return self._videos_key(session_id)
+        return self._ads_key(session_id)
+
+    def _stop_key(self, session_id: str) -> str:
+        return f"emulation:session:stop:{session_id}"
+
     def _run_lock_key(self, session_id: str) -> str:
         return f"emulation:session:lock:{session_id}"
 
@@ -107,13 +419,6 @@ class EmulationSessionStore:
     def _analysis_lock_key(self, session_id: str) -> str:
         return f"emulation:session:analysis_lock:{session_id}"
 
-    @staticmethod
-    def _holder_session_id(holder: str | None) -> str | None:
-        if not holder:
-            return None
-        session_id, _, _ = holder.partition(":")
-        return session_id or None
-
     async def create(
         self,
         session_id: str,
@@ -140,7 +445,6 @@ class EmulationSessionStore:
             "watched_videos": [],
             "watched_ads_count": 0,
             "watched_ads": [],
-            "watched_ads_analytics": [],
             "total_duration_seconds": 0,
             "bytes_downloaded": 0,
             "post_processing_status": None,
@@ -152,25 +456,432 @@ class EmulationSessionStore:
             "orchestration": None,
             "error": None,
         }
-        await self._redis.set(self._key(session_id), json.dumps(data), ex=_TTL)
+        await self._write_payload(session_id, data)
 
     async def update(self, session_id: str, **fields: object) -> None:
-        raw_session_payload = await self._redis.get(self._key(session_id))
-        if raw_session_payload is None:
-            return
-        session_data = json.loads(raw_session_payload)
+        for name in _DERIVED_FIELDS:
+            fields.pop(name, None)
+        list_changes = {
+            name: (_LIST_REPLACE, list(fields.pop(name) or []))
+            for name in _LIST_FIELDS
+            if name in fields
+        }
         fields.setdefault("updated_at", time.time())
-        session_data.update(fields)
-        await self._redis.set(self._key(session_id), json.dumps(session_data), ex=_TTL)
+        await self._apply_changes(session_id, fields, list_changes)
+
+    async def sync_watched_ads(
+        self,
+        session_id: str,
+        watched_ads: list[dict[str, object]],
+        indices: Iterable[int],
+        *,
+        preserve_analysis: bool = True,
+        **fields: object,
+    ) -> None:
+        fields.setdefault("updated_at", time.time())
+        await self._sync_lists(
+            session_id,
+            fields,
+            watched_ads=(watched_ads, set(indices)),
+            preserve_analysis=preserve_analysis,
+        )
+
+    async def patch_ad_captures(
+        self,
+        session_id: str,
+        capture_updates: dict[int, dict[str, object]],
+        **fields: object,
+    ) -> int:
+        # Merges capture fields into live watched_ads entries by ad position,
+        # reading and rewriting only those entries. Each rewrite is conditional
+        # on the entry still holding what was read, so a concurrent emulator
+        # write is never overwritten; the merge is retried on top of it.
+        if not capture_updates:
+            return 0
+        fields.setdefault("updated_at", time.time())
+        for _ in range(_PATCH_CAPTURE_ATTEMPTS):
+            raw_entries = await self._read_ad_entries(session_id, capture_updates)
+            if not raw_entries:
+                return 0
+
+            changes: dict[int, tuple[bytes, dict[str, object]]] = {}
+            for index, (raw, entry) in sorted(raw_entries.items()):
+                capture = entry.get("capture")
+                merged_capture = dict(capture) if isinstance(capture, dict) else {}
+                merged_capture.update(capture_updates[entry["position"]])
+                changes[index] = (raw, {**entry, "capture": merged_capture})
+
+            result = await self._apply_changes(
+                session_id, fields, {"watched_ads": (_LIST_CAS, changes)}
+            )
+            if result != _LISTS_OUT_OF_SYNC:
+                return len(changes) if result > 0 else 0
+        logger.warning("Session %s: live ads kept changing while patching captures", session_id)
+        return 0
+
+    async def _read_ad_entries(
+        self,
+        session_id: str,
+        capture_updates: dict[int, dict[str, object]],
+    ) -> dict[int, tuple[bytes, dict[str, object]]]:
+        key = self._ads_key(session_id)
+        # Ads are appended with position == index + 1; the full list is only
+        # read when that no longer holds.
+        guessed = {position: position - 1 for position in capture_updates if position > 0}
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for index in guessed.values():
+                pipe.lindex(key, index)
+            raw_entries = await pipe.execute()
+        entries: dict[int, tuple[bytes, dict[str, object]]] = {}
+        for (position, index), raw in zip(guessed.items(), raw_entries, strict=True):
+            if raw is None:
+                continue
+            entry = codec.decode(raw)
+            if not isinstance(entry, dict) or entry.get("position") != position:
+                break
+            entries[index] = (raw, entry)
+        else:
+            return entries
+
+        entries = {}
+        for index, raw in enumerate(await self._redis.lrange(key, 0, -1)):
+            entry = codec.decode(raw)
+            if isinstance(entry, dict) and entry.get("position") in capture_updates:
+                entries[index] = (raw, entry)
+        return entries
 
     async def get(self, session_id: str) -> dict | None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hgetall(self._key(session_id))
+                pipe.lrange(self._videos_key(session_id), 0, -1)
+                pipe.lrange(self._ads_key(session_id), 0, -1)
+                raw_fields, raw_videos, raw_ads = await pipe.execute()
+        except ResponseError as exc:
+            if not _is_wrong_type_error(exc):
+                raise
+            return await self._get_legacy_payload(session_id)
+        return _build_payload(raw_fields, raw_videos, raw_ads)
+
+    async def get_hash_fields(self, session_id: str) -> tuple[dict | None, object]:
+        """Hash fields of a live session without the watched lists, and the
+        version those lists were last written at.
+
+        Pre-hash payloads come back whole, lists included, with no version.
+        """
+        try:
+            raw_fields = await self._redis.hgetall(self._key(session_id))
+        except ResponseError as exc:
+            if not _is_wrong_type_error(exc):
+                raise
+            return await self._get_legacy_payload(session_id), None
+        if not raw_fields:
+            return None, None
+        fields = _decode_fields(raw_fields)
+        lists_version = fields.get(_LISTS_VERSION_FIELD)
+        for name in _INTERNAL_FIELDS:
+            fields.pop(name, None)
+        return fields, lists_version
+
+    async def get_many(self, session_ids: list[str]) -> dict[str, dict | None]:
+        if not session_ids:
+            return {}
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hgetall(self._key(session_id))
+                pipe.lrange(self._videos_key(session_id), 0, -1)
+                pipe.lrange(self._ads_key(session_id), 0, -1)
+            results = await pipe.execute(raise_on_error=False)
+
+        payloads: dict[str, dict | None] = {}
+        legacy_ids: list[str] = []
+        for position, session_id in enumerate(session_ids):
+            raw_fields, raw_videos, raw_ads = results[position * 3 : position * 3 + 3]
+            errors = [
+                item
+                for item in (raw_fields, raw_videos, raw_ads)
+                if isinstance(item, Exception)
+            ]
+            if errors:
+                if not all(_is_wrong_type_error(error) for error in errors):
+                    raise errors[0]
+                legacy_ids.append(session_id)
+                continue
+            payloads[session_id] = _build_payload(raw_fields, raw_videos, raw_ads)
+
+        if legacy_ids:
+            legacy_payloads = await asyncio.gather(
+                *(self._get_legacy_payload(session_id) for session_id in legacy_ids)
+            )
+            payloads.update(zip(legacy_ids, legacy_payloads, strict=True))
+        return {session_id: payloads[session_id] for session_id in session_ids}
+
+    async def get_fields(self, session_id: str, *fields: str) -> dict[str, object] | None:
+        hash_fields = [name for name in fields if name not in _LIST_FIELDS]
+        list_fields = [name for name in fields if name in _LIST_FIELDS]
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hmget(self._key(session_id), [*hash_fields, _VERSION_FIELD])
+                for name in list_fields:
+                    pipe.lrange(self._list_key(session_id, name), 0, -1)
+                raw_values, *raw_lists = await pipe.execute()
+        except ResponseError as exc:
+            if not _is_wrong_type_error(exc):
+                raise
+            payload = await self._get_legacy_payload(session_id)
+            if payload is None:
+                return None
+            return {name: payload.get(name) for name in fields}
+        if raw_values[-1] is None:
+            return None
+        values: dict[str, object] = {
+            name: codec.decode(raw_value) if raw_value is not None else None
+            for name, raw_value in zip(hash_fields, raw_values, strict=False)
+        }
+        for name, raw_items in zip(list_fields, raw_lists, strict=True):
+            values[name] = _decode_list(raw_items)
+        return {name: values[name] for name in fields}
+
+    async def get_watched_videos(
+        self,
+        session_id: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        return await self._read_list(self._videos_key(session_id), offset, limit)
+
+    async def get_watched_ads(
+        self,
+        session_id: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        return await self._read_list(self._ads_key(session_id), offset, limit)
+
+    async def _read_list(
+        self,
+        key: str,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        start = max(offset, 0)
+        if limit is not None and limit <= 0:
+            return []
+        stop = -1 if limit is None else start + limit - 1
+        return _decode_list(await self._redis.lrange(key, start, stop))
+
+    async def _apply_changes(
+        self,
+        session_id: str,
+        fields: dict[str, object],
+        list_changes: dict[str, tuple[str, object]],
+    ) -> int:
+        args: list[object] = [_TTL, SESSION_EVENTS_CHANNEL, session_id, 2 * len(fields)]
+        for name, value in fields.items():
+            args.extend((name, _encode_field(name, value)))
+        for name in _LIST_FIELDS:
+            mode, entries = list_changes.get(name, (_LIST_KEEP, []))
+            if mode == _LIST_SET:
+                items = [
+                    part
+                    for index, entry in entries.items()
+                    for part in (index, _encode_item(entry))
+                ]
+            elif mode == _LIST_CAS:
+                items = [
+                    part
+                    for index, (expected, entry) in entries.items()
+                    for part in (index, expected, _encode_item(entry))
+                ]
+            else:
+                items = [_encode_item(entry) for entry in entries]
+            args.extend((mode, len(items), *items))
+
+        keys = [
+            self._key(session_id),
+            self._videos_key(session_id),
+            self._ads_key(session_id),
+            ACTIVE_SESSIONS_KEY,
+        ]
+        result = await self._update_fields_script(keys=keys, args=args)
+        if result == _LEGACY_PAYLOAD and await self._migrate_legacy_payload(session_id):
+            result = await self._update_fields_script(keys=keys, args=args)
+        return result
+
+    async def _sync_lists(
+        self,
+        session_id: str,
+        fields: dict[str, object],
+        *,
+        watched_videos: tuple[list[dict[str, object]], set[int]] | None = None,
+        watched_ads: tuple[list[dict[str, object]], set[int]] | None = None,
+        preserve_analysis: bool = True,
+    ) -> None:
+        list_changes: dict[str, tuple[str, object]] = {}
+        if watched_videos is not None:
+            entries, indices = watched_videos
+            list_changes["watched_videos"] = (
+                _LIST_SET,
+                {index: entries[index] for index in sorted(indices) if 0 <= index < len(entries)},
+            )
+        if watched_ads is not None:
+            entries, indices = watched_ads
+            ad_changes = {
+                index: entries[index] for index in sorted(indices) if 0 <= index < len(entries)
+            }
+            if preserve_analysis and ad_changes:
+                ad_changes = await self._merge_stored_ad_analysis(session_id, ad_changes)
+            list_changes["watched_ads"] = (_LIST_SET, ad_changes)
+
+        result = await self._apply_changes(session_id, fields, list_changes)
+        if result != _LISTS_OUT_OF_SYNC:
+            return
+
+        logger.warning("Session %s: live watch lists out of sync, rewriting them", session_id)
+        replacements: dict[str, tuple[str, object]] = {}
+        if watched_videos is not None:
+            replacements["watched_videos"] = (_LIST_REPLACE, list(watched_videos[0]))
+        if watched_ads is not None:
+            ads = list(watched_ads[0])
+            if preserve_analysis:
+                ads = _merge_live_capture_analysis(
+                    current_ads=await self._read_list(self._ads_key(session_id)),
+                    next_ads=ads,
+                )
+            replacements["watched_ads"] = (_LIST_REPLACE, ads)
+        await self._apply_changes(session_id, fields, replacements)
+
+    async def _merge_stored_ad_analysis(
+        self,
+        session_id: str,
+        ad_changes: dict[int, dict[str, object]],
+    ) -> dict[int, dict[str, object]]:
+        key = self._ads_key(session_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for index in ad_changes:
+                pipe.lindex(key, index)
+            raw_current = await pipe.execute()
+        merged_ads = _merge_live_capture_analysis(
+            current_ads=[codec.decode(raw) for raw in raw_current if raw is not None],
+            next_ads=list(ad_changes.values()),
+        )
+        return dict(zip(ad_changes, merged_ads, strict=True))
+
+    async def _write_payload(self, session_id: str, data: dict[str, object]) -> None:
+        key = self._key(session_id)
+        lists = {name: data.get(name) or [] for name in _LIST_FIELDS}
+        mapping = {
+            name: _encode_field(name, value)
+            for name, value in data.items()
+            if name not in _LIST_FIELDS and name not in _DERIVED_FIELDS
+        }
+        mapping.setdefault(_VERSION_FIELD, _encode_field(_VERSION_FIELD, 0))
+        # A full rewrite may reuse the stored version, so it gets a token no
+        # script write can produce.
+        mapping[_LISTS_VERSION_FIELD] = _encode_field(_LISTS_VERSION_FIELD, uuid.uuid4().hex)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key, *(self._list_key(session_id, name) for name in _LIST_FIELDS))
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, _TTL)
+            if data.get("status") in _ACTIVE_STATUSES:
+                heartbeat = data.get("updated_at")
+                pipe.zadd(
+                    ACTIVE_SESSIONS_KEY,
+                    {session_id: heartbeat if isinstance(heartbeat, int | float) else 0},
+                )
+            else:
+                pipe.zrem(ACTIVE_SESSIONS_KEY, session_id)
+            for name, entries in lists.items():
+                if not entries:
+                    continue
+                list_key = self._list_key(session_id, name)
+                pipe.rpush(list_key, *(_encode_item(entry) for entry in entries))
+                pipe.expire(list_key, _TTL)
+            pipe.publish(
+                SESSION_EVENTS_CHANNEL,
+                json.dumps(
+                    {
+                        "session_id": session_id,
+                        "version": codec.decode(mapping[_VERSION_FIELD]),
+                        **{name: data.get(name) for name in SESSION_EVENT_FIELDS},
+                    }
+                ),
+            )
+            await pipe.execute()
+
+    async def _get_legacy_payload(self, session_id: str) -> dict | None:
         raw_session_payload = await self._redis.get(self._key(session_id))
         if raw_session_payload is None:
             return None
         return json.loads(raw_session_payload)
 
+    async def _migrate_legacy_payload(self, session_id: str) -> bool:
+        payload = await self._get_legacy_payload(session_id)
+        if payload is None:
+            return False
+        logger.info("Session %s: migrating legacy JSON payload to hash layout", session_id)
+        await self._write_payload(session_id, payload)
+        return True
+
     async def delete(self, session_id: str) -> None:
-        await self._redis.delete(self._key(session_id))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(
+                self._key(session_id),
+                self._videos_key(session_id),
+                self._ads_key(session_id),
+                self._stop_key(session_id),
+            )
+            pipe.zrem(ACTIVE_SESSIONS_KEY, session_id)
+            await pipe.execute()
+
+    async def get_active_session_ids(
+        self,
+        *,
+        heartbeat_before: float | None = None,
+    ) -> list[str]:
+        max_score = "+inf" if heartbeat_before is None else f"({heartbeat_before}"
+        session_ids = await self._redis.zrangebyscore(ACTIVE_SESSIONS_KEY, "-inf", max_score)
+        return [_decode_text(session_id) for session_id in session_ids]
+
+    async def get_existing_session_ids(self, session_ids: list[str]) -> set[str]:
+        if not session_ids:
+            return set()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.exists(self._key(session_id))
+            found = await pipe.execute()
+        return {
+            session_id
+            for session_id, exists in zip(session_ids, found, strict=True)
+            if exists
+        }
+
+    async def remove_from_active_index(self, session_ids: list[str]) -> None:
+        if session_ids:
+            await self._redis.zrem(ACTIVE_SESSIONS_KEY, *session_ids)
+
+    async def request_stop(self, session_id: str) -> None:
+        # The stop key doubles as the channel name: the key covers workers that
+        # subscribe late, the message wakes the ones already listening.
+        key = self._stop_key(session_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, 1, ex=_TTL)
+            pipe.publish(key, 1)
+            await pipe.execute()
+
+    async def clear_stop_request(self, session_id: str) -> None:
+        await self._redis.delete(self._stop_key(session_id))
+
+    async def wait_for_stop(self, session_id: str) -> None:
+        key = self._stop_key(session_id)
+        async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(key)
+            if await self._redis.exists(key):
+                return
+            async for _message in pubsub.listen():
+                return
 
     async def try_acquire_run_lock(
         self,
@@ -186,20 +897,27 @@ class EmulationSessionStore:
         )
         return bool(locked)
 
+    async def refresh_run_lock(self, session_id: str, holder: str, ttl_seconds: int) -> bool:
+        return await self._refresh_lock(self._run_lock_key(session_id), holder, ttl_seconds)
+
     async def release_run_lock(self, session_id: str, holder: str) -> None:
-        key = self._run_lock_key(session_id)
-        current_holder = await self._redis.get(key)
-        if current_holder is None:
-            return
-        if isinstance(current_holder, bytes):
-            current_holder = current_holder.decode("utf-8", errors="ignore")
-        if str(current_holder) != holder:
-            return
-        await self._redis.delete(key)
+        await self._release_lock_script(keys=[self._run_lock_key(session_id)], args=[holder])
 
     async def is_run_lock_active(self, session_id: str) -> bool:
         return bool(await self._redis.exists(self._run_lock_key(session_id)))
 
+    async def get_active_run_locks(self, session_ids: list[str]) -> set[str]:
+        if not session_ids:
+            return set()
+        holders = await self._redis.mget(
+            [self._run_lock_key(session_id) for session_id in session_ids]
+        )
+        return {
+            session_id
+            for session_id, holder in zip(session_ids, holders, strict=True)
+            if holder is not None
+        }
+
     async def try_acquire_profile_lock(
         self,
         profile_id: str,
@@ -207,91 +925,59 @@ class EmulationSessionStore:
         ttl_seconds: int,
     ) -> bool:
         key = self._profile_lock_key(profile_id)
-        ttl = max(ttl_seconds, 1)
+        ttl_ms = max(ttl_seconds, 1) * 1000
 
         for attempt in range(3):
-            locked = await self._redis.set(key, holder, ex=ttl, nx=True)
-            if locked:
-                return True
-
-            current_holder = await self._redis.get(key)
-            if isinstance(current_holder, bytes):
-                current_holder = current_holder.decode("utf-8", errors="ignore")
-            current_ttl_ms = await self._redis.pttl(key)
-            current_session_id = self._holder_session_id(str(current_holder) if current_holder else None)
-
-            is_stale = False
-            current_status = None
-            current_age_seconds = None
-            if current_session_id:
-                current_payload = await self.get(current_session_id)
-                if current_payload is None:
-                    is_stale = True
-                else:
-                    current_status = current_payload.get("status")
-                    updated_at = current_payload.get("updated_at")
-                    if isinstance(updated_at, (int, float)):
-                        current_age_seconds = max(0.0, time.time() - updated_at)
-
-                run_lock_active = await self.is_run_lock_active(current_session_id)
-                if not run_lock_active:
-                    is_stale = True
-                elif (
-                    current_status in SESSION_TERMINAL_STATUSES
-                    and current_age_seconds is not None
-                    and current_age_seconds >= _STALE_TERMINAL_LOCK_GRACE_SECONDS
-                ):
-                    is_stale = True
-                elif (
-                    current_status in {SessionStatus.RUNNING, SessionStatus.QUEUED}
-                    and current_age_seconds is not None
-                    and current_age_seconds >= _STALE_ACTIVE_LOCK_GRACE_SECONDS
-                ):
-                    is_stale = True
-
-            if is_stale and current_holder:
+            acquired, stolen, current_holder, current_status, current_age, current_ttl_ms = (
+                await self._acquire_profile_lock_script(
+                    keys=[key],
+                    args=[
+                        holder,
+                        ttl_ms,
+                        time.time(),
+                        _STALE_TERMINAL_LOCK_GRACE_SECONDS,
+                        _STALE_ACTIVE_LOCK_GRACE_SECONDS,
+                        self._key(""),
+                        self._run_lock_key(""),
+                        ",".join(SESSION_TERMINAL_STATUSES),
+                        ",".join((SessionStatus.RUNNING, SessionStatus.QUEUED)),
+                    ],
+                )
+            )
+            current_holder = _decode_text(current_holder)
+            current_status = _decode_text(current_status) or None
+            current_age_seconds = float(current_age)
+            if stolen:
                 logger.warning(
-                    "Clearing stale profile lock for %s held by %s (ttl_ms=%s status=%s age=%.1fs)",
+                    "Cleared stale profile lock for %s held by %s (ttl_ms=%s status=%s age=%.1fs)",
                     profile_id,
                     current_holder,
                     current_ttl_ms,
                     current_status,
-                    current_age_seconds or -1.0,
+                    current_age_seconds,
                 )
-                latest_holder = await self._redis.get(key)
-                if isinstance(latest_holder, bytes):
-                    latest_holder = latest_holder.decode("utf-8", errors="ignore")
-                if latest_holder == current_holder:
-                    if current_session_id:
-                        await self._redis.delete(self._run_lock_key(current_session_id))
-                    await self._redis.delete(key)
-                    continue
+            if acquired:
+                return True
 
             logger.warning(
-                "Profile lock busy for %s on attempt %s/3 (holder=%s ttl_ms=%s stale=%s status=%s age=%.1fs)",
+                "Profile lock busy for %s on attempt %s/3 (holder=%s ttl_ms=%s status=%s age=%.1fs)",
                 profile_id,
                 attempt + 1,
                 current_holder,
                 current_ttl_ms,
-                is_stale,
                 current_status,
-                current_age_seconds or -1.0,
+                current_age_seconds,
             )
             if attempt < 2:
                 await asyncio.sleep(0.25 * (attempt + 1))
 
         return False
 
+    async def refresh_profile_lock(self, profile_id: str, holder: str, ttl_seconds: int) -> bool:
+        return await self._refresh_lock(self._profile_lock_key(profile_id), holder, ttl_seconds)
+
     async def release_profile_lock(self, profile_id: str, holder: str) -> None:
-        key = self._profile_lock_key(profile_id)
-        current_holder = await self._redis.get(key)
-        if current_holder is None:
-            return
-        if isinstance(current_holder, bytes):
-            current_holder = current_holder.decode("utf-8", errors="ignore")
-        if str(current_holder) != holder:
-            return
-        await self._redis.delete(key)
+        await self._release_lock_script(keys=[self._profile_lock_key(profile_id)], args=[holder])
 
     async def try_acquire_analysis_lock(
         self,
@@ -307,16 +993,11 @@ class EmulationSessionStore:
         )
         return bool(locked)
 
+    async def refresh_analysis_lock(self, session_id: str, holder: str, ttl_seconds: int) -> bool:
+        return await self._refresh_lock(self._analysis_lock_key(session_id), holder, ttl_seconds)
+
     async def release_analysis_lock(self, session_id: str, holder: str) -> None:
-        key = self._analysis_lock_key(session_id)
-        current_holder = await self._redis.get(key)
-        if current_holder is None:
-            return
-        if isinstance(current_holder, bytes):
-            current_holder = current_holder.decode("utf-8", errors="ignore")
-        if str(current_holder) != holder:
-            return
-        await self._redis.delete(key)
+        await self._release_lock_script(keys=[self._analysis_lock_key(session_id)], args=[holder])
 
     async def clear_session_locks(
         self,
@@ -324,53 +1005,78 @@ class EmulationSessionStore:
         *,
         profile_id: str | None = None,
     ) -> None:
-        await self._redis.delete(self._run_lock_key(session_id))
-        await self._redis.delete(self._analysis_lock_key(session_id))
+        await self._redis.delete(
+            self._run_lock_key(session_id),
+            self._analysis_lock_key(session_id),
+        )
         if not profile_id:
             return
+        await self._release_session_lock_script(
+            keys=[self._profile_lock_key(profile_id)],
+            args=[session_id],
+        )
 
-        key = self._profile_lock_key(profile_id)
-        current_holder = await self._redis.get(key)
-        if current_holder is None:
-            return
-        if isinstance(current_holder, bytes):
-            current_holder = current_holder.decode("utf-8", errors="ignore")
-        if self._holder_session_id(str(current_holder)) != session_id:
-            return
-        await self._redis.delete(key)
+    async def _refresh_lock(self, key: str, holder: str, ttl_seconds: int) -> bool:
+        refreshed = await self._refresh_lock_script(
+            keys=[key],
+            args=[holder, max(ttl_seconds, 1) * 1000],
+        )
+        return bool(refreshed)
 
-    async def sync_progress(
-        self,
-        session_id: str,
+    @staticmethod
+    def pending_progress_fields(
         state: SessionState,
         bytes_downloaded: int,
-    ) -> None:
-        current_payload = await self.get(session_id) or {}
-        watched_ads = _merge_live_capture_analysis(
-            current_ads=current_payload.get("watched_ads") or [],
-            next_ads=state.watched_ads,
-        )
-        await self.update(
-            session_id,
-            status=SessionStatus.RUNNING,
-            mode=state.mode.value,
-            fatigue=round(state.fatigue, 2),
-            current_topic=state.current_topic,
-            current_watch=state.current_watch,
-            topics_searched=state.searched_topics,
-            videos_watched=state.completed_watched_videos_count(),
-            watched_videos_count=state.watched_videos_count(),
-            watched_videos=state.watched_videos,
-            watched_ads_count=len(watched_ads),
-            watched_ads=watched_ads,
-            watched_ads_analytics=build_ads_analytics(watched_ads),
-            total_duration_seconds=_watched_duration_seconds(state.watched_videos),
-            bytes_downloaded=bytes_downloaded,
-            personality={
+    ) -> dict[str, object]:
+        progress_fields = {
+            "status": SessionStatus.RUNNING,
+            "mode": state.mode.value,
+            "fatigue": round(state.fatigue, 2),
+            "current_topic": state.current_topic,
+            "current_watch": state.current_watch,
+            "topics_searched": state.searched_topics,
+            "videos_watched": state.completed_watched_videos_count(),
+            "watched_videos_count": state.watched_videos_count(),
+            "watched_ads_count": len(state.watched_ads),
+            "total_duration_seconds": _watched_duration_seconds(state.watched_videos),
+            "bytes_downloaded": bytes_downloaded,
+            "personality": {
                 "pace": state.personality.pace,
                 "patience": state.personality.patience,
                 "focus_span": state.personality.focus_span,
                 "search_style": state.personality.search_style,
                 "ad_tolerance": state.personality.ad_tolerance,
             },
+        }
+        # Only the fields that changed since the last sync; raw values are
+        # compared so the dirty check never pays for encoding.
+        return {
+            name: value
+            for name, value in progress_fields.items()
+            if name not in state.synced_progress_fields
+            or state.synced_progress_fields[name] != value
+        }
+
+    async def sync_progress(
+        self,
+        session_id: str,
+        state: SessionState,
+        fields: dict[str, object],
+    ) -> None:
+        video_indices, ad_indices = state.take_pending_list_changes()
+        # updated_at always goes out: an otherwise empty sync is the liveness heartbeat.
+        changed_fields = {**fields, "updated_at": time.time()}
+        try:
+            await self._sync_lists(
+                session_id,
+                changed_fields,
+                watched_videos=(state.watched_videos, video_indices),
+                watched_ads=(state.watched_ads, ad_indices),
+            )
+        except Exception:
+            state.restore_pending_list_changes(video_indices, ad_indices)
+            raise
+        # Copies, since current_watch and topics_searched are mutated in place.
+        state.synced_progress_fields.update(
+            (name, copy.deepcopy(value)) for name, value in fields.items()
         )
@@ -3,15 +3,13 @@ import logging
 from collections.abc import Awaitable, Callable
 
 from .browser.humanizer import Humanizer
-from .browser.traffic import TrafficTracker
 from .actions import WATCH_ACTIONS
 from .config import LIVE_PROGRESS_SYNC_INTERVAL_S, WATCH_ACTION_MIN_REMAINING_S
 from .decision import ActionPicker
 from .session.clock import SessionClock
 from .session.fatigue import FatigueManager
+from .session.progress_writer import ProgressWriter
 from .session.state import SessionState
-from app.api.modules.emulation.models import SessionStatus
-from .session.store import EmulationSessionStore
 from .workflow.dispatcher import ActionDispatcher
 
 logger = logging.getLogger(__name__)
@@ -28,8 +26,7 @@ class SessionLoop:
         dispatcher: ActionDispatcher,
         fatigue: FatigueManager,
         humanizer: Humanizer,
-        traffic: TrafficTracker,
-        session_store: EmulationSessionStore,
+        progress_writer: ProgressWriter,
         flush_pending_captures: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         self._state = state
@@ -38,8 +35,7 @@ class SessionLoop:
         self._dispatcher = dispatcher
         self._fatigue = fatigue
         self._humanizer = humanizer
-        self._traffic = traffic
-        self._store = session_store
+        self._progress = progress_writer
         self._flush_pending_captures = flush_pending_captures
         self._stop_requested = False
 
@@ -48,6 +44,12 @@ class SessionLoop:
         return self._stop_requested
 
     async def run(self) -> None:
+        try:
+            await self._run_cycles()
+        finally:
+            await self._progress.close()
+
+    async def _run_cycles(self) -> None:
         session_id = self._state.session_id
         cycle_number = 0
 
@@ -151,19 +153,11 @@ class SessionLoop:
             await self._sync_progress_once()
 
     async def _sync_progress_once(self) -> None:
-        session_id = self._state.session_id
-        data = await self._store.get(session_id)
-        if data and (data.get("stop_requested") or data.get("status") == SessionStatus.STOPPED):
-            logger.info("Session %s: stop requested by user", session_id)
+        if self._state.stop_requested:
             self._stop_requested = True
-            self._state.request_stop()
             return
         await self._flush_pending_capture_updates()
-        await self._store.sync_progress(
-            session_id,
-            self._state,
-            self._traffic.bytes_downloaded,
-        )
+        await self._progress.sync()
 
     async def _flush_pending_capture_updates(self) -> None:
         if self._flush_pending_captures is None:
@@ -1,13 +1,14 @@
+from .capture_writer import CaptureWriter
 from .dispatcher import ActionDispatcher, SessionRuntimeClosedError
 from .finalizer import finalize_completed, finalize_stopped
-from .progress import persist_incremental_ad_captures, persist_safely, queue_ad_analysis
+from .progress import persist_safely, queue_ad_analysis
 
 __all__ = [
     "ActionDispatcher",
+    "CaptureWriter",
     "SessionRuntimeClosedError",
     "finalize_completed",
     "finalize_stopped",
-    "persist_incremental_ad_captures",
     "persist_safely",
     "queue_ad_analysis",
 ]
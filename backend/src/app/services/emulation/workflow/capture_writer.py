@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.engine import SessionFactory
+from app.database.uow import UnitOfWork
+from app.services.emulation.config import (
+    CAPTURE_PERSIST_FLUSH_INTERVAL_S,
+    CAPTURE_PERSIST_MAX_BATCH,
+)
+from app.services.emulation.persistence import EmulationPersistenceService
+
+logger = logging.getLogger(__name__)
+
+# (watched_ads, previous_count, persisted_count) after a batch is committed.
+OnCapturesPersisted = Callable[[list[dict[str, object]], int, int], Awaitable[None]]
+
+
+class CaptureWriter:
+    """Per-run capture persistence: ready captures are batched into one commit."""
+
+    def __init__(
+        self,
+        session_id: str,
+        persisted_count: int,
+        on_persisted: OnCapturesPersisted,
+        *,
+        flush_interval_s: float = CAPTURE_PERSIST_FLUSH_INTERVAL_S,
+        max_batch: int = CAPTURE_PERSIST_MAX_BATCH,
+    ) -> None:
+        self._session_id = session_id
+        self._persisted_count = persisted_count
+        self._on_persisted = on_persisted
+        self._flush_interval_s = flush_interval_s
+        self._max_batch = max_batch
+        self._watched_ads: list[dict[str, object]] = []
+        self._lock = asyncio.Lock()
+        self._deferred: asyncio.Task[None] | None = None
+        self._session: AsyncSession | None = None
+        self._stats: Counter[str] = Counter()
+
+    @property
+    def persisted_count(self) -> int:
+        return self._persisted_count
+
+    async def submit(self, watched_ads: list[dict[str, object]]) -> None:
+        self._stats["submits"] += 1
+        self._watched_ads = watched_ads
+        pending = len(watched_ads) - self._persisted_count
+        if pending <= 0:
+            return
+        # A full batch is written inline, which also bounds the backlog.
+        if pending >= self._max_batch:
+            self._cancel_deferred()
+            await self.flush()
+            return
+        if self._deferred is None or self._deferred.done():
+            self._deferred = asyncio.create_task(self._deferred_flush())
+
+    async def flush(self) -> None:
+        async with self._lock:
+            watched_ads = self._watched_ads
+            previous_count = self._persisted_count
+            persisted_count = len(watched_ads)
+            if previous_count >= persisted_count:
+                return
+
+            if self._session is None:
+                self._session = SessionFactory()
+            persistence = EmulationPersistenceService(UnitOfWork(self._session))
+            try:
+                await persistence.persist_ad_captures(
+                    session_id=self._session_id,
+                    watched_ads=watched_ads[:persisted_count],
+                    from_index=previous_count,
+                )
+            except Exception:
+                # Left pending: the next batch or the final flush retries it.
+                logger.exception(
+                    "Session %s: failed to persist incremental ad captures",
+                    self._session_id,
+                )
+                await persistence.rollback()
+                return
+
+            self._persisted_count = persisted_count
+            self._stats["commits"] += 1
+            self._stats["captures"] += persisted_count - previous_count
+            await self._on_persisted(watched_ads, previous_count, persisted_count)
+
+    async def close(self) -> None:
+        self._cancel_deferred()
+        try:
+            await self.flush()
+        finally:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+        if self._stats["submits"]:
+            logger.info(
+                "Session %s: capture writer submits=%d commits=%d captures=%d",
+                self._session_id,
+                self._stats["submits"],
+                self._stats["commits"],
+                self._stats["captures"],
+            )
+            self._stats.clear()
+
+    def _cancel_deferred(self) -> None:
+        if self._deferred is not None and not self._deferred.done():
+            self._deferred.cancel()
+        self._deferred = None
+
+    async def _deferred_flush(self) -> None:
+        await asyncio.sleep(self._flush_interval_s)
+        # Detach before flushing so close() cannot cancel a commit in flight.
+        self._deferred = None
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.warning(
+                "Session %s: deferred capture flush failed: %s",
+                self._session_id,
+                exc,
+            )
@@ -12,6 +12,7 @@ from ..actions import SEARCH_ACTIONS, WATCH_ACTIONS, Action
 from ..config import AD_COMPLETION_OVERFLOW_MAX_S, MAX_CONSECUTIVE_FAILURES
 from ..session.clock import SessionClock
 from ..session.state import SessionState
+from ..session.stop_signal import SessionStopSignal
 
 logger = logging.getLogger(__name__)
 _ACTION_CANCEL_GRACE_SECONDS = 10.0
@@ -24,6 +25,10 @@ class SessionRuntimeClosedError(RuntimeError):
     pass
 
 
+class ActionStoppedError(RuntimeError):
+    pass
+
+
 class ActionDispatcher:
     def __init__(
         self,
@@ -31,10 +36,12 @@ class ActionDispatcher:
         navigator: Navigator,
         watcher: VideoWatcher,
         clock: SessionClock,
+        stop_signal: SessionStopSignal | None = None,
     ) -> None:
         self._state = state
         self._nav = navigator
         self._clock = clock
+        self._stop_signal = stop_signal
         self._handlers: dict[Action, Callable[[], Coroutine[Any, Any, None]]] = {
             Action.CLICK_RECOMMENDED: watcher.click_recommended,
             Action.WATCH_LONG: watcher.watch_long,
@@ -81,6 +88,28 @@ class ActionDispatcher:
                 self._state.surf_streak,
             )
             self._update_anchor_streak(action, videos_delta)
+        except ActionStoppedError:
+            cancelled = await self._cancel_task(action_task)
+            if action in WATCH_ACTIONS:
+                if self._state.finalize_current_watch(completed=False):
+                    logger.info(
+                        "Session %s: recorded partial watch after stop on %s",
+                        self._state.session_id,
+                        action,
+                    )
+                else:
+                    self._state.clear_current_watch()
+            logger.info(
+                "Session %s: cancelled %s after %.1fs on stop request",
+                self._state.session_id,
+                action,
+                time.monotonic() - started_at,
+            )
+            if not cancelled:
+                raise SessionRuntimeClosedError(
+                    f"Stopped {action} could not be cancelled cleanly",
+                ) from None
+            return
         except TimeoutError:
             self._state.consecutive_fails += 1
             cancelled = await self._cancel_task(action_task)
@@ -237,53 +266,68 @@ class ActionDispatcher:
             self._watch_progress_signature() if action in WATCH_ACTIONS else None
         )
 
-        while True:
-            remaining_timeout = deadline - time.monotonic()
-            if remaining_timeout <= 0:
-                raise TimeoutError
+        stop_waiter = (
+            asyncio.create_task(self._stop_signal.wait())
+            if self._stop_signal is not None
+            else None
+        )
+        waiters: set[asyncio.Task[None]] = {action_task}
+        if stop_waiter is not None:
+            waiters.add(stop_waiter)
 
-            try:
-                await asyncio.wait_for(
-                    asyncio.shield(action_task),
+        try:
+            while True:
+                remaining_timeout = deadline - time.monotonic()
+                if remaining_timeout <= 0:
+                    raise TimeoutError
+
+                done, _ = await asyncio.wait(
+                    waiters,
                     timeout=min(_ACTION_PROGRESS_POLL_SECONDS, remaining_timeout),
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                return
-            except TimeoutError:
-                pass
-
-            if action not in WATCH_ACTIONS:
-                continue
-
-            progress_signature = self._watch_progress_signature()
-            if progress_signature != last_progress_signature:
-                last_progress_signature = progress_signature
-                post_deadline_stall_started_at = None
-                continue
-
-            if self._state.remaining_seconds() > 0:
-                post_deadline_stall_started_at = None
-                continue
-
-            if post_deadline_stall_started_at is None:
-                post_deadline_stall_started_at = time.monotonic()
-                logger.warning(
-                    "Session %s: %s exceeded deadline; waiting %.0fs for watch progress before cancellation",
-                    self._state.session_id,
-                    action,
-                    _POST_DEADLINE_WATCH_STALL_GRACE_SECONDS,
-                )
-                continue
+                if action_task in done:
+                    await action_task
+                    return
+                if stop_waiter is not None and stop_waiter in done:
+                    raise ActionStoppedError
 
-            if (
-                time.monotonic() - post_deadline_stall_started_at
-                >= _POST_DEADLINE_WATCH_STALL_GRACE_SECONDS
-            ):
-                logger.error(
-                    "Session %s: %s stalled past deadline with no progress",
-                    self._state.session_id,
-                    action,
-                )
-                raise TimeoutError
+                if action not in WATCH_ACTIONS:
+                    continue
+
+                progress_signature = self._watch_progress_signature()
+                if progress_signature != last_progress_signature:
+                    last_progress_signature = progress_signature
+                    post_deadline_stall_started_at = None
+                    continue
+
+                if self._state.remaining_seconds() > 0:
+                    post_deadline_stall_started_at = None
+                    continue
+
+                if post_deadline_stall_started_at is None:
+                    post_deadline_stall_started_at = time.monotonic()
+                    logger.warning(
+                        "Session %s: %s exceeded deadline; waiting %.0fs for watch progress before cancellation",
+                        self._state.session_id,
+                        action,
+                        _POST_DEADLINE_WATCH_STALL_GRACE_SECONDS,
+                    )
+                    continue
+
+                if (
+                    time.monotonic() - post_deadline_stall_started_at
+                    >= _POST_DEADLINE_WATCH_STALL_GRACE_SECONDS
+                ):
+                    logger.error(
+                        "Session %s: %s stalled past deadline with no progress",
+                        self._state.session_id,
+                        action,
+                    )
+                    raise TimeoutError
+        finally:
+            if stop_waiter is not None:
+                stop_waiter.cancel()
 
     def _watch_progress_signature(self) -> tuple[object, ...]:
         current_watch = self._state.current_watch or {}
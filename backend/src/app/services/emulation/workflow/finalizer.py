@@ -4,7 +4,6 @@ import time
 
 from app.api.modules.emulation.models import SessionStatus
 from app.services.emulation.common import derive_watched_video_counters
-from app.services.emulation.core.ad_analytics import build_ads_analytics
 from app.services.emulation.session.store import EmulationSessionStore
 
 
@@ -30,7 +29,6 @@ async def finalize_completed(
         watched_videos=result.watched_videos,
         watched_ads_count=len(result.watched_ads),
         watched_ads=result.watched_ads,
-        watched_ads_analytics=build_ads_analytics(result.watched_ads),
         total_duration_seconds=result.total_duration_seconds,
         mode=current_mode,
         fatigue=current_fatigue,
@@ -66,7 +64,6 @@ async def finalize_stopped(
         watched_videos=result.watched_videos,
         watched_ads_count=len(result.watched_ads),
         watched_ads=result.watched_ads,
-        watched_ads_analytics=build_ads_analytics(result.watched_ads),
         total_duration_seconds=result.total_duration_seconds,
         mode=current_mode,
         fatigue=current_fatigue,
@@ -74,3 +71,4 @@ async def finalize_stopped(
         orchestration=None,
         error="Stopped by user",
     )
+    await session_store.clear_stop_request(session_id)
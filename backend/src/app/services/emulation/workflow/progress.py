@@ -3,8 +3,6 @@ from __future__ import annotations
 import logging
 
 from app.api.modules.emulation.models import PostProcessingStatus
-from app.database.engine import SessionFactory
-from app.database.uow import UnitOfWork
 from app.services.emulation.persistence import EmulationPersistenceService
 from app.services.emulation.session.store import EmulationSessionStore
 from app.tiq import ANALYSIS_QUEUE_NAME, broker
@@ -82,18 +80,3 @@ async def queue_ad_analysis(
             post_processing_total=analysis_total,
         )
 
-
-async def persist_incremental_ad_captures(
-    *,
-    session_id: str,
-    watched_ads: list[dict[str, object]],
-    from_index: int,
-) -> None:
-    async with SessionFactory() as session:
-        async with UnitOfWork(session) as uow:
-            persistence = EmulationPersistenceService(uow)
-            await persistence.persist_ad_captures(
-                session_id=session_id,
-                watched_ads=watched_ads,
-                from_index=from_index,
-            )
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Mapping
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+_KEY_PREFIX = "metrics:"
+# Scrapes read Redis synchronously inside the API's event loop, so the client
+# must give up quickly rather than stall every request.
+SHARED_METRICS_REDIS_TIMEOUT_S = 0.5
+logger = logging.getLogger(__name__)
+
+# field -> (kind, documentation); kind is "counter" or "gauge".
+MetricGroup = Mapping[str, tuple[str, str]]
+
+
+def _metrics_key(group: str) -> str:
+    return f"{_KEY_PREFIX}{group}"
+
+
+class SharedMetrics:
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def increment(self, group: str, **deltas: float) -> None:
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        key = _metrics_key(group)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for name, delta in deltas.items():
+                pipe.hincrbyfloat(key, name, delta)
+            await pipe.execute()
+
+    async def set(self, group: str, **values: float) -> None:
+        if values:
+            await self._redis.hset(_metrics_key(group), mapping=values)
+
+
+# Workers increment the Redis hashes; only the API is scraped, so it exports them.
+class SharedMetricsCollector(Collector):
+    def __init__(self, redis: SyncRedis, groups: Mapping[str, MetricGroup]) -> None:
+        self._redis = redis
+        self._groups = groups
+
+    def describe(self) -> Iterator[Metric]:
+        # Lets REGISTRY.register check names without a Redis round trip.
+        for group, fields in self._groups.items():
+            for name, (kind, documentation) in fields.items():
+                yield _metric_family(f"{group}_{name}", kind, documentation, 0.0)
+
+    def collect(self) -> Iterator[Metric]:
+        groups = list(self._groups)
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for group in groups:
+                    pipe.hgetall(_metrics_key(group))
+                results = pipe.execute()
+        except RedisError as exc:
+            logger.warning("Failed to read shared metrics: %s", exc)
+            return
+
+        for group, raw in zip(groups, results, strict=True):
+            for name, (kind, documentation) in self._groups[group].items():
+                try:
+                    value = float(raw.get(name.encode(), 0))
+                except ValueError:
+                    value = 0.0
+                yield _metric_family(f"{group}_{name}", kind, documentation, value)
+
+
+def _metric_family(name: str, kind: str, documentation: str, value: float) -> Metric:
+    if kind == "gauge":
+        return GaugeMetricFamily(name, documentation, value=value)
+    return CounterMetricFamily(name, documentation, value=value)
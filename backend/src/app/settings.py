@@ -77,6 +77,21 @@ class GeminiConfig(BaseModel):
     model: str = "gemini-2.5-flash"
 
 
+class AdAnalysisConfig(BaseModel):
+    # Finished verdicts are committed once either limit is reached.
+    commit_batch_size: int = 5
+    commit_interval_seconds: float = 5.0
+    # Captures analysed at once per worker process; the global limit spans
+    # all workers through Redis and is off at 0.
+    max_concurrency: int = 4
+    global_max_concurrency: int = 0
+    global_slot_ttl_seconds: float = 900.0
+    # Captures without an exact cached verdict reuse one from a capture whose
+    # fingerprint is within this mean per-frame Hamming distance (of 64 bits).
+    fingerprint_max_distance: float = 8.0
+    fingerprint_concurrency: int = 2
+
+
 class StorageConfig(BaseModel):
     base_path: Path = Path("artifacts")
     ad_captures_subdir: str = "ad_captures"
@@ -119,6 +134,7 @@ class Config(BaseSettings):
     adspower: AdsPowerConfig = AdsPowerConfig()
     storage: StorageConfig = StorageConfig()
     gemini: GeminiConfig = GeminiConfig()
+    ad_analysis: AdAnalysisConfig = AdAnalysisConfig()
 
     paths: PathsConfig = PathsConfig()
 
@@ -1,6 +1,8 @@
+from .dashboard import refresh_dashboard_rollups_task
 from .health import health_check
+from .sessions import reconcile_stale_sessions_task
 
-__all__ = ["health_check"]
+__all__ = ["health_check", "reconcile_stale_sessions_task", "refresh_dashboard_rollups_task"]
 
 try:
     from .browser import open_site_task
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import logging
 import uuid
 from typing import Any
@@ -26,55 +27,15 @@ async def _sync_live_capture_analysis_state(
     session_id: str,
     session_store: EmulationSessionStore,
     ad_analysis: AdAnalysisService,
-) -> None:
-    live_payload = await session_store.get(session_id)
-    if live_payload is None:
-        return
-
-    watched_ads = live_payload.get("watched_ads")
-    if not isinstance(watched_ads, list) or not watched_ads:
-        return
-
-    updates = await ad_analysis.build_live_capture_analysis_state(session_id)
+    since: datetime.datetime | None,
+) -> datetime.datetime | None:
+    updates, watermark = await ad_analysis.build_live_capture_analysis_state(session_id, since)
     if not updates:
-        return
-
-    changed = False
-    normalized_ads: list[dict[str, object]] = []
-    for item in watched_ads:
-        if not isinstance(item, dict):
-            normalized_ads.append(item)
-            continue
-
-        ad = dict(item)
-        ad_position = ad.get("position")
-        if not isinstance(ad_position, int):
-            normalized_ads.append(ad)
-            continue
-
-        capture_update = updates.get(ad_position)
-        if capture_update is None:
-            normalized_ads.append(ad)
-            continue
-
-        capture_payload = ad.get("capture")
-        if isinstance(capture_payload, dict):
-            merged_capture = dict(capture_payload)
-        else:
-            merged_capture = {}
-        merged_capture.update(capture_update)
-        ad["capture"] = merged_capture
-        normalized_ads.append(ad)
-        changed = True
-
-    if not changed:
-        return
-
-    await session_store.update(
-        session_id,
-        watched_ads=normalized_ads,
-        watched_ads_count=max(int(live_payload.get("watched_ads_count") or 0), len(normalized_ads)),
-    )
+        return watermark
+    patched = await session_store.patch_ad_captures(session_id, updates)
+    # Keep the old watermark until every verdict has reached the live
+    # session, so the next sync retries the ones that did not land.
+    return watermark if patched >= len(updates) else since
 
 
 @broker.task(task_name="ad_analysis_task", timeout=14400)
@@ -104,15 +65,19 @@ async def ad_analysis_task(
         logger.info("Session %s: skipping ad analysis — another analysis task is active", session_id)
         return {"status": "already_running", "session_id": session_id}
 
+    # The first sync of a run covers every capture; later ones only verdicts
+    # written since the previous sync.
+    synced_at: datetime.datetime | None = None
     try:
         while True:
             pending_total = await ad_analysis.get_session_analysis_workload(session_id)
             if pending_total <= 0:
                 final_status, done, total = await ad_analysis.summarize_session_analysis(session_id)
-                await _sync_live_capture_analysis_state(
+                synced_at = await _sync_live_capture_analysis_state(
                     session_id=session_id,
                     session_store=session_store,
                     ad_analysis=ad_analysis,
+                    since=synced_at,
                 )
                 if total > 0:
                     await session_store.update(
@@ -141,10 +106,11 @@ async def ad_analysis_task(
                 post_processing_done=0,
                 post_processing_total=pending_total,
             )
-            await _sync_live_capture_analysis_state(
+            synced_at = await _sync_live_capture_analysis_state(
                 session_id=session_id,
                 session_store=session_store,
                 ad_analysis=ad_analysis,
+                since=synced_at,
             )
 
             try:
@@ -159,10 +125,11 @@ async def ad_analysis_task(
                 )
                 raise
 
-            await _sync_live_capture_analysis_state(
+            synced_at = await _sync_live_capture_analysis_state(
                 session_id=session_id,
                 session_store=session_store,
                 ad_analysis=ad_analysis,
+                since=synced_at,
             )
 
             if total > 0:
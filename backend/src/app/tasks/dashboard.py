@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from dishka import FromDishka
+from dishka.integrations.taskiq import inject
+
+from app.api.modules.emulation.service import EmulationHistoryService
+from app.tiq import broker
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(
+    task_name="refresh_dashboard_rollups_task",
+    schedule=[{"cron": "* * * * *"}],
+    timeout=55,
+)
+@inject
+async def refresh_dashboard_rollups_task(
+    history_service: FromDishka[EmulationHistoryService],
+) -> dict:
+    started = time.perf_counter()
+    days = await history_service.refresh_dashboard_rollups()
+    duration = time.perf_counter() - started
+    logger.debug("Refreshed dashboard rollups for %d days in %.3fs", days, duration)
+    return {"days": days, "duration_seconds": duration}
@@ -6,11 +6,13 @@ from dishka import FromDishka
 from dishka.integrations.taskiq import inject
 
 from app.services.browser.provider import BrowserSessionProvider
+from app.services.emulation.browser.ads.registry import AdCreativeRegistry
 from app.services.emulation.core.capture_factory import AdCaptureProviderFactory
 from app.services.emulation.orchestrator import EmulationOrchestrationService
 from app.services.emulation.persistence import EmulationPersistenceService
 from app.services.emulation.run import EmulationRunService
 from app.services.emulation.session.store import EmulationSessionStore
+from app.services.metrics import SharedMetrics
 from app.settings import Config
 from app.tiq import broker
 
@@ -32,6 +34,8 @@ async def emulation_task(
     config: FromDishka[Config],
     persistence: FromDishka[EmulationPersistenceService],
     orchestrator: FromDishka[EmulationOrchestrationService],
+    metrics: FromDishka[SharedMetrics],
+    creative_registry: FromDishka[AdCreativeRegistry],
     ad_analysis: FromDishka[AdAnalysisService] = None,
     profile_id: str | None = None,
 ) -> dict:
@@ -43,6 +47,8 @@ async def emulation_task(
         persistence=persistence,
         orchestrator=orchestrator,
         ad_analysis=ad_analysis,
+        metrics=metrics,
+        creative_registry=creative_registry,
     )
     return await run_service.run(
         session_id=session_id,
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from dishka import FromDishka
+from dishka.integrations.taskiq import inject
+
+from app.api.modules.emulation.service import (
+    STALE_RECONCILER_METRICS_GROUP,
+    EmulationSessionService,
+)
+from app.services.metrics import SharedMetrics
+from app.tiq import broker
+
+logger = logging.getLogger(__name__)
+
+
+@broker.task(
+    task_name="reconcile_stale_sessions_task",
+    schedule=[{"cron": "* * * * *"}],
+    timeout=55,
+)
+@inject
+async def reconcile_stale_sessions_task(
+    session_service: FromDishka[EmulationSessionService],
+    metrics: FromDishka[SharedMetrics],
+) -> dict:
+    started = time.perf_counter()
+    reconciled = 0
+    failed = False
+    try:
+        reconciled = await session_service.reconcile_stale_sessions()
+    except Exception:
+        failed = True
+        logger.exception("Stale session reconciliation failed")
+    duration = time.perf_counter() - started
+
+    await metrics.increment(
+        STALE_RECONCILER_METRICS_GROUP,
+        runs=1,
+        failures=int(failed),
+        reconciled_sessions=reconciled,
+        duration_seconds=duration,
+    )
+    await metrics.set(
+        STALE_RECONCILER_METRICS_GROUP,
+        last_duration_seconds=duration,
+        last_run_timestamp_seconds=time.time(),
+    )
+    if reconciled:
+        logger.info("Reconciled %d stale sessions in %.3fs", reconciled, duration)
+    return {"reconciled": reconciled, "duration_seconds": duration, "failed": failed}
@@ -104,3 +104,23 @@ def create_user(
             typer.echo(f"User '{username}' ({role}) created successfully.")
 
     anyio.run(_create_user)
+
+
+@app.command("rebuild_dashboard_rollups")
+def rebuild_dashboard_rollups() -> None:
+    """Recompute every dashboard rollup from history and captures."""
+
+    async def _rebuild():
+        container = get_async_container()
+        async with container() as request_container:
+            uow = await request_container.get(UnitOfWork)
+            await uow.dashboard_rollups.rebuild()
+            await uow.commit()
+            typer.echo(
+                typer.style(
+                    "Dashboard rollups rebuilt successfully.",
+                    fg=typer.colors.GREEN,
+                ),
+            )
+
+    anyio.run(_rebuild)
@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.modules.emulation.models import AnalysisStatus, VideoStatus
+from app.database.uow import UnitOfWork
+
+
+def _row(
+    session_id: str,
+    position: int,
+    analysis_status: str,
+    video_status: str = VideoStatus.COMPLETED,
+    *,
+    video_file: str | None = "",
+) -> dict:
+    if video_file == "":
+        video_file = f"{session_id}/{position}/video.mp4"
+    return {
+        "session_id": session_id,
+        "ad_position": position,
+        "video_status": video_status,
+        "video_file": video_file,
+        "analysis_status": analysis_status,
+    }
+
+
+@pytest.mark.asyncio
+class TestAnalysisCounts:
+    async def test_counts_cover_only_completed_videos(self, postgres_session: AsyncSession):
+        captures = UnitOfWork(postgres_session).ad_captures
+        session_id = str(uuid.uuid4())
+        await captures.insert_missing(
+            [
+                _row(session_id, 1, AnalysisStatus.PENDING),
+                _row(session_id, 2, AnalysisStatus.COMPLETED),
+                _row(session_id, 3, AnalysisStatus.NOT_RELEVANT),
+                _row(session_id, 4, AnalysisStatus.SKIPPED),
+                _row(session_id, 5, AnalysisStatus.FAILED),
+                _row(session_id, 6, AnalysisStatus.PENDING),
+                # Pending, but there is no file to analyze.
+                _row(session_id, 7, AnalysisStatus.PENDING, video_file=None),
+                # Without a completed video nothing is counted.
+                _row(session_id, 8, AnalysisStatus.PENDING, VideoStatus.FAILED),
+                _row(session_id, 9, AnalysisStatus.FAILED, VideoStatus.FALLBACK_SCREENSHOTS),
+            ]
+        )
+        # Another session's captures stay out of the counts.
+        await captures.insert_missing([_row(str(uuid.uuid4()), 1, AnalysisStatus.PENDING)])
+
+        assert await captures.get_analysis_counts(session_id) == (7, 4, 1)
+        assert await captures.count_pending_analysis(session_id) == 2
+        pending = await captures.get_pending_analysis(session_id)
+        assert [capture.ad_position for capture in pending] == [1, 6]
+
+    async def test_empty_session_counts_zero(self, postgres_session: AsyncSession):
+        captures = UnitOfWork(postgres_session).ad_captures
+        session_id = str(uuid.uuid4())
+
+        assert await captures.get_analysis_counts(session_id) == (0, 0, 0)
+        assert await captures.count_pending_analysis(session_id) == 0
+
+    async def test_video_file_refs_count_across_sessions(self, postgres_session: AsyncSession):
+        captures = UnitOfWork(postgres_session).ad_captures
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        shared = f"{first}/1/video.mp4"
+        await captures.insert_missing(
+            [_row(first, 1, AnalysisStatus.PENDING), _row(first, 2, AnalysisStatus.PENDING)]
+        )
+        # Linked through the creative registry to the first session's file.
+        await captures.insert_missing(
+            [_row(second, 1, AnalysisStatus.PENDING, video_file=shared)]
+        )
+
+        refs = await captures.count_video_file_refs(
+            [shared, f"{first}/2/video.mp4", f"{first}/9/video.mp4"]
+        )
+
+        assert refs == {shared: 2, f"{first}/2/video.mp4": 1}
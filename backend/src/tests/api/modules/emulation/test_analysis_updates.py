@@ -0,0 +1,75 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.modules.emulation.models import AdCapture, AnalysisStatus, VideoStatus
+from app.database.uow import UnitOfWork
+
+
+def _row(session_id: str, position: int) -> dict:
+    return {
+        "session_id": session_id,
+        "ad_position": position,
+        "video_status": VideoStatus.COMPLETED,
+        "video_file": f"{session_id}/{position}/video.mp4",
+        "analysis_status": AnalysisStatus.PENDING,
+        "analysis_summary": f"stored {position}",
+    }
+
+
+@pytest.mark.asyncio
+class TestAnalysisUpdates:
+    async def test_bulk_update_writes_mixed_verdicts(
+        self, postgres_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+    ):
+        captures = UnitOfWork(postgres_session).ad_captures
+        # Several statements per call, so the verdicts span batches.
+        monkeypatch.setattr(captures, "_INSERT_BATCH_ROWS", 2)
+        session_id = str(uuid.uuid4())
+        ids = await captures.insert_missing([_row(session_id, p) for p in range(1, 7)])
+        started = datetime.datetime.now(datetime.UTC)
+
+        await captures.update_analysis_many(
+            [
+                (ids[1], AnalysisStatus.COMPLETED, "relevant"),
+                (ids[2], AnalysisStatus.NOT_RELEVANT, "off topic"),
+                # No new summary keeps the stored one.
+                (ids[3], AnalysisStatus.FAILED, None),
+                (ids[4], AnalysisStatus.SKIPPED, None),
+                (ids[5], AnalysisStatus.COMPLETED, "relevant too"),
+            ]
+        )
+
+        rows = (
+            await postgres_session.execute(
+                select(
+                    AdCapture.ad_position,
+                    AdCapture.analysis_status,
+                    AdCapture.analysis_summary,
+                    AdCapture.analysis_updated_at,
+                )
+                .where(AdCapture.session_id == session_id)
+                .order_by(AdCapture.ad_position)
+            )
+        ).all()
+        assert [row[:3] for row in rows] == [
+            (1, AnalysisStatus.COMPLETED, "relevant"),
+            (2, AnalysisStatus.NOT_RELEVANT, "off topic"),
+            (3, AnalysisStatus.FAILED, "stored 3"),
+            (4, AnalysisStatus.SKIPPED, "stored 4"),
+            (5, AnalysisStatus.COMPLETED, "relevant too"),
+            (6, AnalysisStatus.PENDING, "stored 6"),
+        ]
+        updated_at = {row.analysis_updated_at for row in rows[:5]}
+        # One timestamp for the whole call, across batches.
+        assert len(updated_at) == 1
+        assert updated_at.pop() >= started
+        assert rows[5].analysis_updated_at is None
+
+    async def test_empty_update_is_a_no_op(self, postgres_session: AsyncSession):
+        captures = UnitOfWork(postgres_session).ad_captures
+
+        await captures.update_analysis_many([])
@@ -0,0 +1,124 @@
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.modules.emulation.models import (
+    AdCapture,
+    AdCaptureScreenshot,
+    AdCreative,
+    AdCreativeSighting,
+    LandingStatus,
+    VideoStatus,
+)
+from app.database.uow import UnitOfWork
+
+
+def _row(session_id: str, position: int) -> dict:
+    return {
+        "session_id": session_id,
+        "ad_position": position,
+        "advertiser_domain": "shop.example",
+        "landing_status": LandingStatus.COMPLETED,
+        "video_status": VideoStatus.COMPLETED,
+        "video_file": f"{session_id}/{position}/video.mp4",
+    }
+
+
+def _sighting(key: str, position: int, *, reused: bool, video_file: str) -> dict:
+    return {
+        "registry_key": key,
+        "ad_position": position,
+        "reused": reused,
+        "advertiser_domain": "shop.example",
+        "headline_text": "Spring sale",
+        "video_src_url": None,
+        "video_status": VideoStatus.COMPLETED,
+        "video_file": video_file,
+        "landing_url": None,
+        "landing_status": LandingStatus.SKIPPED,
+        "landing_dir": None,
+        "screenshot_paths": [],
+    }
+
+
+async def _count(session: AsyncSession, model, *where) -> int:
+    stmt = select(func.count()).select_from(model).where(*where)
+    return (await session.execute(stmt)).scalar_one()
+
+
+@pytest.mark.asyncio
+class TestCaptureInserts:
+    async def test_reinserting_captures_is_a_no_op(
+        self, postgres_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+    ):
+        uow = UnitOfWork(postgres_session)
+        # Several statements per call, so a conflict spans batches.
+        monkeypatch.setattr(uow.ad_captures, "_INSERT_BATCH_ROWS", 2)
+        session_id = str(uuid.uuid4())
+
+        first = await uow.ad_captures.insert_missing([_row(session_id, p) for p in (1, 2, 3)])
+        await uow.ad_captures.add_screenshots(
+            [
+                {"capture_id": capture_id, "offset_ms": 0, "file_path": f"{p}.png"}
+                for p, capture_id in first.items()
+            ]
+        )
+        again = await uow.ad_captures.insert_missing(
+            [_row(session_id, p) for p in (1, 2, 3, 4, 5)]
+        )
+
+        assert sorted(first) == [1, 2, 3]
+        assert sorted(again) == [4, 5]
+        assert set(first.values()).isdisjoint(again.values())
+        assert await _count(postgres_session, AdCapture, AdCapture.session_id == session_id) == 5
+        assert (
+            await _count(
+                postgres_session,
+                AdCaptureScreenshot,
+                AdCaptureScreenshot.capture_id.in_(list(first.values())),
+            )
+            == 3
+        )
+
+    async def test_recording_sightings_twice_is_idempotent(
+        self, postgres_session: AsyncSession,
+    ):
+        uow = UnitOfWork(postgres_session)
+        first_session, second_session = str(uuid.uuid4()), str(uuid.uuid4())
+        key = f"creative-{uuid.uuid4()}"
+        fresh = _sighting(key, 1, reused=False, video_file=f"{first_session}/1/video.mp4")
+
+        await uow.ad_creatives.record_sightings(first_session, [fresh])
+        await uow.ad_creatives.record_sightings(first_session, [fresh])
+        # Another session reuses the creative's artifacts.
+        reused = _sighting(key, 3, reused=True, video_file=f"{first_session}/1/video.mp4")
+        await uow.ad_creatives.record_sightings(second_session, [reused, reused])
+
+        creative = (
+            await postgres_session.execute(select(AdCreative).where(AdCreative.registry_key == key))
+        ).scalar_one()
+        assert creative.source_session_id == first_session
+        assert creative.video_file == f"{first_session}/1/video.mp4"
+        sightings = (
+            await postgres_session.execute(
+                select(
+                    AdCreativeSighting.session_id,
+                    AdCreativeSighting.ad_position,
+                    AdCreativeSighting.reused,
+                ).where(AdCreativeSighting.creative_id == creative.id)
+            )
+        ).all()
+        assert sorted(sightings) == sorted(
+            [(first_session, 1, False), (second_session, 3, True)]
+        )
+
+        # A fresh capture of the same creative re-points it at its own files.
+        recaptured = _sighting(key, 4, reused=False, video_file=f"{second_session}/4/video.mp4")
+        await uow.ad_creatives.record_sightings(second_session, [recaptured])
+        await postgres_session.refresh(creative)
+
+        assert creative.source_session_id == second_session
+        assert creative.video_file == f"{second_session}/4/video.mp4"
+        assert await _count(postgres_session, AdCreative, AdCreative.registry_key == key) == 1
@@ -0,0 +1,106 @@
+import datetime
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.modules.emulation.models import AnalysisStatus, VideoStatus
+from app.api.modules.emulation.schema import EmulationCaptureSearchParams
+from app.api.modules.emulation.service import EmulationHistoryService
+from app.database.uow import UnitOfWork
+
+_T0 = datetime.datetime(2026, 3, 1, 12, 0, tzinfo=datetime.UTC)
+
+
+async def _seed(session: AsyncSession, token: str) -> dict[int, tuple[datetime.datetime, uuid.UUID]]:
+    """Seed captures mentioning token; return (created_at, id) per position."""
+    session_id = str(uuid.uuid4())
+    # Positions sharing a created_at are ordered by id alone.
+    created_at = {1: 0, 2: 0, 3: 0, 4: 5, 5: 5, 6: 10, 7: 10, 8: 10}
+    rows = [
+        {
+            "session_id": session_id,
+            "ad_position": position,
+            "advertiser_domain": "shop.example" if position % 2 else "other.example",
+            "headline_text": f"Spring {token}" if position % 3 else "Spring sale",
+            "full_text": f"Spring sale {token}",
+            "video_status": VideoStatus.COMPLETED,
+            "analysis_status": (
+                AnalysisStatus.COMPLETED if position <= 4 else AnalysisStatus.PENDING
+            ),
+            "created_at": _T0 + datetime.timedelta(minutes=minutes),
+        }
+        for position, minutes in created_at.items()
+    ]
+    # Not mentioning the token.
+    rows.append({**rows[0], "ad_position": 9, "headline_text": "Other", "full_text": "Other"})
+    ids = await UnitOfWork(session).ad_captures.insert_missing(rows)
+    return {position: (rows[position - 1]["created_at"], ids[position]) for position in created_at}
+
+
+async def _search_all(service: EmulationHistoryService, **params) -> tuple[list[uuid.UUID], int]:
+    """Follow next_cursor to the end; return the ids seen and the page count."""
+    ids: list[uuid.UUID] = []
+    cursor, pages = None, 0
+    while True:
+        response = await service.search_captures(
+            EmulationCaptureSearchParams(cursor=cursor, **params)
+        )
+        pages += 1
+        ids.extend(item.id for item in response.items)
+        cursor = response.next_cursor
+        if cursor is None:
+            return ids, pages
+
+
+def _newest_first(keys: list[tuple[datetime.datetime, uuid.UUID]]) -> list[uuid.UUID]:
+    return [capture_id for _, capture_id in sorted(keys, reverse=True)]
+
+
+@pytest.mark.asyncio
+class TestCaptureSearch:
+    async def test_pages_cover_every_match_once(self, postgres_session: AsyncSession):
+        token = f"tok{uuid.uuid4().hex}"
+        keys = await _seed(postgres_session, token)
+        service = EmulationHistoryService(UnitOfWork(postgres_session))
+
+        ids, pages = await _search_all(service, q=token, limit=3)
+
+        assert ids == _newest_first(list(keys.values()))
+        assert pages == 3
+
+    async def test_filters_apply_on_every_page(self, postgres_session: AsyncSession):
+        token = f"tok{uuid.uuid4().hex}"
+        keys = await _seed(postgres_session, token)
+        service = EmulationHistoryService(UnitOfWork(postgres_session))
+
+        by_domain, _ = await _search_all(
+            service, q=token, limit=1, advertiser_domain=" Shop.Example ",
+        )
+        completed, _ = await _search_all(
+            service, q=token, limit=2, analysis_status=AnalysisStatus.COMPLETED,
+        )
+
+        assert by_domain == _newest_first([keys[p] for p in (1, 3, 5, 7)])
+        assert completed == _newest_first([keys[p] for p in (1, 2, 3, 4)])
+
+    async def test_exact_page_has_no_cursor(self, postgres_session: AsyncSession):
+        token = f"tok{uuid.uuid4().hex}"
+        await _seed(postgres_session, token)
+        service = EmulationHistoryService(UnitOfWork(postgres_session))
+
+        response = await service.search_captures(EmulationCaptureSearchParams(q=token, limit=8))
+
+        assert len(response.items) == 8
+        assert response.next_cursor is None
+
+    async def test_invalid_cursor_is_rejected(self, postgres_session: AsyncSession):
+        service = EmulationHistoryService(UnitOfWork(postgres_session))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.search_captures(
+                EmulationCaptureSearchParams(q="sale", cursor="not-a-cursor")
+            )
+
+        assert exc_info.value.status_code == 400
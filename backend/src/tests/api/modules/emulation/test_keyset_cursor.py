@@ -0,0 +1,59 @@
+import base64
+import datetime
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.modules.emulation.utils import (
+    decode_capture_cursor,
+    decode_history_cursor,
+    encode_capture_cursor,
+    encode_history_cursor,
+)
+
+_TIMESTAMP = datetime.datetime(2026, 3, 6, 12, 5, 30, 123456, tzinfo=datetime.UTC)
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+class TestKeysetCursor:
+    def test_history_cursor_round_trip(self):
+        cursor = encode_history_cursor(_TIMESTAMP, "session-1")
+
+        assert "=" not in cursor
+        assert decode_history_cursor(cursor) == (_TIMESTAMP, "session-1")
+
+    def test_capture_cursor_round_trip(self):
+        capture_id = uuid.uuid4()
+
+        cursor = encode_capture_cursor(_TIMESTAMP, capture_id)
+
+        assert decode_capture_cursor(cursor) == (_TIMESTAMP, capture_id)
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "",
+            "not a cursor!",
+            _b64(b"\xff\xfe"),
+            _b64(b'"2026-03-06"'),
+            _b64(b"[1, 2, 3]"),
+            _b64(b'["yesterday", "session-1"]'),
+        ],
+    )
+    def test_invalid_history_cursor_is_400(self, cursor: str):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_history_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+    def test_capture_cursor_with_non_uuid_key_is_400(self):
+        cursor = encode_history_cursor(_TIMESTAMP, "session-1")
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_capture_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,127 @@
+import datetime
+import time
+
+import pytest
+from redis.asyncio import Redis
+
+from app.api.modules.emulation import service as service_module
+from app.api.modules.emulation.models import EmulationSessionHistory, SessionStatus
+from app.api.modules.emulation.service import EmulationSessionService
+from app.services.emulation.session.store import (
+    ACTIVE_SESSIONS_KEY,
+    EmulationSessionStore,
+)
+
+
+class _FakeHistoryService:
+    def __init__(self, records: list[EmulationSessionHistory] | None = None) -> None:
+        self.records = records or []
+        self.failed_live: dict[str, dict] = {}
+        self.failed_history: dict[str, str] = {}
+
+    async def get_active_session_records(self) -> list[EmulationSessionHistory]:
+        return self.records
+
+    async def mark_stale_failed_many(self, live_payloads: dict[str, dict], error: str) -> None:
+        self.failed_live.update(live_payloads)
+
+    async def mark_history_stale_failed_many(self, errors: dict[str, str]) -> None:
+        self.failed_history.update(errors)
+
+
+def _record(session_id: str, status: str, age: datetime.timedelta) -> EmulationSessionHistory:
+    started = datetime.datetime.now(datetime.UTC) - age
+    return EmulationSessionHistory(
+        session_id=session_id,
+        status=status,
+        queued_at=started,
+        started_at=started if status == SessionStatus.RUNNING else None,
+        requested_duration_minutes=30,
+    )
+
+
+async def _start(
+    store: EmulationSessionStore,
+    session_id: str,
+    *,
+    started_ago_s: float,
+    quiet_for_s: float,
+    profile_id: str | None = None,
+) -> None:
+    now = time.time()
+    await store.create(session_id, ["cooking"], 30, profile_id=profile_id)
+    await store.update(
+        session_id,
+        status=SessionStatus.RUNNING,
+        started_at=now - started_ago_s,
+        updated_at=now - quiet_for_s,
+    )
+
+
+@pytest.fixture
+def store(fake_redis: Redis) -> EmulationSessionStore:
+    return EmulationSessionStore(fake_redis)
+
+
+@pytest.mark.asyncio
+class TestReconcileStaleSessions:
+    async def test_fails_only_quiet_overdue_sessions_without_a_run_lock(
+        self,
+        store: EmulationSessionStore,
+        fake_redis: Redis,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(service_module, "STALE_RECONCILE_BATCH_SIZE", 2)
+        await _start(store, "stale", started_ago_s=7200, quiet_for_s=600, profile_id="p1")
+        await store.try_acquire_profile_lock("p1", "stale:run:profile", 600)
+        await _start(store, "locked", started_ago_s=7200, quiet_for_s=600)
+        await store.try_acquire_run_lock("locked", "locked:run", 600)
+        await _start(store, "in_window", started_ago_s=60, quiet_for_s=120)
+        await _start(store, "fresh", started_ago_s=7200, quiet_for_s=0)
+        history = _FakeHistoryService()
+        service = EmulationSessionService(store, history)
+
+        assert await service.reconcile_stale_sessions() == 1
+
+        assert set(history.failed_live) == {"stale"}
+        assert history.failed_live["stale"]["status"] == SessionStatus.FAILED
+        stale = await store.get("stale")
+        assert stale["status"] == SessionStatus.FAILED
+        assert stale["error"].startswith("Session stale")
+        assert not await fake_redis.exists(store._profile_lock_key("p1"))
+        for session_id in ("locked", "in_window", "fresh"):
+            assert (await store.get(session_id))["status"] == SessionStatus.RUNNING
+        assert set(await store.get_active_session_ids()) == {"locked", "in_window", "fresh"}
+
+    async def test_drops_index_entries_without_live_state(
+        self, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        await fake_redis.zadd(ACTIVE_SESSIONS_KEY, {"expired": 0})
+        service = EmulationSessionService(store, _FakeHistoryService())
+
+        assert await service.reconcile_stale_sessions() == 0
+
+        assert await store.get_active_session_ids() == []
+
+    async def test_fails_history_rows_whose_live_state_is_gone(
+        self, store: EmulationSessionStore,
+    ):
+        await _start(store, "live", started_ago_s=7200, quiet_for_s=0)
+        await store.create("expired_key", ["cooking"], 30)
+        await store.update("expired_key", status=SessionStatus.COMPLETED)
+        history = _FakeHistoryService(
+            [
+                _record("lost_queued", SessionStatus.QUEUED, datetime.timedelta(hours=2)),
+                _record("lost_running", SessionStatus.RUNNING, datetime.timedelta(hours=2)),
+                _record("new_queued", SessionStatus.QUEUED, datetime.timedelta(minutes=5)),
+                _record("live", SessionStatus.RUNNING, datetime.timedelta(hours=2)),
+                # Not indexed any more, but its payload still exists.
+                _record("expired_key", SessionStatus.RUNNING, datetime.timedelta(hours=2)),
+            ]
+        )
+        service = EmulationSessionService(store, history)
+
+        assert await service.reconcile_stale_sessions() == 2
+
+        assert set(history.failed_history) == {"lost_queued", "lost_running"}
+        assert history.failed_live == {}
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from app.api.modules.emulation.models import SessionStatus
+from app.api.modules.emulation.service import EmulationSessionService
+from app.api.modules.emulation.services.session_runtime import stream_status_events
+from app.services.emulation.session import store as store_module
+from app.services.emulation.session.events import SessionEventHub
+from app.services.emulation.session.store import (
+    SESSION_EVENTS_CHANNEL,
+    EmulationSessionStore,
+)
+
+_SESSION_ID = str(uuid.uuid4())
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest_asyncio.fixture
+async def store(fake_redis: Redis) -> EmulationSessionStore:
+    store = EmulationSessionStore(fake_redis)
+    await store.create(_SESSION_ID, ["cooking"], 30)
+    return store
+
+
+@pytest_asyncio.fixture
+async def hub(fake_redis: Redis, store: EmulationSessionStore):
+    hub = SessionEventHub(fake_redis, store)
+    yield hub
+    await hub.close()
+
+
+async def _stream(
+    hub: SessionEventHub,
+    store: EmulationSessionStore,
+    client: _Client,
+    idle_timeout_seconds: float,
+):
+    """What the stream route yields for the session."""
+    service = EmulationSessionService(store, None)
+    initial_status = await service.get_status(_SESSION_ID)
+    async with hub.subscribe(_SESSION_ID) as subscription:
+        async for chunk in stream_status_events(
+            initial_status=initial_status,
+            get_status=lambda data: service.get_status(_SESSION_ID, data),
+            is_disconnected=client.is_disconnected,
+            subscription=subscription,
+            idle_timeout_seconds=idle_timeout_seconds,
+        ):
+            yield chunk
+
+
+async def _wait_for_listener(fake_redis: Redis) -> None:
+    while not (await fake_redis.pubsub_numsub(SESSION_EVENTS_CHANNEL))[0][1]:
+        await asyncio.sleep(0.01)
+
+
+def _status(chunk: str) -> str:
+    assert chunk.startswith("event: status\n")
+    return json.loads(chunk.split("data: ", 1)[1])["status"]
+
+
+@pytest.mark.asyncio
+class TestStatusStream:
+    async def test_events_push_changes_before_the_timeout(
+        self, hub: SessionEventHub, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        stream = _stream(hub, store, _Client(), idle_timeout_seconds=60)
+        async with asyncio.timeout(2):
+            assert _status(await anext(stream)) == SessionStatus.QUEUED
+            await _wait_for_listener(fake_redis)
+            await store.update(_SESSION_ID, status=SessionStatus.RUNNING)
+            assert _status(await anext(stream)) == SessionStatus.RUNNING
+            await store.update(_SESSION_ID, status=SessionStatus.COMPLETED)
+            assert _status(await anext(stream)) == SessionStatus.COMPLETED
+            # A finished session ends the stream.
+            with pytest.raises(StopAsyncIteration):
+                await anext(stream)
+
+        assert hub._subscriptions == {}
+
+    async def test_timeout_reads_changes_whose_event_was_missed(
+        self, hub: SessionEventHub, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        stream = _stream(hub, store, _Client(), idle_timeout_seconds=0.05)
+        async with asyncio.timeout(2):
+            assert _status(await anext(stream)) == SessionStatus.QUEUED
+            assert await anext(stream) == ": keep-alive\n\n"
+
+            # Written without publishing an event.
+            await fake_redis.hset(
+                store._key(_SESSION_ID),
+                "status",
+                store_module._encode_field("status", SessionStatus.RUNNING),
+            )
+
+            assert _status(await anext(stream)) == SessionStatus.RUNNING
+        await stream.aclose()
+
+    async def test_disconnect_ends_the_stream_and_unsubscribes(
+        self, hub: SessionEventHub, store: EmulationSessionStore,
+    ):
+        client = _Client()
+        stream = _stream(hub, store, client, idle_timeout_seconds=0.05)
+        async with asyncio.timeout(2):
+            await anext(stream)
+            assert set(hub._subscriptions) == {_SESSION_ID}
+
+            client.disconnected = True
+            with pytest.raises(StopAsyncIteration):
+                await anext(stream)
+
+        assert hub._subscriptions == {}
@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.modules.emulation.models import EmulationSessionHistory, SessionStatus
+from app.database.uow import UnitOfWork
+
+
+def _video(index: int) -> dict:
+    return {"position": index + 1, "title": f"video {index}"}
+
+
+def _ad(index: int, status: str = "pending") -> dict:
+    return {"position": index + 1, "capture": {"video_status": status}}
+
+
+async def _add_session(
+    session: AsyncSession, *, watched_videos: list | None = None,
+) -> str:
+    session_id = str(uuid.uuid4())
+    session.add(
+        EmulationSessionHistory(
+            session_id=session_id,
+            status=SessionStatus.COMPLETED,
+            requested_duration_minutes=30,
+            watched_videos=watched_videos or [],
+        )
+    )
+    await session.flush()
+    return session_id
+
+
+async def _row_versions(session: AsyncSession, table: str, session_id: str) -> dict[int, str]:
+    """Physical row location per item; an UPDATE moves the row."""
+    result = await session.execute(
+        text(f"SELECT item_index, ctid::text FROM {table} WHERE session_id = :sid"),
+        {"sid": session_id},
+    )
+    return dict(result.tuples().all())
+
+
+@pytest.mark.asyncio
+class TestWatchedItems:
+    async def test_resaving_rewrites_only_changed_items(self, postgres_session: AsyncSession):
+        gateway = UnitOfWork(postgres_session).emulation_history
+        session_id = await _add_session(postgres_session)
+        videos = [_video(i) for i in range(3)]
+        ads = [_ad(0), _ad(1)]
+        await gateway.save_watched_items({session_id: (videos, ads)})
+        saved_videos = await _row_versions(postgres_session, "emulation_watched_videos", session_id)
+        saved_ads = await _row_versions(postgres_session, "emulation_watched_ads", session_id)
+
+        ads[1] = _ad(1, "completed")
+        await gateway.save_watched_items({session_id: ([*videos, _video(3)], ads)})
+
+        videos_now = await _row_versions(postgres_session, "emulation_watched_videos", session_id)
+        ads_now = await _row_versions(postgres_session, "emulation_watched_ads", session_id)
+        assert {index: videos_now[index] for index in saved_videos} == saved_videos
+        assert sorted(videos_now) == [0, 1, 2, 3]
+        assert ads_now[0] == saved_ads[0]
+        assert ads_now[1] != saved_ads[1]
+        assert await gateway.get_watched_ads(session_id) == ads
+        assert await gateway.count_watched_items(session_id) == (4, 2)
+
+    async def test_pages_follow_item_order(self, postgres_session: AsyncSession):
+        gateway = UnitOfWork(postgres_session).emulation_history
+        session_id = await _add_session(postgres_session)
+        videos = [_video(i) for i in range(12)]
+        await gateway.save_watched_items({session_id: (videos, [])})
+
+        assert await gateway.get_watched_videos(session_id, offset=5, limit=4) == videos[5:9]
+        assert await gateway.get_watched_videos(session_id, offset=10) == videos[10:]
+
+    async def test_load_fills_lists_without_dirtying_records(
+        self, postgres_session: AsyncSession,
+    ):
+        gateway = UnitOfWork(postgres_session).emulation_history
+        with_children = await _add_session(postgres_session)
+        legacy = await _add_session(postgres_session, watched_videos=[_video(0)])
+        videos = [_video(i) for i in range(11)]
+        await gateway.save_watched_items({with_children: (videos, [_ad(0)])})
+        postgres_session.expunge_all()
+        records = list(
+            (
+                await postgres_session.execute(
+                    select(EmulationSessionHistory).where(
+                        EmulationSessionHistory.session_id.in_([with_children, legacy])
+                    )
+                )
+            ).scalars()
+        )
+
+        await gateway.load_watched_items(records)
+
+        by_id = {record.session_id: record for record in records}
+        # item_index 10 sorts after 9, not after 1.
+        assert by_id[with_children].watched_videos == videos
+        assert by_id[with_children].watched_ads == [_ad(0)]
+        # Sessions stored before the child tables keep their inline lists.
+        assert by_id[legacy].watched_videos == [_video(0)]
+        assert not any(postgres_session.is_modified(record) for record in records)
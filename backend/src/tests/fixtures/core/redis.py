@@ -0,0 +1,13 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    """In-process Redis; the session store's Lua scripts need lupa."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa", reason="fakeredis runs Lua scripts through lupa")
+
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from app.api.modules.emulation.models import AdAnalysisVerdict, AdCapture, VideoStatus
+
+
+class FakeAdCaptureGateway:
+    """The capture queries analysis uses; writes are staged until commit."""
+
+    def __init__(self) -> None:
+        self.pending: list[AdCapture] = []
+        self.video_refcounts: dict[str, int] = {}
+        self.verdict_cache: dict[tuple[str, str], AdAnalysisVerdict] = {}
+        self.cache_lookups: list[tuple[list[str], str]] = []
+        self.staged_verdicts: list[tuple] = []
+        self.staged_cache_entries: list[dict] = []
+
+    async def get_pending_analysis(self, session_id: str) -> list[AdCapture]:
+        return list(self.pending)
+
+    async def count_video_file_refs(self, video_files: list[str]) -> dict[str, int]:
+        return {video_file: self.video_refcounts.get(video_file, 1) for video_file in video_files}
+
+    async def get_cached_verdicts(
+        self, content_hashes: list[str], prompt_version: str,
+    ) -> dict[str, AdAnalysisVerdict]:
+        self.cache_lookups.append((content_hashes, prompt_version))
+        return {
+            content_hash: self.verdict_cache[(content_hash, prompt_version)]
+            for content_hash in content_hashes
+            if (content_hash, prompt_version) in self.verdict_cache
+        }
+
+    async def find_fingerprint_verdicts(self, bands, prompt_version: str) -> list:
+        return []
+
+    async def update_analysis_many(self, results: list[tuple]) -> None:
+        self.staged_verdicts.extend(results)
+
+    async def update_video_fingerprints(self, rows: list[tuple]) -> None:
+        pass
+
+    async def add_cached_verdicts(self, rows: list[dict]) -> None:
+        self.staged_cache_entries.extend(rows)
+
+
+class FakeAnalysisUnitOfWork:
+    def __init__(self) -> None:
+        self.ad_captures = FakeAdCaptureGateway()
+        # Verdicts of each commit, in commit order.
+        self.commits: list[list[tuple]] = []
+        self.rollbacks = 0
+        self.failing_commits = 0
+
+    async def commit(self) -> None:
+        gateway = self.ad_captures
+        if self.failing_commits:
+            self.failing_commits -= 1
+            raise ConnectionError("connection lost")
+        self.commits.append(gateway.staged_verdicts)
+        for row in gateway.staged_cache_entries:
+            # ON CONFLICT DO NOTHING: the first verdict stored wins.
+            gateway.verdict_cache.setdefault(
+                (row["content_hash"], row["prompt_version"]), AdAnalysisVerdict(**row)
+            )
+        gateway.staged_verdicts = []
+        gateway.staged_cache_entries = []
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        self.ad_captures.staged_verdicts = []
+        self.ad_captures.staged_cache_entries = []
+
+
+class FakeGemini:
+    """Answers by video file name and records the peak number of calls in flight."""
+
+    def __init__(self) -> None:
+        self.video_results: dict[str, dict] = {}
+        self.default_result: dict = {"result": "not_relevant", "reason": "not finance"}
+        self.delay_s = 0.0
+        self.video_calls: list[Path] = []
+        self.text_calls: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate_from_video(self, video_path: Path, prompt: str) -> str:
+        self.video_calls.append(video_path)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+            result = self.video_results.get(video_path.parent.name, self.default_result)
+            if isinstance(result, Exception):
+                raise result
+            return json.dumps(result)
+        finally:
+            self.in_flight -= 1
+
+    async def generate_from_text(self, prompt: str) -> str:
+        self.text_calls.append(prompt)
+        return json.dumps({"result": "unclear", "reason": "text only"})
+
+
+class FakeMediaStorage:
+    def __init__(self) -> None:
+        self.removed_dirs: list[str] = []
+
+    async def remove_capture_dir(self, capture_dir: str) -> None:
+        self.removed_dirs.append(capture_dir)
+
+
+class FakeVideoSampler:
+    async def prepare(self, video_path: Path):
+        from app.services.emulation.ads.analysis.sampler import PreparedAnalysisVideo
+
+        return PreparedAnalysisVideo(path=video_path)
+
+
+class AdAnalysisHarness:
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = base_path
+        self.uow = FakeAnalysisUnitOfWork()
+        self.gemini = FakeGemini()
+        self.storage = FakeMediaStorage()
+
+    def add_capture(
+        self,
+        name: str,
+        content: bytes | None = None,
+        *,
+        video_file: str | None = None,
+        headline_text: str | None = None,
+    ) -> AdCapture:
+        """Add a pending capture whose video holds ``content`` (defaults to its name)."""
+        if video_file is None:
+            video_file = f"s1/{name}/video.mp4"
+            path = self.base_path / video_file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content if content is not None else name.encode())
+        capture = AdCapture(
+            id=uuid.uuid4(),
+            session_id="s1",
+            ad_position=len(self.uow.ad_captures.pending) + 1,
+            video_file=video_file,
+            video_status=VideoStatus.COMPLETED,
+            headline_text=headline_text,
+        )
+        self.uow.ad_captures.pending.append(capture)
+        return capture
+
+    def service(self, limiter=None, **config):
+        from app.services.emulation.ads.analysis.limiter import (
+            AnalysisConcurrencyLimiter,
+        )
+        from app.services.emulation.ads.analysis.service import AdAnalysisService
+        from app.settings import AdAnalysisConfig
+
+        config = AdAnalysisConfig(**config)
+        return AdAnalysisService(
+            self.gemini,
+            self.uow,
+            self.base_path,
+            self.storage,
+            FakeVideoSampler(),
+            config,
+            limiter or AnalysisConcurrencyLimiter(config.max_concurrency),
+        )
+
+
+@pytest.fixture
+def ad_analysis(tmp_path: Path) -> AdAnalysisHarness:
+    """Ad analysis over fake Gemini, storage and capture gateway, with videos in tmp_path."""
+    pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+    return AdAnalysisHarness(tmp_path)
@@ -0,0 +1,111 @@
+import pytest
+
+pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+
+from app.api.modules.emulation.models import (  # noqa: E402
+    AnalysisStatus,
+    PostProcessingStatus,
+)
+from app.services.emulation.ads.analysis.limiter import (  # noqa: E402
+    AnalysisConcurrencyLimiter,
+)
+
+
+def _committed_ids(ad_analysis) -> list[list]:
+    return [[capture_id for capture_id, _, _ in batch] for batch in ad_analysis.uow.commits]
+
+
+@pytest.mark.asyncio
+class TestAnalyzeSessionCaptures:
+    async def test_analyses_run_up_to_the_limiter_cap(self, ad_analysis):
+        for name in "abcdef":
+            ad_analysis.add_capture(name)
+        ad_analysis.gemini.delay_s = 0.02
+        service = ad_analysis.service(limiter=AnalysisConcurrencyLimiter(3))
+
+        result = await service.analyze_session_captures("s1")
+
+        assert result == (PostProcessingStatus.COMPLETED, 6, 6)
+        assert ad_analysis.gemini.peak_in_flight == 3
+        assert len(ad_analysis.gemini.video_calls) == 6
+
+    async def test_verdicts_are_committed_in_batches(self, ad_analysis):
+        captures = [ad_analysis.add_capture(name) for name in "abcde"]
+        ad_analysis.gemini.delay_s = 0.01
+        # One analysis at a time makes the commit boundaries deterministic.
+        service = ad_analysis.service(
+            limiter=AnalysisConcurrencyLimiter(1),
+            commit_batch_size=2,
+            commit_interval_seconds=60,
+        )
+
+        result = await service.analyze_session_captures("s1")
+
+        assert result == (PostProcessingStatus.COMPLETED, 5, 5)
+        ids = [capture.id for capture in captures]
+        assert _committed_ids(ad_analysis) == [ids[0:2], ids[2:4], ids[4:5]]
+        assert all(
+            status == AnalysisStatus.NOT_RELEVANT
+            for batch in ad_analysis.uow.commits
+            for _, status, _ in batch
+        )
+        assert ad_analysis.uow.rollbacks == 0
+
+    async def test_interval_commits_a_partial_batch(self, ad_analysis):
+        for name in "abc":
+            ad_analysis.add_capture(name)
+        ad_analysis.gemini.delay_s = 0.01
+        service = ad_analysis.service(
+            limiter=AnalysisConcurrencyLimiter(1),
+            commit_batch_size=100,
+            commit_interval_seconds=0,
+        )
+
+        await service.analyze_session_captures("s1")
+
+        assert [len(batch) for batch in ad_analysis.uow.commits] == [1, 1, 1]
+
+    async def test_failed_commit_rolls_back_and_stops(self, ad_analysis):
+        captures = [ad_analysis.add_capture(name) for name in "abcdef"]
+        ad_analysis.gemini.delay_s = 0.01
+        service = ad_analysis.service(
+            limiter=AnalysisConcurrencyLimiter(1),
+            commit_batch_size=2,
+            commit_interval_seconds=60,
+        )
+
+        async def fail_second_commit():
+            if ad_analysis.uow.commits:
+                ad_analysis.uow.failing_commits = 1
+            await commit()
+
+        commit = ad_analysis.uow.commit
+        ad_analysis.uow.commit = fail_second_commit
+
+        result = await service.analyze_session_captures("s1")
+
+        assert result == (PostProcessingStatus.FAILED, 2, 6)
+        assert _committed_ids(ad_analysis) == [[captures[0].id, captures[1].id]]
+        assert ad_analysis.uow.rollbacks == 1
+        # Captures still queued behind the limiter were cancelled.
+        assert len(ad_analysis.gemini.video_calls) < 6
+        # Nothing is deleted for verdicts that were rolled back.
+        assert len(ad_analysis.storage.removed_dirs) == 2
+
+    async def test_failed_analyses_fail_the_run(self, ad_analysis):
+        erroring = ad_analysis.add_capture("a", headline_text="Spring sale")
+        missing = ad_analysis.add_capture("b", video_file="s1/b/video.mp4")
+        ad_analysis.gemini.video_results["a"] = RuntimeError("quota exceeded")
+
+        result = await ad_analysis.service().analyze_session_captures("s1")
+
+        assert result == (PostProcessingStatus.FAILED, 2, 2)
+        verdicts = {
+            capture_id: status
+            for batch in ad_analysis.uow.commits
+            for capture_id, status, _ in batch
+        }
+        # The Gemini error falls back to the text prompt, which is unclear.
+        assert verdicts[erroring.id] == AnalysisStatus.SKIPPED
+        assert len(ad_analysis.gemini.text_calls) == 1
+        assert verdicts[missing.id] == AnalysisStatus.FAILED
@@ -0,0 +1,92 @@
+import pytest
+
+pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+
+from app.services.emulation.ads.analysis.fingerprint import (  # noqa: E402
+    FINGERPRINT_BANDS,
+    VideoFingerprint,
+    dhash,
+)
+
+_ALL_BITS = (1 << 64) - 1
+_DESCENDING_ROW = bytes(range(90, 0, -10))
+_FLAT_ROW = bytes([128] * 9)
+
+
+def _frame(*rows: bytes) -> bytes:
+    return b"".join(rows)
+
+
+class TestDhash:
+    def test_descending_rows_set_every_bit(self):
+        assert dhash(_DESCENDING_ROW * 8) == _ALL_BITS
+
+    def test_flat_and_ascending_rows_set_no_bits(self):
+        assert dhash(_FLAT_ROW * 8) == 0
+        assert dhash(bytes(range(0, 90, 10)) * 8) == 0
+
+    def test_first_row_is_most_significant(self):
+        assert dhash(_frame(_DESCENDING_ROW, *[_FLAT_ROW] * 7)) == 0xFF << 56
+
+
+class TestVideoFingerprint:
+    def test_summary_is_per_bit_majority(self):
+        fingerprint = VideoFingerprint((0b1100, 0b1010, 0b1001))
+
+        assert fingerprint.summary == 0b1000
+
+    def test_bands_split_summary_low_bits_first(self):
+        value = 0x0123_4567_89AB_CDEF
+        fingerprint = VideoFingerprint((value,) * 3)
+
+        assert len(fingerprint.bands) == FINGERPRINT_BANDS
+        assert fingerprint.bands == (0xCDEF, 0x89AB, 0x4567, 0x0123)
+
+    def test_distance_is_mean_hamming_per_frame(self):
+        left = VideoFingerprint((0, _ALL_BITS, 0xF0))
+        right = VideoFingerprint((1, _ALL_BITS, 0x0F))
+
+        assert left.distance(left) == 0.0
+        assert left.distance(right) == (1 + 0 + 8) / 3
+
+    def test_distance_compares_shared_prefix(self):
+        left = VideoFingerprint((0, 0, 0))
+        right = VideoFingerprint((0b111,))
+
+        assert left.distance(right) == 3.0
+        assert left.distance(VideoFingerprint(())) == 64.0
+
+    @pytest.mark.parametrize(
+        ("value", "informative"),
+        [
+            (0, False),
+            (0x7F, False),
+            (0xFF, True),
+            (0x0123_4567_89AB_CDEF, True),
+            (_ALL_BITS >> 8, True),
+            (_ALL_BITS >> 7, False),
+            (_ALL_BITS, False),
+        ],
+    )
+    def test_informative_rejects_near_uniform_summaries(
+        self, value: int, informative: bool,
+    ):
+        assert VideoFingerprint((value,)).informative is informative
+
+    def test_hex_round_trip(self):
+        fingerprint = VideoFingerprint((0, 1, _ALL_BITS, 0x0123_4567_89AB_CDEF))
+
+        assert len(fingerprint.to_hex()) == 16 * 4
+        assert VideoFingerprint.from_hex(fingerprint.to_hex()) == fingerprint
+
+    def test_from_frames_samples_evenly_after_trimming_edges(self):
+        frames = [_DESCENDING_ROW * 8 if i % 2 else _FLAT_ROW * 8 for i in range(40)]
+
+        fingerprint = VideoFingerprint.from_frames(frames)
+
+        # 5% off each end leaves frames 2..37; eight picks from the middle of
+        # equal slices land on frames 4, 8, 13, 17, 22, 26, 31 and 35.
+        assert fingerprint.frame_hashes == (
+            0, 0, _ALL_BITS, _ALL_BITS, 0, 0, _ALL_BITS, _ALL_BITS,
+        )
+        assert VideoFingerprint.from_frames([]) is None
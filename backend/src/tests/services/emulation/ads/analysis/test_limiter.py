@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import pytest
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+
+from app.services.emulation.ads.analysis import limiter as limiter_module  # noqa: E402
+from app.services.emulation.ads.analysis.limiter import (  # noqa: E402
+    AnalysisConcurrencyLimiter,
+)
+
+_SLOTS_KEY = limiter_module._GLOBAL_SLOTS_KEY
+
+
+class _PeakCounter:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def hold(self, limiter: AnalysisConcurrencyLimiter, seconds: float = 0.02) -> None:
+        async with limiter.slot():
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(seconds)
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def fast_global_poll(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(limiter_module, "_GLOBAL_POLL_INTERVAL_S", 0.01)
+
+
+@pytest.mark.asyncio
+class TestAnalysisConcurrencyLimiter:
+    async def test_local_limit_caps_slots_in_one_worker(self):
+        limiter = AnalysisConcurrencyLimiter(2)
+        counter = _PeakCounter()
+
+        await asyncio.gather(*(counter.hold(limiter) for _ in range(6)))
+
+        assert counter.peak == 2
+
+    async def test_global_limit_spans_workers(self, fake_redis: Redis):
+        workers = [
+            AnalysisConcurrencyLimiter(3, redis=fake_redis, global_limit=2) for _ in range(2)
+        ]
+        counter = _PeakCounter()
+
+        await asyncio.gather(*(counter.hold(worker) for worker in workers for _ in range(3)))
+
+        assert counter.peak == 2
+        assert await fake_redis.zcard(_SLOTS_KEY) == 0
+
+    async def test_expired_holders_are_dropped(self, fake_redis: Redis):
+        # A worker that crashed while holding the only slot.
+        await fake_redis.zadd(_SLOTS_KEY, {"crashed": time.time() - 1})
+        limiter = AnalysisConcurrencyLimiter(1, redis=fake_redis, global_limit=1)
+
+        async with asyncio.timeout(1):
+            async with limiter.slot():
+                holders = await fake_redis.zrange(_SLOTS_KEY, 0, -1)
+                ttl = await fake_redis.ttl(_SLOTS_KEY)
+
+        assert b"crashed" not in holders
+        assert len(holders) == 1
+        assert 0 < ttl <= 900
+
+    async def test_live_holder_blocks_until_released(self, fake_redis: Redis):
+        await fake_redis.zadd(_SLOTS_KEY, {"other": time.time() + 60})
+        limiter = AnalysisConcurrencyLimiter(1, redis=fake_redis, global_limit=1)
+        counter = _PeakCounter()
+        task = asyncio.create_task(counter.hold(limiter))
+
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        await fake_redis.zrem(_SLOTS_KEY, "other")
+        async with asyncio.timeout(1):
+            await task
+        assert counter.peak == 1
+
+    async def test_slot_is_released_when_the_body_raises(self, fake_redis: Redis):
+        limiter = AnalysisConcurrencyLimiter(1, redis=fake_redis, global_limit=1)
+
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                assert await fake_redis.zcard(_SLOTS_KEY) == 1
+                raise RuntimeError("analysis failed")
+
+        assert await fake_redis.zcard(_SLOTS_KEY) == 0
+        async with asyncio.timeout(1):
+            async with limiter.slot():
+                pass
+
+    async def test_redis_errors_fail_open(
+        self, fake_redis: Redis, monkeypatch: pytest.MonkeyPatch,
+    ):
+        limiter = AnalysisConcurrencyLimiter(2, redis=fake_redis, global_limit=1)
+
+        async def unavailable(*args, **kwargs):
+            raise RedisConnectionError("connection lost")
+
+        monkeypatch.setattr(limiter, "_acquire_script", unavailable)
+        monkeypatch.setattr(fake_redis, "zrem", unavailable)
+        counter = _PeakCounter()
+
+        async with asyncio.timeout(1):
+            await asyncio.gather(*(counter.hold(limiter) for _ in range(4)))
+
+        # Only the local limit applies while Redis is down.
+        assert counter.peak == 2
@@ -0,0 +1,130 @@
+import hashlib
+
+import pytest
+
+pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+
+from app.api.modules.emulation.models import (  # noqa: E402
+    AdAnalysisVerdict,
+    AnalysisStatus,
+    PostProcessingStatus,
+)
+from app.services.emulation.ads.analysis import service as service_module  # noqa: E402
+from app.services.emulation.ads.analysis.prompt import (  # noqa: E402
+    ANALYSIS_PROMPT_VERSION,
+)
+
+# Strong finance metadata, so the guardrails keep a relevant video verdict.
+_FINANCE_HEADLINE = "Forex broker with copy trading"
+
+
+def _cache(
+    ad_analysis,
+    content: bytes,
+    status: AnalysisStatus,
+    version: str = ANALYSIS_PROMPT_VERSION,
+) -> None:
+    content_hash = hashlib.sha256(content).hexdigest()
+    ad_analysis.uow.ad_captures.verdict_cache[(content_hash, version)] = AdAnalysisVerdict(
+        content_hash=content_hash,
+        prompt_version=version,
+        parsed_result=status,
+        analysis_status=status,
+        analysis_summary='{"result": "cached"}',
+    )
+
+
+def _verdicts(ad_analysis) -> dict:
+    return {
+        capture_id: (status, summary)
+        for batch in ad_analysis.uow.commits
+        for capture_id, status, summary in batch
+    }
+
+
+@pytest.mark.asyncio
+class TestVerdictCache:
+    async def test_hit_skips_the_gemini_call(self, ad_analysis):
+        capture = ad_analysis.add_capture("a", b"creative")
+        _cache(ad_analysis, b"creative", AnalysisStatus.COMPLETED)
+
+        result = await ad_analysis.service().analyze_session_captures("s1")
+
+        assert result == (PostProcessingStatus.COMPLETED, 1, 1)
+        assert ad_analysis.gemini.video_calls == []
+        assert _verdicts(ad_analysis)[capture.id] == (
+            AnalysisStatus.COMPLETED,
+            '{"result": "cached"}',
+        )
+
+    async def test_clear_verdicts_are_cached_and_reused(self, ad_analysis):
+        ad_analysis.add_capture("a", b"finance", headline_text=_FINANCE_HEADLINE)
+        ad_analysis.add_capture("b", b"cooking")
+        ad_analysis.gemini.video_results["a"] = {"result": "relevant", "reason": "forex"}
+
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        cache = ad_analysis.uow.ad_captures.verdict_cache
+        assert {
+            content_hash: verdict.analysis_status for (content_hash, _), verdict in cache.items()
+        } == {
+            hashlib.sha256(b"finance").hexdigest(): AnalysisStatus.COMPLETED,
+            hashlib.sha256(b"cooking").hexdigest(): AnalysisStatus.NOT_RELEVANT,
+        }
+
+        # The same creatives seen again, e.g. by another session.
+        ad_analysis.uow.ad_captures.pending.clear()
+        ad_analysis.add_capture("c", b"finance", headline_text=_FINANCE_HEADLINE)
+        ad_analysis.add_capture("d", b"cooking")
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        assert len(ad_analysis.gemini.video_calls) == 2
+
+    async def test_unclear_verdicts_are_not_cached(self, ad_analysis):
+        ad_analysis.add_capture("a", b"blurry")
+        ad_analysis.gemini.default_result = {"result": "unclear", "reason": "blurry"}
+
+        await ad_analysis.service().analyze_session_captures("s1")
+        ad_analysis.uow.ad_captures.pending.clear()
+        ad_analysis.add_capture("b", b"blurry")
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        assert ad_analysis.uow.ad_captures.verdict_cache == {}
+        assert len(ad_analysis.gemini.video_calls) == 2
+
+    async def test_key_includes_the_prompt_version(
+        self, ad_analysis, monkeypatch: pytest.MonkeyPatch,
+    ):
+        ad_analysis.add_capture("a", b"creative")
+        _cache(ad_analysis, b"creative", AnalysisStatus.COMPLETED, version="old-prompt")
+
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        assert [version for _, version in ad_analysis.uow.ad_captures.cache_lookups] == [
+            ANALYSIS_PROMPT_VERSION
+        ]
+        assert len(ad_analysis.gemini.video_calls) == 1
+        stored = {version for _, version in ad_analysis.uow.ad_captures.verdict_cache}
+        assert stored == {"old-prompt", ANALYSIS_PROMPT_VERSION}
+
+        # A prompt edit changes the version, so the stored verdict is missed.
+        monkeypatch.setattr(service_module, "ANALYSIS_PROMPT_VERSION", "new-prompt")
+        ad_analysis.uow.ad_captures.pending.clear()
+        ad_analysis.add_capture("b", b"creative")
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        assert len(ad_analysis.gemini.video_calls) == 2
+
+    async def test_not_relevant_hits_clean_up_unshared_directories(self, ad_analysis):
+        ad_analysis.add_capture("own", b"spam")
+        shared = ad_analysis.add_capture("shared", b"spam")
+        # The second capture's file is also referenced by another capture.
+        ad_analysis.uow.ad_captures.video_refcounts[shared.video_file] = 2
+        ad_analysis.add_capture("relevant", b"finance")
+        _cache(ad_analysis, b"spam", AnalysisStatus.NOT_RELEVANT)
+        _cache(ad_analysis, b"finance", AnalysisStatus.COMPLETED)
+
+        await ad_analysis.service().analyze_session_captures("s1")
+
+        assert ad_analysis.gemini.video_calls == []
+        assert ad_analysis.storage.removed_dirs == ["s1/own"]
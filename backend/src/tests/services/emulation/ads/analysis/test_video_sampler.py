@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("google.generativeai", reason="needs the emulation extra")
+
+from app.services.emulation.ads.analysis.sampler import (  # noqa: E402
+    AdAnalysisVideoSampler,
+    _copy_container,
+    _ProbeResult,
+)
+
+
+def _probe(video_codec: str | None, audio_codec: str | None) -> _ProbeResult:
+    return _ProbeResult(duration=60.0, video_codec=video_codec, audio_codec=audio_codec)
+
+
+class TestCopyContainer:
+    @pytest.mark.parametrize(
+        ("video_codec", "audio_codec", "container"),
+        [
+            ("vp8", "opus", "webm"),
+            ("vp9", None, "webm"),
+            ("av1", "opus", "webm"),
+            ("h264", "aac", "mp4"),
+            ("hevc", None, "mp4"),
+            ("av1", "aac", "mp4"),
+            ("h264", "opus", "mp4"),
+        ],
+    )
+    def test_copyable_codecs(self, video_codec, audio_codec, container):
+        assert _copy_container(_probe(video_codec, audio_codec)) == container
+
+    @pytest.mark.parametrize(
+        ("video_codec", "audio_codec"),
+        [
+            ("mpeg4", "mp3"),
+            ("vp8", "aac"),
+            ("h264", "pcm_s16le"),
+            ("unknown", None),
+            (None, "opus"),
+        ],
+    )
+    def test_other_codecs_are_re_encoded(self, video_codec, audio_codec):
+        assert _copy_container(_probe(video_codec, audio_codec)) is None
+
+
+class TestExtractDuration:
+    def test_takes_longest_positive_duration(self):
+        payload = {
+            "format": {"duration": "59.5"},
+            "streams": [
+                {"codec_type": "video", "duration": "60.04"},
+                {"codec_type": "audio", "duration": "59.98"},
+            ],
+        }
+
+        assert AdAnalysisVideoSampler._extract_duration(payload) == 60.04
+
+    def test_skips_missing_and_malformed_values(self):
+        payload = {
+            "format": {"duration": "N/A"},
+            "streams": [
+                "not a stream",
+                {"codec_type": "video"},
+                {"codec_type": "audio", "duration": None},
+                {"codec_type": "video", "duration": "12.5"},
+            ],
+        }
+
+        assert AdAnalysisVideoSampler._extract_duration(payload) == 12.5
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {},
+            {"format": {}, "streams": None},
+            {"format": {"duration": "0.000000"}, "streams": [{"duration": "-1"}]},
+        ],
+    )
+    def test_no_usable_duration(self, payload):
+        # MediaRecorder webm files have no duration header at all.
+        assert AdAnalysisVideoSampler._extract_duration(payload) is None
@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def registry():
+    pytest.importorskip("playwright", reason="needs the emulation extra")
+    # Imported lazily: the module pulls in app.database.engine, which must
+    # not be built before the test database URL is in place.
+    from app.services.emulation.browser.ads import registry
+
+    return registry
+
+
+class TestNormalizeVideoSrc:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "   ",
+            "blob:https://www.youtube.com/3f1c2a9e-8d7b-4c55-9a0e-1b2c3d4e5f60",
+            "data:video/mp4;base64,AAAAIGZ0eXBpc29t",
+            "/videoplayback?id=abc",
+        ],
+    )
+    def test_unidentifying_sources_normalize_to_empty(
+        self, registry, value: str | None,
+    ):
+        assert registry.normalize_video_src(value) == ""
+
+    def test_googlevideo_keeps_only_media_identity(self, registry):
+        first = registry.normalize_video_src(
+            "https://rr3---sn-abc.googlevideo.com/videoplayback"
+            "?expire=1700000000&ei=x1&id=o-AB12&itag=18&sig=AAA&mime=video%2Fmp4"
+        )
+        second = registry.normalize_video_src(
+            " HTTPS://rr5---sn-xyz.GoogleVideo.com/videoplayback"
+            "?itag=18&sig=BBB&id=o-AB12&expire=1700009999 "
+        )
+
+        assert first == "https://googlevideo.com/videoplayback?id=o-AB12&itag=18"
+        assert second == first
+
+    def test_googlevideo_other_itag_is_distinct(self, registry):
+        base = "https://rr1---sn-abc.googlevideo.com/videoplayback?id=o-AB12&itag="
+
+        normalize = registry.normalize_video_src
+
+        assert normalize(base + "18") != normalize(base + "22")
+
+    def test_other_hosts_drop_query_and_fragment(self, registry):
+        src = "https://cdn.example.com/ads/spot.mp4?token=1#t=3"
+
+        assert registry.normalize_video_src(src) == "https://cdn.example.com/ads/spot.mp4"
+
+    def test_registry_key_ignores_blob_src(self, registry):
+        key = registry.build_registry_key("creative", "blob:https://www.youtube.com/1")
+
+        assert key == "creative|"
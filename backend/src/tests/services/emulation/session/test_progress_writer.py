@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.emulation.session.progress_writer import ProgressWriter
+from app.services.emulation.session.state import SessionState
+from app.services.emulation.session.store import EmulationSessionStore
+
+_MIN_INTERVAL_S = 0.05
+
+
+def _watch(state: SessionState, title: str) -> None:
+    state.add_watched_video(
+        action="search",
+        title=title,
+        url=f"https://www.youtube.com/watch?v={title}",
+        watched_seconds=30.0,
+        target_seconds=60.0,
+        completed=False,
+    )
+
+
+@pytest.fixture
+def state() -> SessionState:
+    return SessionState(topics=["cooking"], duration_minutes=30, session_id="s1")
+
+
+@pytest_asyncio.fixture
+async def store(fake_redis: Redis) -> EmulationSessionStore:
+    store = EmulationSessionStore(fake_redis)
+    await store.create("s1", ["cooking"], 30)
+    return store
+
+
+@pytest.fixture
+def writes(store: EmulationSessionStore, monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Fields of every progress write that reached the store."""
+    recorded: list[dict] = []
+    sync_progress = store.sync_progress
+
+    async def record(session_id, state, fields):
+        await sync_progress(session_id, state, fields)
+        recorded.append(dict(fields))
+
+    monkeypatch.setattr(store, "sync_progress", record)
+    return recorded
+
+
+@pytest.fixture
+def writer(store: EmulationSessionStore, state: SessionState) -> ProgressWriter:
+    return ProgressWriter(
+        store,
+        state,
+        lambda: 0,
+        min_interval_s=_MIN_INTERVAL_S,
+        heartbeat_interval_s=60.0,
+    )
+
+
+@pytest.mark.asyncio
+class TestProgressWriter:
+    async def test_burst_within_interval_is_one_write(
+        self,
+        writer: ProgressWriter,
+        state: SessionState,
+        store: EmulationSessionStore,
+        writes: list[dict],
+    ):
+        await writer.sync()
+        for title in ("a", "b", "c"):
+            _watch(state, title)
+            await writer.sync()
+
+        assert len(writes) == 1
+        await asyncio.sleep(_MIN_INTERVAL_S * 3)
+
+        assert len(writes) == 2
+        assert writes[-1]["watched_videos_count"] == 3
+        assert await store.get_watched_videos("s1") == state.watched_videos
+
+    async def test_idle_requests_wait_for_the_heartbeat(
+        self, writer: ProgressWriter, writes: list[dict],
+    ):
+        await writer.sync()
+        await writer.sync()
+        await asyncio.sleep(_MIN_INTERVAL_S * 2)
+        await writer.sync()
+
+        assert len(writes) == 1
+
+    async def test_close_forces_the_pending_write(
+        self,
+        writer: ProgressWriter,
+        state: SessionState,
+        store: EmulationSessionStore,
+        writes: list[dict],
+    ):
+        await writer.sync()
+        _watch(state, "a")
+        await writer.sync()
+        assert len(writes) == 1
+
+        await writer.close()
+        await asyncio.sleep(_MIN_INTERVAL_S * 2)
+
+        # One forced write, and the cancelled deferred write never runs.
+        assert len(writes) == 2
+        assert await store.get_watched_videos("s1") == state.watched_videos
+
+    async def test_failed_write_keeps_state_dirty(
+        self,
+        writer: ProgressWriter,
+        state: SessionState,
+        store: EmulationSessionStore,
+        writes: list[dict],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        await writer.sync()
+        _watch(state, "a")
+
+        async def fail(*args, **kwargs):
+            raise RedisConnectionError("connection lost")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(store, "_apply_changes", fail)
+            await writer.sync()
+            await asyncio.sleep(_MIN_INTERVAL_S * 3)
+            assert len(writes) == 1
+            assert writer._is_dirty()
+
+            # The final write fails too; close() logs it instead of raising.
+            await writer.close()
+            assert writer._is_dirty()
+
+        await writer.flush()
+
+        assert len(writes) == 2
+        assert not writer._is_dirty()
+        assert await store.get_watched_videos("s1") == state.watched_videos
@@ -0,0 +1,42 @@
+import json
+
+from app.services.emulation.session import codec
+
+
+class TestSessionCodec:
+    def test_small_value_is_plain_json(self):
+        value = {"status": "running", "watched": [1, 2, 3]}
+
+        raw = codec.encode(value)
+
+        assert json.loads(raw) == value
+        assert codec.decode(raw) == value
+
+    def test_large_value_round_trips_through_zlib(self):
+        value = [{"video_id": f"v{i}", "title": "same title " * 8} for i in range(50)]
+
+        raw = codec.encode(value)
+
+        assert raw.startswith(codec._ZLIB_JSON)
+        assert len(raw) < len(json.dumps(value))
+        assert codec.decode(raw) == value
+
+    def test_compress_false_keeps_plain_json(self):
+        value = ["x" * codec.COMPRESS_MIN_BYTES]
+
+        raw = codec.encode(value, compress=False)
+
+        assert not raw.startswith(codec._ZLIB_JSON)
+        assert codec.decode(raw) == value
+
+    def test_value_below_threshold_stays_plain(self):
+        # Two bytes of JSON quotes plus the string land just under the threshold.
+        value = "x" * (codec.COMPRESS_MIN_BYTES - 3)
+
+        raw = codec.encode(value)
+
+        assert not raw.startswith(codec._ZLIB_JSON)
+        assert codec.decode(raw) == value
+
+    def test_decodes_legacy_json_strings(self):
+        assert codec.decode('{"status": "completed"}') == {"status": "completed"}
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from app.api.modules.emulation.models import SessionStatus
+from app.services.emulation.session.events import SessionEventHub
+from app.services.emulation.session.store import (
+    SESSION_EVENTS_CHANNEL,
+    EmulationSessionStore,
+)
+
+
+@pytest_asyncio.fixture
+async def store(fake_redis: Redis) -> EmulationSessionStore:
+    store = EmulationSessionStore(fake_redis)
+    await store.create("s1", ["cooking"], 30)
+    await store.create("s2", ["travel"], 30)
+    return store
+
+
+@pytest_asyncio.fixture
+async def hub(fake_redis: Redis, store: EmulationSessionStore):
+    hub = SessionEventHub(fake_redis, store)
+    yield hub
+    await hub.close()
+
+
+@pytest.fixture
+def reads(store: EmulationSessionStore, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Session ids of every payload read the hub made."""
+    recorded: list[str] = []
+    get_hash_fields = store.get_hash_fields
+
+    async def record(session_id):
+        recorded.append(session_id)
+        return await get_hash_fields(session_id)
+
+    monkeypatch.setattr(store, "get_hash_fields", record)
+    return recorded
+
+
+async def _wait_for_listener(fake_redis: Redis) -> None:
+    async with asyncio.timeout(1):
+        while not (await fake_redis.pubsub_numsub(SESSION_EVENTS_CHANNEL))[0][1]:
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+class TestSessionEventHub:
+    async def test_one_listener_fans_out_to_the_session_subscribers(
+        self,
+        hub: SessionEventHub,
+        store: EmulationSessionStore,
+        fake_redis: Redis,
+        reads: list[str],
+    ):
+        async with (
+            hub.subscribe("s1") as first,
+            hub.subscribe("s1") as second,
+            hub.subscribe("s2") as other,
+        ):
+            await _wait_for_listener(fake_redis)
+            assert (await fake_redis.pubsub_numsub(SESSION_EVENTS_CHANNEL))[0][1] == 1
+
+            await store.update("s1", status=SessionStatus.RUNNING)
+            payloads = await asyncio.gather(
+                first.next_payload(1.0), second.next_payload(1.0)
+            )
+
+            assert [payload["status"] for payload in payloads] == [SessionStatus.RUNNING] * 2
+            # Both viewers share one read of the new version.
+            assert reads == ["s1"]
+            assert not other._changed.is_set()
+
+    async def test_older_versions_do_not_wake_subscribers(
+        self, hub: SessionEventHub, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        async with hub.subscribe("s1") as subscription:
+            await _wait_for_listener(fake_redis)
+            await store.update("s1", status=SessionStatus.RUNNING)
+            await subscription.next_payload(1.0)
+            version = subscription.version
+
+            hub._dispatch(f'{{"session_id": "s1", "version": {version}}}')
+            hub._dispatch("not json")
+
+            assert not subscription._changed.is_set()
+
+    async def test_leaving_unsubscribes_and_drops_cached_reads(
+        self, hub: SessionEventHub, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        async with hub.subscribe("s1") as subscription:
+            await _wait_for_listener(fake_redis)
+            await store.update("s1", status=SessionStatus.RUNNING)
+            await subscription.next_payload(1.0)
+            assert "s1" in hub._payloads
+
+        assert hub._subscriptions == {}
+        assert hub._payloads == {}
+        assert hub._lists == {}
+
+        await store.update("s1", status=SessionStatus.COMPLETED)
+        await asyncio.sleep(0.05)
+        assert not subscription._changed.is_set()
+
+    async def test_timeout_falls_back_to_a_read(
+        self, hub: SessionEventHub, store: EmulationSessionStore, reads: list[str],
+    ):
+        async with hub.subscribe("s2") as subscription:
+            payload = await subscription.next_payload(0.05)
+
+        assert payload["status"] == SessionStatus.QUEUED
+        assert payload["watched_videos"] == []
+        assert reads == ["s2"]
+
+    async def test_close_stops_the_shared_listener(self, hub: SessionEventHub):
+        async with hub.subscribe("s1"):
+            listener = hub._listener
+        async with hub.subscribe("s2"):
+            assert hub._listener is listener
+
+        await hub.close()
+
+        assert listener.cancelled()
+        assert hub._listener is None
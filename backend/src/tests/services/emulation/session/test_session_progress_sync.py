@@ -0,0 +1,125 @@
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.emulation.session.state import SessionState
+from app.services.emulation.session.store import EmulationSessionStore
+
+
+def _watch(state: SessionState, title: str) -> None:
+    state.add_watched_video(
+        action="search",
+        title=title,
+        url=f"https://www.youtube.com/watch?v={title}",
+        watched_seconds=30.0,
+        target_seconds=60.0,
+        completed=False,
+    )
+
+
+@pytest.fixture
+def state() -> SessionState:
+    return SessionState(topics=["cooking"], duration_minutes=30, session_id="s1")
+
+
+@pytest_asyncio.fixture
+async def store(fake_redis: Redis) -> EmulationSessionStore:
+    store = EmulationSessionStore(fake_redis)
+    await store.create("s1", ["cooking"], 30)
+    return store
+
+
+async def _sync(store: EmulationSessionStore, state: SessionState) -> None:
+    fields = store.pending_progress_fields(state, bytes_downloaded=0)
+    await store.sync_progress("s1", state, fields)
+
+
+class TestPendingListChanges:
+    def test_take_hands_over_and_clears_indices(self, state: SessionState):
+        _watch(state, "a")
+        _watch(state, "b")
+        state.add_watched_ad({"advertiser_domain": "example.com"})
+
+        assert state.take_pending_list_changes() == ({0, 1}, {0})
+        assert not state.has_pending_list_changes()
+
+    def test_restore_keeps_changes_made_meanwhile(self, state: SessionState):
+        _watch(state, "a")
+        taken = state.take_pending_list_changes()
+        _watch(state, "b")
+
+        state.restore_pending_list_changes(*taken)
+
+        assert state.take_pending_list_changes() == ({0, 1}, set())
+
+    def test_changed_ad_is_marked_by_position(self, state: SessionState):
+        first = state.add_watched_ad({})
+        state.add_watched_ad({})
+        state.take_pending_list_changes()
+
+        state.mark_watched_ad_changed(first)
+
+        assert state.pending_ad_indices == {0}
+
+
+@pytest.mark.asyncio
+class TestSyncProgress:
+    async def test_sync_writes_pending_entries_once(
+        self, store: EmulationSessionStore, state: SessionState,
+    ):
+        _watch(state, "a")
+        state.add_watched_ad({"advertiser_domain": "example.com"})
+
+        await _sync(store, state)
+
+        assert await store.get_watched_videos("s1") == state.watched_videos
+        assert await store.get_watched_ads("s1") == state.watched_ads
+        assert not state.has_pending_list_changes()
+        assert store.pending_progress_fields(state, bytes_downloaded=0) == {}
+
+    async def test_in_place_mutation_is_dirty(
+        self, store: EmulationSessionStore, state: SessionState,
+    ):
+        state.current_watch = {"title": "a", "watched_seconds": 1.0}
+        await _sync(store, state)
+
+        state.current_watch["watched_seconds"] = 5.0
+
+        assert store.pending_progress_fields(state, bytes_downloaded=0) == {
+            "current_watch": {"title": "a", "watched_seconds": 5.0},
+        }
+
+    async def test_failed_write_is_retried_by_the_next_sync(
+        self,
+        store: EmulationSessionStore,
+        state: SessionState,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        _watch(state, "a")
+        await _sync(store, state)
+        _watch(state, "b")
+        state.add_watched_ad({"advertiser_domain": "example.com"})
+        fields = store.pending_progress_fields(state, bytes_downloaded=0)
+
+        async def fail(*args, **kwargs):
+            raise RedisConnectionError("connection lost")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(store, "_apply_changes", fail)
+            with pytest.raises(RedisConnectionError):
+                await store.sync_progress("s1", state, fields)
+
+        assert state.pending_video_indices == {1}
+        assert state.pending_ad_indices == {0}
+        assert store.pending_progress_fields(state, bytes_downloaded=0) == fields
+
+        _watch(state, "c")
+        await _sync(store, state)
+
+        assert await store.get_watched_videos("s1") == state.watched_videos
+        assert len(state.watched_videos) == 3
+        assert await store.get_watched_ads("s1") == state.watched_ads
+        payload = await store.get("s1")
+        assert payload["watched_videos_count"] == 3
+        assert payload["watched_ads_count"] == 1
@@ -0,0 +1,226 @@
+import json
+import time
+
+import pytest
+from redis.asyncio import Redis
+
+from app.services.emulation.session import store as store_module
+from app.services.emulation.session.store import (
+    ACTIVE_SESSIONS_KEY,
+    SESSION_EVENTS_CHANNEL,
+    EmulationSessionStore,
+)
+
+# Keys of the single JSON payload that create() wrote before the hash layout.
+_PAYLOAD_KEYS = {
+    "status",
+    "stop_requested",
+    "created_at",
+    "updated_at",
+    "started_at",
+    "finished_at",
+    "duration_minutes",
+    "topics",
+    "profile_id",
+    "current_topic",
+    "current_watch",
+    "topics_searched",
+    "videos_watched",
+    "watched_videos_count",
+    "watched_videos",
+    "watched_ads_count",
+    "watched_ads",
+    "watched_ads_analytics",
+    "total_duration_seconds",
+    "bytes_downloaded",
+    "post_processing_status",
+    "post_processing_done",
+    "post_processing_total",
+    "mode",
+    "fatigue",
+    "personality",
+    "orchestration",
+    "error",
+}
+
+
+def _video(video_id: str) -> dict:
+    return {"video_id": video_id, "watched_seconds": 30.0}
+
+
+def _ad(position: int, **capture: object) -> dict:
+    return {"position": position, "capture": capture}
+
+
+@pytest.fixture
+def store(fake_redis: Redis) -> EmulationSessionStore:
+    return EmulationSessionStore(fake_redis)
+
+
+@pytest.mark.asyncio
+class TestSessionStore:
+    async def test_get_keeps_the_payload_shape(self, store: EmulationSessionStore):
+        await store.create("s1", ["cooking"], 30, profile_id="p1")
+
+        payload = await store.get("s1")
+
+        assert set(payload) == _PAYLOAD_KEYS
+        assert payload["status"] == "queued"
+        assert payload["topics"] == ["cooking"]
+        assert payload["watched_ads_analytics"] == []
+        assert (await store.get_many(["s1"]))["s1"] == payload
+
+    async def test_missing_session(self, store: EmulationSessionStore):
+        await store.update("missing", status="running")
+
+        assert await store.get("missing") is None
+        assert await store.get_many(["missing"]) == {"missing": None}
+
+    async def test_field_update_leaves_lists_untouched(
+        self, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        await store.create("s1", ["cooking"], 30)
+        await store.update("s1", watched_videos=[_video("a"), _video("b")])
+        videos_key = store._videos_key("s1")
+        raw_videos = await fake_redis.lrange(videos_key, 0, -1)
+        _, lists_version = await store.get_hash_fields("s1")
+
+        await store.update("s1", status="running", videos_watched=2)
+
+        assert await fake_redis.lrange(videos_key, 0, -1) == raw_videos
+        assert (await store.get_hash_fields("s1"))[1] == lists_version
+        payload = await store.get("s1")
+        assert payload["status"] == "running"
+        assert payload["videos_watched"] == 2
+        assert payload["watched_videos"] == [_video("a"), _video("b")]
+
+    async def test_update_replaces_lists(self, store: EmulationSessionStore):
+        await store.create("s1", ["cooking"], 30)
+        await store.update("s1", watched_videos=[_video("a"), _video("b")])
+
+        await store.update("s1", watched_videos=[_video("c")])
+
+        assert await store.get_watched_videos("s1") == [_video("c")]
+
+    async def test_sync_appends_and_overwrites_by_index(
+        self, store: EmulationSessionStore,
+    ):
+        await store.create("s1", ["cooking"], 30)
+        await store.sync_watched_ads("s1", [_ad(1)], {0})
+
+        await store.sync_watched_ads(
+            "s1", [_ad(1, video_file="a.mp4"), _ad(2)], {0, 1},
+        )
+
+        assert await store.get_watched_ads("s1") == [_ad(1, video_file="a.mp4"), _ad(2)]
+
+    async def test_sync_gap_rewrites_the_whole_list(self, store: EmulationSessionStore):
+        await store.create("s1", ["cooking"], 30)
+        await store.sync_watched_ads("s1", [_ad(1)], {0})
+
+        # Entry 1 never reached Redis, so writing index 2 alone would leave a hole.
+        await store.sync_watched_ads("s1", [_ad(1), _ad(2), _ad(3)], {2})
+
+        assert await store.get_watched_ads("s1") == [_ad(1), _ad(2), _ad(3)]
+
+    async def test_cas_conflict_writes_nothing(self, store: EmulationSessionStore):
+        await store.create("s1", ["cooking"], 30)
+        await store.update("s1", watched_ads=[_ad(1)])
+
+        result = await store._apply_changes(
+            "s1",
+            {"status": "running"},
+            {"watched_ads": ("cas", {0: (b"stale", _ad(1, video_file="x.mp4"))})},
+        )
+
+        assert result == store_module._LISTS_OUT_OF_SYNC
+        payload = await store.get("s1")
+        assert payload["status"] == "queued"
+        assert payload["watched_ads"] == [_ad(1)]
+
+    async def test_patch_retries_on_top_of_a_concurrent_write(
+        self, store: EmulationSessionStore, monkeypatch: pytest.MonkeyPatch,
+    ):
+        await store.create("s1", ["cooking"], 30)
+        await store.update("s1", watched_ads=[_ad(1), _ad(2)])
+        read_entries = store._read_ad_entries
+        reads = 0
+
+        async def read_then_race(session_id, capture_updates):
+            nonlocal reads
+            entries = await read_entries(session_id, capture_updates)
+            reads += 1
+            if reads == 1:
+                # The emulator rewrites the entry between the read and the CAS.
+                await store.sync_watched_ads(
+                    "s1", [_ad(1), _ad(2, video_file="b.mp4")], {1},
+                    preserve_analysis=False,
+                )
+            return entries
+
+        monkeypatch.setattr(store, "_read_ad_entries", read_then_race)
+
+        patched = await store.patch_ad_captures("s1", {2: {"analysis_status": "relevant"}})
+
+        assert patched == 1
+        assert reads == 2
+        assert (await store.get_watched_ads("s1"))[1] == _ad(
+            2, video_file="b.mp4", analysis_status="relevant",
+        )
+
+    async def test_legacy_payload_is_read_and_migrated(
+        self, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        legacy = {
+            "status": "running",
+            "updated_at": time.time(),
+            "watched_videos": [_video("a")],
+            "watched_ads": [_ad(1)],
+            "watched_ads_analytics": [],
+        }
+        await fake_redis.set(store._key("old"), json.dumps(legacy))
+
+        assert await store.get("old") == legacy
+        assert (await store.get_many(["old", "missing"]))["old"] == legacy
+
+        await store.update("old", status="completed")
+
+        assert await fake_redis.type(store._key("old")) == b"hash"
+        payload = await store.get("old")
+        assert payload["status"] == "completed"
+        assert payload["watched_videos"] == [_video("a")]
+        assert payload["watched_ads"] == [_ad(1)]
+        assert "version" not in payload
+
+    async def test_active_index_follows_status(
+        self, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        await store.create("s1", ["cooking"], 30)
+        assert await fake_redis.zscore(ACTIVE_SESSIONS_KEY, "s1") is not None
+
+        await store.update("s1", status="running", updated_at=1234.0)
+        assert await fake_redis.zscore(ACTIVE_SESSIONS_KEY, "s1") == 1234.0
+
+        await store.update("s1", status="completed")
+        assert await fake_redis.zscore(ACTIVE_SESSIONS_KEY, "s1") is None
+
+    async def test_changes_publish_events_but_heartbeats_do_not(
+        self, store: EmulationSessionStore, fake_redis: Redis,
+    ):
+        await store.create("s1", ["cooking"], 30)
+        async with fake_redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(SESSION_EVENTS_CHANNEL)
+            await pubsub.get_message(timeout=0.1)
+
+            await store.update("s1")
+            await store.update("s1", status="running", videos_watched=1)
+
+            events = []
+            while (message := await pubsub.get_message(timeout=0.1)) is not None:
+                events.append(json.loads(message["data"]))
+
+        assert len(events) == 1
+        assert events[0]["session_id"] == "s1"
+        assert events[0]["status"] == "running"
+        assert events[0]["videos_watched"] == 1
+        assert events[0]["version"] == 2
@@ -0,0 +1,40 @@
+import pytest
+from redis.asyncio import Redis
+
+from app.api.modules.emulation.models import SessionStatus
+from app.services.emulation.session.store import EmulationSessionStore
+
+
+@pytest.fixture(scope="module")
+def run_module():
+    for module in ("playwright", "fake_useragent"):
+        pytest.importorskip(module, reason="needs the emulation extra")
+    # Imported lazily: the module pulls in app.database.engine, which must
+    # not be built before the test database URL is in place.
+    from app.services.emulation import run
+
+    return run
+
+
+@pytest.mark.asyncio
+class TestRunService:
+    async def test_queued_stop_clears_the_stop_key(self, run_module, fake_redis: Redis):
+        store = EmulationSessionStore(fake_redis)
+        await store.create("s1", ["cooking"], 30)
+        # What stop_session does for a queued session.
+        await store.update("s1", status=SessionStatus.STOPPED)
+        await store.request_stop("s1")
+        service = run_module.EmulationRunService(
+            session_provider=None,
+            session_store=store,
+            capture_factory=None,
+            config=None,
+            persistence=None,
+            orchestrator=None,
+        )
+
+        result = await service.run(session_id="s1", duration_minutes=30, topics=["cooking"])
+
+        assert result == {"status": "already_finished", "session_id": "s1"}
+        assert not await fake_redis.exists(store._stop_key("s1"))
+        assert not await store.is_run_lock_active("s1")
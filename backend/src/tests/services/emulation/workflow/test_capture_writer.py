@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+_FLUSH_INTERVAL_S = 0.05
+
+
+class _FakeDatabase:
+    """Capture rows keyed by ad position, visible to readers only once committed."""
+
+    def __init__(self) -> None:
+        self.committed: dict[int, dict] = {}
+        self.commits: list[list[int]] = []
+        self.rollbacks = 0
+        self.failing_commits = 0
+        self.sessions: list[_FakeSession] = []
+
+
+class _FakeSession:
+    def __init__(self, database: _FakeDatabase) -> None:
+        self.database = database
+        self.staged: dict[int, dict] = {}
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeCaptureGateway:
+    def __init__(self, session: _FakeSession) -> None:
+        self.session = session
+
+    async def insert_missing(self, rows: list[dict]) -> dict[int, int]:
+        # ON CONFLICT (session_id, ad_position) DO NOTHING
+        inserted = {}
+        for row in rows:
+            position = row["ad_position"]
+            if position in self.session.database.committed or position in self.session.staged:
+                continue
+            self.session.staged[position] = row
+            inserted[position] = position
+        return inserted
+
+    async def add_screenshots(self, rows: list[dict]) -> None:
+        pass
+
+
+class _FakeCreativeGateway:
+    async def record_sightings(self, session_id: str, sightings: list[dict]) -> None:
+        pass
+
+
+class _FakeUnitOfWork:
+    def __init__(self, session: _FakeSession) -> None:
+        self.session = session
+        self.ad_captures = _FakeCaptureGateway(session)
+        self.ad_creatives = _FakeCreativeGateway()
+
+    async def commit(self) -> None:
+        database = self.session.database
+        if database.failing_commits:
+            database.failing_commits -= 1
+            raise ConnectionError("connection lost")
+        database.committed.update(self.session.staged)
+        database.commits.append(sorted(self.session.staged))
+        self.session.staged.clear()
+
+    async def rollback(self) -> None:
+        self.session.database.rollbacks += 1
+        self.session.staged.clear()
+
+
+def _ads(count: int) -> list[dict]:
+    return [
+        {"position": position, "capture_id": f"c{position}", "capture": {}}
+        for position in range(1, count + 1)
+    ]
+
+
+@pytest.fixture(scope="module")
+def capture_writer_module():
+    for module in ("playwright", "fake_useragent", "google.generativeai"):
+        pytest.importorskip(module, reason="needs the emulation extra")
+    # Imported lazily: the module pulls in app.database.engine, which must
+    # not be built before the test database URL is in place.
+    from app.services.emulation.workflow import capture_writer
+
+    return capture_writer
+
+
+@pytest.fixture
+def database(capture_writer_module, monkeypatch: pytest.MonkeyPatch) -> _FakeDatabase:
+    database = _FakeDatabase()
+
+    def session_factory() -> _FakeSession:
+        session = _FakeSession(database)
+        database.sessions.append(session)
+        return session
+
+    monkeypatch.setattr(capture_writer_module, "SessionFactory", session_factory)
+    monkeypatch.setattr(capture_writer_module, "UnitOfWork", _FakeUnitOfWork)
+    return database
+
+
+@pytest.fixture
+def persisted() -> list[tuple[int, int]]:
+    return []
+
+
+@pytest.fixture
+def writer(capture_writer_module, database: _FakeDatabase, persisted: list):
+    async def on_persisted(watched_ads: list[dict], previous: int, count: int) -> None:
+        persisted.append((previous, count))
+
+    return capture_writer_module.CaptureWriter(
+        "s1",
+        0,
+        on_persisted,
+        flush_interval_s=_FLUSH_INTERVAL_S,
+        max_batch=3,
+    )
+
+
+@pytest.mark.asyncio
+class TestCaptureWriter:
+    async def test_submits_within_interval_are_one_commit(
+        self, writer, database: _FakeDatabase, persisted: list,
+    ):
+        ads = _ads(2)
+        await writer.submit(ads[:1])
+        await writer.submit(ads)
+
+        assert database.commits == []
+        await asyncio.sleep(_FLUSH_INTERVAL_S * 3)
+
+        assert database.commits == [[1, 2]]
+        assert writer.persisted_count == 2
+        assert persisted == [(0, 2)]
+
+    async def test_full_batch_is_written_inline(
+        self, writer, database: _FakeDatabase, persisted: list,
+    ):
+        ads = _ads(4)
+        await writer.submit(ads[:1])
+        await writer.submit(ads[:3])
+
+        assert database.commits == [[1, 2, 3]]
+        assert writer.persisted_count == 3
+
+        await writer.submit(ads)
+        await writer.close()
+        await asyncio.sleep(_FLUSH_INTERVAL_S * 2)
+
+        # close() cancels the deferred flush and writes the rest itself.
+        assert database.commits == [[1, 2, 3], [4]]
+        assert persisted == [(0, 3), (3, 4)]
+        assert all(session.closed for session in database.sessions)
+
+    async def test_failed_flush_is_retried_without_duplicates(
+        self, writer, database: _FakeDatabase, persisted: list,
+    ):
+        ads = _ads(5)
+        await writer.submit(ads[:1])
+        await writer.flush()
+        database.failing_commits = 1
+
+        await writer.submit(ads[:3])
+        await writer.flush()
+
+        assert database.rollbacks == 1
+        assert writer.persisted_count == 1
+        assert persisted == [(0, 1)]
+        assert set(database.committed) == {1}
+
+        await writer.submit(ads)
+        await writer.close()
+
+        assert database.commits == [[1], [2, 3, 4, 5]]
+        assert writer.persisted_count == 5
+        assert persisted == [(0, 1), (1, 5)]
+
+    async def test_close_flushes_what_is_pending(
+        self, writer, database: _FakeDatabase, persisted: list,
+    ):
+        await writer.submit(_ads(2))
+
+        await writer.close()
+
+        assert database.commits == [[1, 2]]
+        assert persisted == [(0, 2)]